@@ -0,0 +1,91 @@
+"""Move test payloads to blob storage
+
+Revision ID: f2a5b63fa2f7
+Revises: 1bc650b52817
+Create Date: 2026-10-18 15:20:00.982956
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from core.blob_storage import blob_storage
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a5b63fa2f7"
+down_revision: Union[str, None] = "1bc650b52817"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+tests = sa.table(
+    "tests",
+    sa.column("id", sa.Integer),
+    sa.column("input_data", sa.String),
+    sa.column("correct_output", sa.String),
+    sa.column("input_hash", sa.String),
+    sa.column("input_size", sa.Integer),
+    sa.column("output_hash", sa.String),
+    sa.column("output_size", sa.Integer),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tests", sa.Column("input_hash", sa.String(length=64), nullable=True))
+    op.add_column("tests", sa.Column("input_size", sa.Integer(), nullable=True))
+    op.add_column(
+        "tests", sa.Column("output_hash", sa.String(length=64), nullable=True)
+    )
+    op.add_column("tests", sa.Column("output_size", sa.Integer(), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(tests.c.id, tests.c.input_data, tests.c.correct_output)
+    ).all()
+    for test_id, input_data, correct_output in rows:
+        input_blob = blob_storage.put((input_data or "").encode())
+        output_blob = blob_storage.put(correct_output.encode())
+        connection.execute(
+            tests.update()
+            .where(tests.c.id == test_id)
+            .values(
+                input_hash=input_blob.digest,
+                input_size=input_blob.size,
+                output_hash=output_blob.digest,
+                output_size=output_blob.size,
+            )
+        )
+
+    for column in ("input_hash", "input_size", "output_hash", "output_size"):
+        op.alter_column("tests", column, nullable=False)
+    op.drop_column("tests", "input_data")
+    op.drop_column("tests", "correct_output")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("tests", sa.Column("correct_output", sa.String(), nullable=True))
+    op.add_column("tests", sa.Column("input_data", sa.String(), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(tests.c.id, tests.c.input_hash, tests.c.output_hash)
+    ).all()
+    for test_id, input_hash, output_hash in rows:
+        connection.execute(
+            tests.update()
+            .where(tests.c.id == test_id)
+            .values(
+                input_data=blob_storage.read(input_hash).decode(),
+                correct_output=blob_storage.read(output_hash).decode(),
+            )
+        )
+
+    op.alter_column("tests", "correct_output", nullable=False)
+    op.drop_column("tests", "output_size")
+    op.drop_column("tests", "output_hash")
+    op.drop_column("tests", "input_size")
+    op.drop_column("tests", "input_hash")
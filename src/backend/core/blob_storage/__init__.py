@@ -0,0 +1,41 @@
+__all__ = (
+    "BlobNotFoundError",
+    "BlobRef",
+    "BlobStorage",
+    "blob_cache",
+    "blob_storage",
+    "get_blob_digest",
+)
+
+from pathlib import Path
+
+from docker.utils import parse_bytes
+
+from core.config import settings
+from .base import BlobNotFoundError, BlobRef, BlobStorage, get_blob_digest
+from .cache import BlobCache
+from .local import LocalBlobStorage
+
+
+def create_blob_storage() -> BlobStorage:
+    config = settings.blob_storage
+    if config.backend == "s3":
+        from .s3 import S3BlobStorage
+
+        return S3BlobStorage(
+            bucket=config.s3_bucket,
+            prefix=config.s3_prefix,
+            endpoint_url=config.s3_endpoint_url,
+            region=config.s3_region,
+            access_key=config.s3_access_key,
+            secret_key=config.s3_secret_key,
+        )
+    return LocalBlobStorage(Path(config.local_path))
+
+
+blob_storage = create_blob_storage()
+blob_cache = BlobCache(
+    blob_storage,
+    Path(settings.judge.blob_cache_dir),
+    parse_bytes(settings.judge.blob_cache_size),
+)
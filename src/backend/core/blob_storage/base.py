@@ -0,0 +1,61 @@
+import hashlib
+import tempfile
+from abc import ABC, abstractmethod
+from typing import BinaryIO, NamedTuple
+
+CHUNK_SIZE = 1024 * 1024
+SPOOL_SIZE = 8 * 1024 * 1024
+
+
+class BlobNotFoundError(Exception):
+    def __init__(self, digest: str):
+        super().__init__(f"Blob {digest} not found")
+        self.digest = digest
+
+
+class BlobRef(NamedTuple):
+    digest: str
+    size: int
+
+
+def get_blob_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobStorage(ABC):
+    @abstractmethod
+    def exists(self, digest: str) -> bool: ...
+
+    @abstractmethod
+    def open(self, digest: str) -> BinaryIO: ...
+
+    @abstractmethod
+    def upload(self, digest: str, source: BinaryIO, size: int) -> None: ...
+
+    def read(self, digest: str, size: int | None = None) -> bytes:
+        with self.open(digest) as blob:
+            return blob.read(size)
+
+    def put(self, data: bytes) -> BlobRef:
+        blob = BlobRef(get_blob_digest(data), len(data))
+        if not self.exists(blob.digest):
+            with tempfile.SpooledTemporaryFile(SPOOL_SIZE) as source:
+                source.write(data)
+                source.seek(0)
+                self.upload(blob.digest, source, blob.size)
+        return blob
+
+    def put_stream(self, stream: BinaryIO) -> BlobRef:
+        digest = hashlib.sha256()
+        size = 0
+        with tempfile.SpooledTemporaryFile(SPOOL_SIZE) as source:
+            while chunk := stream.read(CHUNK_SIZE):
+                digest.update(chunk)
+                source.write(chunk)
+                size += len(chunk)
+
+            blob = BlobRef(digest.hexdigest(), size)
+            if not self.exists(blob.digest):
+                source.seek(0)
+                self.upload(blob.digest, source, blob.size)
+        return blob
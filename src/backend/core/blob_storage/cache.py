@@ -0,0 +1,67 @@
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from core.blob_storage.base import BlobStorage
+
+
+class BlobCache:
+    def __init__(self, storage: BlobStorage, path: Path, max_size: int):
+        self.storage = storage
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def get_path(self, digest: str) -> Path:
+        cached = self.path / digest
+        if cached.is_file():
+            cached.touch()
+            return cached
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        partial = self.path / f".{digest}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            with self.storage.open(digest) as source, partial.open("wb") as target:
+                shutil.copyfileobj(source, target)
+            if _get_file_digest(partial) != digest:
+                raise ValueError(f"Blob {digest} is corrupted")
+            os.replace(partial, cached)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        with self._lock:
+            self._evict()
+        return cached
+
+    def read(self, digest: str, size: int = -1) -> bytes:
+        with self.get_path(digest).open("rb") as blob:
+            return blob.read(size)
+
+    def _evict(self) -> None:
+        blobs = sorted(
+            (
+                entry
+                for entry in os.scandir(self.path)
+                if entry.is_file() and not entry.name.startswith(".")
+            ),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True,
+        )
+        total = 0
+        for index, entry in enumerate(blobs):
+            total += entry.stat().st_size
+            if total > self.max_size and index:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def _get_file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as blob:
+        while chunk := blob.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,32 @@
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from core.blob_storage.base import BlobNotFoundError, BlobStorage
+
+
+class LocalBlobStorage(BlobStorage):
+    def __init__(self, path: Path):
+        self.path = path
+
+    def get_path(self, digest: str) -> Path:
+        return self.path / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self.get_path(digest).is_file()
+
+    def open(self, digest: str) -> BinaryIO:
+        try:
+            return self.get_path(digest).open("rb")
+        except FileNotFoundError:
+            raise BlobNotFoundError(digest)
+
+    def upload(self, digest: str, source: BinaryIO, size: int) -> None:
+        path = self.get_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}")
+        with partial.open("wb") as target:
+            shutil.copyfileobj(source, target)
+        os.replace(partial, path)
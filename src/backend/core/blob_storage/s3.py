@@ -0,0 +1,58 @@
+from typing import BinaryIO
+
+from core.blob_storage.base import BlobNotFoundError, BlobStorage
+
+
+class S3BlobStorage(BlobStorage):
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+    ):
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError:
+            raise RuntimeError("S3 blob storage requires the boto3 package")
+
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client_error = ClientError
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+        )
+
+    def get_key(self, digest: str) -> str:
+        key = f"{digest[:2]}/{digest}"
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def exists(self, digest: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.get_key(digest))
+        except self.client_error as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return False
+            raise
+        return True
+
+    def open(self, digest: str) -> BinaryIO:
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=self.get_key(digest)
+            )
+        except self.client_error as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                raise BlobNotFoundError(digest)
+            raise
+        return response["Body"]
+
+    def upload(self, digest: str, source: BinaryIO, size: int) -> None:
+        self.client.upload_fileobj(source, self.bucket, self.get_key(digest))
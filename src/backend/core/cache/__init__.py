@@ -0,0 +1,44 @@
+__all__ = (
+    "CacheEntry",
+    "CachePolicy",
+    "ENTITY_PARAMS",
+    "SECTION_ENTITIES",
+    "cache_policy",
+    "collect_response_tags",
+    "flush_cache_sync",
+    "get_cache_policy",
+    "get_collection_tag",
+    "get_entry_key",
+    "get_path_tags",
+    "get_version_key",
+    "invalidate_tags",
+    "invalidate_tags_sync",
+    "listen_for_invalidations",
+    "local_cache",
+    "module_tag",
+    "solution_tag",
+    "space_tag",
+    "tag_response",
+    "task_tag",
+)
+
+from .local import CacheEntry, local_cache
+from .policy import CachePolicy, cache_policy, get_cache_policy
+from .tags import (
+    ENTITY_PARAMS,
+    SECTION_ENTITIES,
+    collect_response_tags,
+    flush_cache_sync,
+    get_collection_tag,
+    get_entry_key,
+    get_path_tags,
+    get_version_key,
+    invalidate_tags,
+    invalidate_tags_sync,
+    listen_for_invalidations,
+    module_tag,
+    solution_tag,
+    space_tag,
+    tag_response,
+    task_tag,
+)
@@ -0,0 +1,21 @@
+import argparse
+
+from core.cache import flush_cache_sync
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m core.cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "flush",
+        help="Drop every cached response and clear the workers' local caches",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "flush":
+        print(f"Deleted {flush_cache_sync()} cached responses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from core.config import settings
+
+
+class CacheEntry(NamedTuple):
+    body: str
+    etag: str
+    tags: list[str]
+
+
+class LocalCache:
+    def __init__(self, max_entries: int, max_bytes: int, ttl: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.enabled = False
+        self.generation = 0
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[CacheEntry, float]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+
+    def get(self, key: str) -> CacheEntry | None:
+        if not self.enabled or key not in self._entries:
+            return None
+        entry, expires_at = self._entries[key]
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry, ttl: int, generation: int) -> None:
+        # An invalidation that arrived while the entry was being fetched may
+        # already cover it, so entries from an older generation are dropped.
+        if not self.enabled or generation != self.generation:
+            return
+        if len(entry.body) > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (entry, time.monotonic() + min(ttl, self.ttl))
+        self.size += len(entry.body)
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: list[str]) -> None:
+        self.generation += 1
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, set()):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self.size = 0
+
+    def _remove(self, key: str) -> None:
+        if key not in self._entries:
+            return
+        entry, _ = self._entries.pop(key)
+        self.size -= len(entry.body)
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+local_cache = LocalCache(
+    max_entries=settings.cache.local_max_entries,
+    max_bytes=settings.cache.local_max_bytes,
+    ttl=settings.cache.local_ttl,
+)
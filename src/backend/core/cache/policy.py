@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from shared.enums import CacheScopeEnum
+
+POLICY_ATTRIBUTE = "__cache_policy__"
+
+Endpoint = TypeVar("Endpoint", bound=Callable)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: int = 600
+    scope: CacheScopeEnum = CacheScopeEnum.USER
+    vary: tuple[str, ...] = ()
+    space_param: str = "space_id"
+
+    @property
+    def is_cacheable(self) -> bool:
+        return self.ttl > 0
+
+
+def cache_policy(
+    ttl: int = 600,
+    scope: CacheScopeEnum = CacheScopeEnum.USER,
+    vary: tuple[str, ...] = (),
+    space_param: str = "space_id",
+) -> Callable[[Endpoint], Endpoint]:
+    policy = CachePolicy(
+        ttl=ttl,
+        scope=scope,
+        vary=tuple(header.lower() for header in vary),
+        space_param=space_param,
+    )
+
+    def decorator(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, POLICY_ATTRIBUTE, policy)
+        return endpoint
+
+    return decorator
+
+
+def get_cache_policy(endpoint: Callable | None, default: CachePolicy) -> CachePolicy:
+    return getattr(endpoint, POLICY_ATTRIBUTE, default)
@@ -0,0 +1,146 @@
+import asyncio
+import json
+from contextvars import ContextVar
+from logging import getLogger
+
+from core.redis import redis_connection, sync_redis_client
+from .local import local_cache
+
+logger = getLogger("redis")
+
+ENTRY_KEY_PREFIX = "cache:entry"
+VERSION_KEY_PREFIX = "cache:version"
+INVALIDATION_CHANNEL = "cache:invalidations"
+INVALIDATION_RETRY_DELAY = 1.0
+FLUSH_BATCH_SIZE = 500
+
+ENTITY_PARAMS = {
+    "space_id": "space",
+    "group_id": "space",
+    "module_id": "module",
+    "task_id": "task",
+    "solution_id": "solution",
+}
+SECTION_ENTITIES = {
+    "spaces": "space",
+    "groups": "space",
+    "modules": "module",
+    "tasks": "task",
+}
+
+response_tags: ContextVar[set[str] | None] = ContextVar(
+    "cache_response_tags", default=None
+)
+
+
+def get_entry_key(digest: str) -> str:
+    return f"{ENTRY_KEY_PREFIX}:{digest}"
+
+
+def get_version_key(tag: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{tag}"
+
+
+def get_collection_tag(section: str) -> str:
+    return f"collection:{section}"
+
+
+def space_tag(space_id: int) -> str:
+    return f"space:{space_id}"
+
+
+def module_tag(module_id: int) -> str:
+    return f"module:{module_id}"
+
+
+def task_tag(task_id: int) -> str:
+    return f"task:{task_id}"
+
+
+def solution_tag(solution_id: int) -> str:
+    return f"solution:{solution_id}"
+
+
+def get_path_tags(path_params: dict) -> list[str]:
+    return [
+        f"{ENTITY_PARAMS[name]}:{value}"
+        for name, value in path_params.items()
+        if name in ENTITY_PARAMS
+    ]
+
+
+def collect_response_tags() -> set[str]:
+    tags = set()
+    response_tags.set(tags)
+    return tags
+
+
+def tag_response(*tags: str) -> None:
+    collected = response_tags.get()
+    if collected is not None:
+        collected.update(tags)
+
+
+# A published ``null`` comes from ``flush_cache_sync`` and drops everything.
+def drop_local_entries(tags: list[str] | None) -> None:
+    if tags is None:
+        local_cache.clear()
+    else:
+        local_cache.invalidate(tags)
+
+
+async def invalidate_tags(*tags: str) -> None:
+    drop_local_entries(list(tags))
+    try:
+        async with redis_connection.redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(get_version_key(tag))
+            pipe.publish(INVALIDATION_CHANNEL, json.dumps(tags))
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Redis error while invalidating {tags}: {e}")
+
+
+def invalidate_tags_sync(*tags: str) -> None:
+    try:
+        with sync_redis_client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(get_version_key(tag))
+            pipe.publish(INVALIDATION_CHANNEL, json.dumps(tags))
+            pipe.execute()
+    except Exception as e:
+        logger.error(f"Redis error while invalidating {tags}: {e}")
+
+
+def flush_cache_sync() -> int:
+    deleted = 0
+    with sync_redis_client.pipeline(transaction=False) as pipe:
+        for key in sync_redis_client.scan_iter(
+            f"{ENTRY_KEY_PREFIX}:*", count=FLUSH_BATCH_SIZE
+        ):
+            pipe.delete(key)
+            deleted += 1
+            if len(pipe) >= FLUSH_BATCH_SIZE:
+                pipe.execute()
+        pipe.publish(INVALIDATION_CHANNEL, json.dumps(None))
+        pipe.execute()
+    return deleted
+
+
+# The local cache is only trusted while this worker is subscribed; anything
+# published while the subscription was down is covered by clearing it.
+async def listen_for_invalidations() -> None:
+    while True:
+        pubsub = redis_connection.redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            local_cache.clear()
+            local_cache.enabled = True
+            async for message in pubsub.listen():
+                drop_local_entries(json.loads(message["data"]))
+        except Exception as e:
+            logger.error(f"Redis error while listening for invalidations: {e}")
+        finally:
+            local_cache.enabled = False
+            await pubsub.aclose()
+        await asyncio.sleep(INVALIDATION_RETRY_DELAY)
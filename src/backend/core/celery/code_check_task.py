@@ -1,141 +1,553 @@
-import os
+import asyncio
+import time
+from contextlib import closing
+from dataclasses import dataclass, replace
+from functools import partial
+from itertools import chain
+from logging import getLogger
+from typing import Callable, Iterable
 
-import docker
-from requests.exceptions import ReadTimeout, ConnectionError, ConnectTimeout
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
+from docker.errors import DockerException
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
-from core.config import settings, BASE_DIR
+from core.blob_storage import blob_cache
+from core.cache import (
+    invalidate_tags_sync,
+    module_tag,
+    solution_tag,
+    space_tag,
+    task_tag,
+)
+from core.config import settings
+from core.judge import container_pool, runtime_registry, sandbox_pool, verdict_cache
+from core.judge.async_pool import async_container_pool
+from core.judge.checker_program import CheckerFailure, run_checker
+from core.judge.checkers import OutputChecker, get_checker_factory
+from core.judge.compiler import (
+    CompilationError,
+    get_or_compile,
+    get_or_compile_async,
+)
+from core.judge.docker_api import DockerAPIError
+from core.judge.events import SolutionEventPublisher
+from core.judge.executor import (
+    get_parallelism,
+    run_until_first_failure,
+    run_until_first_failure_async,
+)
+from core.judge.harness import (
+    HarnessProtocolError,
+    HarnessRecord,
+    HarnessRecordParser,
+    build_harness_command,
+    build_test_archive,
+    get_harness_timeout,
+    run_tests_in_batch,
+)
+from core.judge.rejudge import RejudgeProgress
+from core.judge.runtimes import CHECKER_RUNTIME, Runtime
+from core.judge.scheduler import judge_scheduler
+from core.judge.verdict import Verdict
+from core.judge.verdict_cache import get_verdict_key
 from features import CodeTask, Test
 from features.solutions.exceptions.existence import SolutionNotFoundException
 from features.solutions.models import CodeSolution
 from features.tasks.exceptions import TaskNotFoundException
-from shared.enums import SolutionStatusEnum
+from shared.enums import CheckerModeEnum, ExecutionBackendEnum, SolutionStatusEnum
+from utils.code_check import get_runtime_or_404
 from .app import app
+from .event_loop import worker_loop
+
+logger = getLogger("judge")
+worker_loop.on_stop(async_container_pool.close)
+
+JUDGE_FAILURE_MESSAGE = "Judge harness terminated unexpectedly"
+CHECKER_FAILURE_MESSAGE = "Checker failed"
+FINALIZE_REJUDGE_TASK = "core.celery.rejudge_task.finalize_rejudge"
+
+EXECUTION_POOLS = {
+    ExecutionBackendEnum.DOCKER: container_pool,
+    ExecutionBackendEnum.SANDBOX: sandbox_pool,
+}
 
 sync_engine = create_engine(str(settings.db.sync_url))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 
 
-def run_code_in_container(
-    code: str,
-    input_data: str,
-    mem_limit: str,
-    time_limit: float,
-):
-    client = docker.from_env()
+@dataclass(frozen=True)
+class Submission:
+    runtime: Runtime
+    code: str
+    mem_limit: str
+    time_limit: float
+    events: SolutionEventPublisher
+    artifact: bytes | None = None
+    checker_mode: CheckerModeEnum = CheckerModeEnum.EXACT
+    checker_tolerance: float = 0.0
+    checker: bytes | None = None
+    backend: ExecutionBackendEnum = ExecutionBackendEnum.DOCKER
+
+    def get_checker_factory(self, tests: list[Test]) -> Callable[[int], OutputChecker]:
+        return get_checker_factory(tests, self.checker_mode, self.checker_tolerance)
+
+
+def run_tests_in_container(submission: Submission, tests: list[Test]):
+    pool = EXECUTION_POOLS[submission.backend]
+    with pool.acquire(submission.runtime, submission.mem_limit) as pooled:
+        yield from run_tests_in_batch(
+            pool,
+            pooled,
+            submission.runtime.command(submission.code),
+            tests,
+            submission.time_limit,
+            submission.artifact,
+            submission.get_checker_factory(tests),
+        )
+
+
+def get_worker_runtimes() -> list[Runtime]:
+    languages = settings.judge.worker_languages or runtime_registry.runtimes
+    return [runtime_registry.get(language) for language in languages]
+
+
+@worker_init.connect
+def prepare_runtime_images(**_):
+    languages = [runtime.language for runtime in get_worker_runtimes()]
+    try:
+        for language, digest in runtime_registry.prepare(languages).items():
+            logger.info(f"Runtime {language} pinned to {digest}")
+    except DockerException as e:
+        logger.error(f"Failed to prepare runtime images: {e}")
+
+
+@worker_process_init.connect
+def warm_up_container_pool(**_):
+    for runtime in get_worker_runtimes():
+        try:
+            if settings.judge.driver == "async":
+                worker_loop.run(async_container_pool.warm_up(runtime))
+            else:
+                container_pool.warm_up(runtime)
+        except (DockerException, DockerAPIError, OSError) as e:
+            logger.error(f"Failed to warm up {runtime.language} containers: {e}")
+
+
+@worker_process_shutdown.connect
+def close_container_pool(**_):
+    container_pool.close()
+
 
-    container = None
-    timed_out = False
+def judge_test(submission: Submission, test: Test) -> Verdict:
+    verdicts = judge_tests_in_batch(submission, [test])
+    return verdicts[0]
 
+
+def judge_tests_in_batch(submission: Submission, tests: list[Test]) -> list[Verdict]:
+    verdicts = []
     try:
-        image, build_logs = client.images.build(
-            path=os.path.join(BASE_DIR, "core/celery/runtimes/python"),
-            dockerfile="Dockerfile",
-            tag="runner-python:3.9",
-            rm=True,
+        with closing(run_tests_in_container(submission, tests)) as records:
+            for test, record in zip(tests, records):
+                verdicts.append(analyze_result(record, test, submission.checker))
+                submission.events.test_judged(test.id, verdicts[-1])
+                if verdicts[-1].is_failed:
+                    break
+    except (OSError, HarnessProtocolError) as e:
+        logger.warning(f"Judge stream failed: {e}")
+    return complete_verdicts(verdicts, tests)
+
+
+async def judge_test_async(submission: Submission, test: Test) -> Verdict:
+    verdicts = await judge_tests_in_batch_async(submission, [test])
+    return verdicts[0]
+
+
+async def judge_tests_in_batch_async(
+    submission: Submission,
+    tests: list[Test],
+) -> list[Verdict]:
+    verdicts = []
+    parser = HarnessRecordParser(submission.get_checker_factory(tests))
+    archive = await asyncio.to_thread(build_test_archive, tests, submission.artifact)
+    async with async_container_pool.acquire(
+        submission.runtime, submission.mem_limit
+    ) as pooled:
+        try:
+            async with asyncio.timeout(
+                get_harness_timeout(tests, submission.time_limit)
+            ):
+                async with async_container_pool.exec_stream(
+                    pooled,
+                    build_harness_command(
+                        submission.runtime.command(submission.code),
+                        submission.time_limit,
+                    ),
+                    archive,
+                ) as execution:
+                    async for stream_id, data in execution.frames:
+                        for record in parser.feed(stream_id, data):
+                            test = tests[len(verdicts)]
+                            verdicts.append(
+                                await asyncio.to_thread(
+                                    analyze_result, record, test, submission.checker
+                                )
+                            )
+                            await asyncio.to_thread(
+                                submission.events.test_judged, test.id, verdicts[-1]
+                            )
+                            if verdicts[-1].is_failed:
+                                return verdicts
+        except TimeoutError:
+            pass
+        except HarnessProtocolError as e:
+            logger.warning(f"Judge stream failed: {e}")
+
+    return complete_verdicts(verdicts, tests)
+
+
+def complete_verdicts(verdicts: list[Verdict], tests: list[Test]) -> list[Verdict]:
+    if len(verdicts) < len(tests) and not (verdicts and verdicts[-1].is_failed):
+        verdicts.append(
+            Verdict(
+                SolutionStatusEnum.RUNTIME_ERROR,
+                {"status": "error", "error": JUDGE_FAILURE_MESSAGE, "output": ""},
+            )
         )
-        container = client.containers.run(
-            image=image,
-            command=["python", "-c", code],
-            stdin_open=bool(input_data),
-            stdout=True,
-            stderr=True,
-            tty=False,
-            detach=True,
-            network_mode="none",
-            mem_limit=mem_limit,
-            memswap_limit=mem_limit,
-            oom_kill_disable=False,
-            read_only=True,
-            privileged=False,
-            nano_cpus=1_000_000_000,
-            user="nobody",
-            security_opt=["no-new-privileges:true"],
-            cap_drop=["ALL"],
+    return verdicts
+
+
+def split_into_chunks(tests: list[Test], count: int) -> list[list[Test]]:
+    size = max(1, -(-len(tests) // count))
+    return [tests[start : start + size] for start in range(0, len(tests), size)]
+
+
+def get_compilation_verdict(error: CompilationError) -> Verdict:
+    return Verdict(
+        SolutionStatusEnum.COMPILATION_ERROR,
+        {"status": "error", "error": error.output},
+    )
+
+
+def get_checker_failure_verdict(message: str) -> Verdict:
+    return Verdict(
+        SolutionStatusEnum.RUNTIME_ERROR,
+        {"status": "error", "error": CHECKER_FAILURE_MESSAGE, "output": message},
+    )
+
+
+def judge_solution(
+    submission: Submission,
+    task: CodeTask,
+    tests: list[Test],
+) -> Verdict:
+    if submission.runtime.is_compiled:
+        try:
+            artifact = get_or_compile(
+                container_pool, submission.runtime, submission.code
+            )
+        except CompilationError as e:
+            return get_compilation_verdict(e)
+        submission = replace(submission, artifact=artifact)
+
+    if submission.checker_mode == CheckerModeEnum.CUSTOM:
+        try:
+            checker = get_or_compile(container_pool, CHECKER_RUNTIME, task.checker_code)
+        except CompilationError as e:
+            return get_checker_failure_verdict(e.output)
+        submission = replace(submission, checker=checker)
+
+    parallelism = get_parallelism(task.parallelism)
+    if settings.judge.mode == "batch":
+        verdicts = chain.from_iterable(
+            run_until_first_failure(
+                [
+                    partial(judge_tests_in_batch, submission, chunk)
+                    for chunk in split_into_chunks(tests, parallelism)
+                ],
+                lambda chunk_verdicts: chunk_verdicts[-1].is_failed,
+                parallelism,
+            )
         )
-        if input_data:
-            socket = container.attach_socket(params={"stdin": 1, "stream": 1})
-            socket._sock.send(input_data.encode() + b"\n")
-            socket._sock.close()
+    else:
+        verdicts = run_until_first_failure(
+            [partial(judge_test, submission, test) for test in tests],
+            lambda verdict: verdict.is_failed,
+            parallelism,
+        )
+
+    return get_final_verdict(verdicts)
+
+
+async def judge_solution_async(
+    submission: Submission,
+    task: CodeTask,
+    tests: list[Test],
+) -> Verdict:
+    if submission.runtime.is_compiled:
+        try:
+            artifact = await get_or_compile_async(
+                async_container_pool, submission.runtime, submission.code
+            )
+        except CompilationError as e:
+            return get_compilation_verdict(e)
+        submission = replace(submission, artifact=artifact)
 
+    if submission.checker_mode == CheckerModeEnum.CUSTOM:
         try:
-            result = container.wait(timeout=time_limit + 1)
-        except (ReadTimeout, ConnectionError, ConnectTimeout):
-            timed_out = True
-            return "", "Time limit exceeded", -1, True, False
+            checker = await get_or_compile_async(
+                async_container_pool, CHECKER_RUNTIME, task.checker_code
+            )
+        except CompilationError as e:
+            return get_checker_failure_verdict(e.output)
+        submission = replace(submission, checker=checker)
+
+    parallelism = get_parallelism(task.parallelism)
+    if settings.judge.mode == "batch":
+        verdicts = chain.from_iterable(
+            await run_until_first_failure_async(
+                [
+                    partial(judge_tests_in_batch_async, submission, chunk)
+                    for chunk in split_into_chunks(tests, parallelism)
+                ],
+                lambda chunk_verdicts: chunk_verdicts[-1].is_failed,
+                parallelism,
+            )
+        )
+    else:
+        verdicts = await run_until_first_failure_async(
+            [partial(judge_test_async, submission, test) for test in tests],
+            lambda verdict: verdict.is_failed,
+            parallelism,
+        )
+
+    return get_final_verdict(verdicts)
+
+
+def get_final_verdict(verdicts: Iterable[Verdict]) -> Verdict:
+    verdicts = list(verdicts)
+    cpu_time_ms = max((verdict.cpu_time_ms for verdict in verdicts), default=0)
+    peak_memory_kb = max((verdict.peak_memory_kb for verdict in verdicts), default=0)
+
+    for verdict in verdicts:
+        if verdict.is_failed:
+            return verdict._replace(
+                cpu_time_ms=cpu_time_ms, peak_memory_kb=peak_memory_kb
+            )
+    return Verdict(
+        SolutionStatusEnum.ACCEPTED,
+        {"status": "success", "correct": True},
+        cpu_time_ms,
+        peak_memory_kb,
+    )
+
 
-        stdout = container.logs(stdout=True, stderr=False).decode().strip()
-        stderr = container.logs(stdout=False, stderr=True).decode().strip()
-        status_code = result.get("StatusCode", 0)
-        oom_killed = container.attrs.get("State", {}).get("OOMKilled", False)
+def is_judge_failure(verdict: Verdict) -> bool:
+    return verdict.result.get("error") in (
+        JUDGE_FAILURE_MESSAGE,
+        CHECKER_FAILURE_MESSAGE,
+    )
 
-        return stdout, stderr, status_code, timed_out, oom_killed
+
+def schedule_solution(
+    solution_id: int,
+    space_id: int,
+    priority: str,
+    language: str,
+    rejudge_job_id: str | None = None,
+) -> None:
+    runtime = get_runtime_or_404(language)
+    judge_scheduler.enqueue(
+        solution_id, space_id, priority, runtime.slug, rejudge_job_id
+    )
+    judge_next.apply_async((runtime.language,), queue=runtime.queue)
+
+
+@app.task(name="core.celery.code_check_task.judge_next", acks_late=True)
+def judge_next(language: str):
+    scheduled = judge_scheduler.dequeue(get_runtime_or_404(language).slug)
+    if scheduled is None:
+        return None
+    return check_code(scheduled.solution_id, scheduled.rejudge_job_id)
+
+
+@app.task(name="core.celery.code_check_task.check_code", acks_late=True)
+def check_code(solution_id, rejudge_job_id: str | None = None):
+    try:
+        return judge_code_solution(solution_id)
     finally:
-        if container:
-            container.remove(force=True)
+        if rejudge_job_id and RejudgeProgress(rejudge_job_id).mark_done():
+            app.send_task(FINALIZE_REJUDGE_TASK, (rejudge_job_id,))
+
+
+def get_execution_backend(task: CodeTask) -> ExecutionBackendEnum:
+    backend = task.execution_backend or settings.judge.space_backends.get(
+        task.space_id, settings.judge.backend
+    )
+    return ExecutionBackendEnum(backend)
+
+
+def build_submission(
+    solution: CodeSolution,
+    task: CodeTask,
+    runtime: Runtime,
+    backend: ExecutionBackendEnum,
+) -> Submission:
+    return Submission(
+        runtime=runtime,
+        code=solution.code,
+        mem_limit=f"{max(task.memory_limit, 6)}m",
+        time_limit=task.time_limit / 1000.0,
+        events=SolutionEventPublisher(solution.id),
+        checker_mode=CheckerModeEnum(task.checker_mode),
+        checker_tolerance=task.checker_tolerance,
+        backend=backend,
+    )
+
+
+def get_solution_with_task(
+    session: Session,
+    solution_id: int,
+) -> tuple[CodeSolution, CodeTask]:
+    solution = session.get(CodeSolution, solution_id)
+    if not solution:
+        raise SolutionNotFoundException()
 
+    task = session.get(CodeTask, solution.task_id)
+    if not task:
+        raise TaskNotFoundException()
+    return solution, task
 
-@app.task(name="core.celery.code_check_task.check_code")
-def check_code(solution_id):
+
+def invalidate_solution_cache(solution: CodeSolution, task: CodeTask) -> None:
+    tags = [task_tag(task.id), solution_tag(solution.id)]
+    if solution.is_correct:
+        tags += [module_tag(task.module_id), space_tag(task.space_id)]
+    invalidate_tags_sync(*tags)
+
+
+def judge_code_solution(solution_id: int):
     with SessionLocal() as session:
-        solution = session.get(CodeSolution, solution_id)
-        if not solution:
-            raise SolutionNotFoundException()
+        solution, task = get_solution_with_task(session, solution_id)
+
+        runtime = get_runtime_or_404(solution.language)
+        backend = get_execution_backend(task)
+        submission = build_submission(solution, task, runtime, backend)
+        events = submission.events
+        verdict_key = get_verdict_key(
+            solution.code,
+            runtime_registry.get_image(runtime),
+            task.id,
+            task.tests_version,
+            task.time_limit,
+            task.memory_limit,
+            backend.value,
+        )
+
+        verdict = verdict_cache.get(verdict_key)
+        if verdict is None:
+            tests = session.query(Test).filter(Test.task_id == task.id).all()
+            events.started(len(tests))
+            if (
+                settings.judge.driver == "async"
+                and backend == ExecutionBackendEnum.DOCKER
+            ):
+                verdict = worker_loop.run(judge_solution_async(submission, task, tests))
+            else:
+                verdict = judge_solution(submission, task, tests)
+            if not is_judge_failure(verdict):
+                verdict_cache.set(verdict_key, verdict)
 
-        task = session.get(CodeTask, solution.task_id)
-        if not task:
-            raise TaskNotFoundException()
+        solution.status = verdict.status.value
+        solution.is_correct = verdict.status == SolutionStatusEnum.ACCEPTED
+        solution.cpu_time_ms = verdict.cpu_time_ms
+        solution.peak_memory_kb = verdict.peak_memory_kb
 
+        session.commit()
+        invalidate_solution_cache(solution, task)
+        events.finished(solution.get_validation_schema().model_dump(mode="json"))
+        return verdict.result
+
+
+def compare_backends(
+    solution_id: int,
+    repeat: int = 1,
+) -> list[tuple[ExecutionBackendEnum, Verdict, list[float]]]:
+    with SessionLocal() as session:
+        solution, task = get_solution_with_task(session, solution_id)
         tests = session.query(Test).filter(Test.task_id == task.id).all()
+        runtime = get_runtime_or_404(solution.language)
 
-        mem_limit = f"{max(task.memory_limit, 6)}m"
-        time_limit = task.time_limit / 1000.0
+        results = []
+        for backend in ExecutionBackendEnum:
+            submission = build_submission(solution, task, runtime, backend)
+            verdict, timings = None, []
+            for _ in range(repeat):
+                started_at = time.perf_counter()
+                verdict = judge_solution(submission, task, tests)
+                timings.append(time.perf_counter() - started_at)
+            results.append((backend, verdict, timings))
+        return results
 
-        for test in tests:
-            stdout, stderr, status_code, timed_out, oom_killed = run_code_in_container(
-                solution.code, test.input_data, mem_limit, time_limit
-            )
 
-            result = analyze_result(
-                stdout, stderr, status_code, timed_out, oom_killed, solution, test
-            )
-            if result:
-                break
-        else:
-            solution.status = SolutionStatusEnum.ACCEPTED.value
-            solution.is_correct = True
-            result = {"status": "success", "correct": True}
+def analyze_result(
+    record: HarnessRecord,
+    test: Test,
+    checker: bytes | None = None,
+) -> Verdict:
+    stdout = record.stdout.strip()
+    stderr = record.stderr.strip()
+    usage = record.cpu_time_ms, record.peak_memory_kb
 
-        session.commit()
-        return result
-
-
-def analyze_result(stdout, stderr, status_code, timed_out, oom_killed, solution, test):
-    result = 0
-    if timed_out:
-        solution.status = SolutionStatusEnum.TIME_LIMIT_EXCEEDED.value
-        result = {
-            "status": "error",
-            "error": "Time limit exceeded",
-            "output": stdout,
-        }
-    elif oom_killed or status_code == 137 or "memory" in stderr.lower():
-        solution.status = SolutionStatusEnum.MEMORY_LIMIT_EXCEEDED.value
-        result = {
-            "status": "error",
-            "error": "Memory limit exceeded",
-            "output": stdout,
-        }
+    if record.timed_out:
+        return Verdict(
+            SolutionStatusEnum.TIME_LIMIT_EXCEEDED,
+            {"status": "error", "error": "Time limit exceeded", "output": stdout},
+            *usage,
+        )
+    elif record.oom_killed or record.exit_code == 137 or "memory" in stderr.lower():
+        return Verdict(
+            SolutionStatusEnum.MEMORY_LIMIT_EXCEEDED,
+            {"status": "error", "error": "Memory limit exceeded", "output": stdout},
+            *usage,
+        )
+    elif record.output_limit_exceeded:
+        return Verdict(
+            SolutionStatusEnum.OUTPUT_LIMIT_EXCEEDED,
+            {"status": "error", "error": "Output limit exceeded", "output": stdout},
+            *usage,
+        )
     elif stderr:
-        solution.status = SolutionStatusEnum.RUNTIME_ERROR.value
-        result = {"status": "error", "error": stderr, "output": stdout}
-    elif stdout.strip() != test.correct_output:
-        solution.status = SolutionStatusEnum.WRONG_ANSWER.value
-        result = {
-            "status": "fail",
-            "output": stdout,
-            "expected": test.correct_output,
-            "correct": False,
-        }
-    return result
+        return Verdict(
+            SolutionStatusEnum.RUNTIME_ERROR,
+            {"status": "error", "error": stderr, "output": stdout},
+            *usage,
+        )
+
+    accepted, comment = record.output_matches, None
+    if accepted is None:
+        try:
+            accepted, comment = run_checker(
+                container_pool, checker, test, record.output_file
+            )
+        except CheckerFailure as e:
+            return get_checker_failure_verdict(e.message)._replace(
+                cpu_time_ms=record.cpu_time_ms,
+                peak_memory_kb=record.peak_memory_kb,
+            )
+
+    if not accepted:
+        return Verdict(
+            SolutionStatusEnum.WRONG_ANSWER,
+            {
+                "status": "fail",
+                "comment": comment,
+                "output": stdout,
+                "expected": blob_cache.read(
+                    test.output_hash, settings.judge.output_preview_size
+                ).decode(errors="replace"),
+                "correct": False,
+            },
+            *usage,
+        )
+    return Verdict(SolutionStatusEnum.ACCEPTED, 0, *usage)
@@ -0,0 +1,16 @@
+from celery.signals import worker_process_init
+
+from core.config import settings
+from database import DbHelper
+from .event_loop import worker_loop
+
+worker_db_helper = DbHelper(
+    url=str(settings.db.url),
+    pool_size=settings.db.worker_pool_size,
+)
+worker_loop.on_stop(worker_db_helper.dispose)
+
+
+@worker_process_init.connect
+def reset_worker_db_pool(**_):
+    worker_db_helper.engine.sync_engine.dispose(close=False)
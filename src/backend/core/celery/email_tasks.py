@@ -1,9 +1,8 @@
-import asyncio
-
 from pydantic import EmailStr
 from fastapi import Request
 
 from core.celery.app import app
+from core.celery.event_loop import worker_loop
 from features.users.services.email_access import send_confirmation_email_base
 
 
@@ -15,7 +14,7 @@ def _send_confirmation_email_task(
     html_file: str,
     address_type: str = "",
 ):
-    asyncio.run(
+    worker_loop.run(
         send_confirmation_email_base(
             base_url=base_url,
             email=email,
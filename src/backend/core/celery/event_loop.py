@@ -0,0 +1,69 @@
+import asyncio
+import threading
+from logging import getLogger
+from typing import Callable, Coroutine, TypeVar
+
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+logger = getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerEventLoop:
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._cleanups: list[Callable[[], Coroutine]] = []
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="worker-event-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coroutine: Coroutine[object, object, T]) -> T:
+        loop = self._loop or self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def on_stop(self, cleanup: Callable[[], Coroutine]) -> None:
+        self._cleanups.append(cleanup)
+
+    def stop(self) -> None:
+        for cleanup in reversed(self._cleanups):
+            if not self.is_running:
+                break
+            try:
+                self.run(cleanup())
+            except Exception:
+                logger.exception(f"Worker event loop cleanup {cleanup} failed")
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+worker_loop = WorkerEventLoop()
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def stop_worker_loop(**_):
+    worker_loop.stop()
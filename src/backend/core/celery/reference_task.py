@@ -0,0 +1,125 @@
+from contextlib import closing
+from logging import getLogger
+
+from sqlalchemy import select, update
+
+from core.blob_storage import blob_storage
+from core.cache import invalidate_tags_sync, task_tag
+from core.config import settings
+from core.judge import container_pool
+from core.judge.checkers import OutputCapture
+from core.judge.compiler import CompilationError, get_or_compile
+from core.judge.harness import HarnessRecord, run_tests_in_batch
+from core.judge.reference import ReferenceRun, get_output_source
+from features import CodeTask, Test
+from utils.code_check import get_runtime_or_404
+from utils.test_output import NormalizedOutput
+from .app import app
+from .code_check_task import (
+    EXECUTION_POOLS,
+    JUDGE_FAILURE_MESSAGE,
+    SessionLocal,
+    get_execution_backend,
+)
+
+logger = getLogger("judge")
+
+
+def get_reference_failure(record: HarnessRecord) -> str | None:
+    if record.timed_out:
+        return "Time limit exceeded"
+    elif record.oom_killed or record.exit_code == 137:
+        return "Memory limit exceeded"
+    elif record.output_limit_exceeded:
+        return "Output limit exceeded"
+    elif record.exit_code != 0 or record.stderr.strip():
+        return record.stderr.strip() or f"Exited with code {record.exit_code}"
+    return None
+
+
+@app.task(name="core.celery.reference_task.generate_expected_outputs", acks_late=True)
+def generate_expected_outputs(task_id: int):
+    run = ReferenceRun(task_id)
+    with SessionLocal() as session:
+        task = session.get(CodeTask, task_id)
+        if not task or not task.reference_code:
+            run.mark_finished(0, 0, "Task has no reference solution")
+            return
+
+        runtime = get_runtime_or_404(task.reference_language)
+        tests = session.scalars(
+            select(Test).where(Test.task_id == task.id).order_by(Test.id)
+        ).all()
+        sources = {
+            test.id: get_output_source(
+                task.reference_code, runtime.language, test.input_hash
+            )
+            for test in tests
+        }
+        stale = [test for test in tests if test.output_source != sources[test.id]]
+        run.mark_running(len(stale))
+        if not stale:
+            run.mark_finished(0, 0)
+            return
+
+        artifact = None
+        if runtime.is_compiled:
+            try:
+                artifact = get_or_compile(container_pool, runtime, task.reference_code)
+            except CompilationError as e:
+                run.mark_finished(0, len(stale), f"Compilation failed: {e.output}")
+                return
+
+        judged, generated, failed, error = 0, 0, 0, ""
+        pool = EXECUTION_POOLS[get_execution_backend(task)]
+        with pool.acquire(runtime, f"{max(task.memory_limit, 6)}m") as pooled:
+            records = run_tests_in_batch(
+                pool,
+                pooled,
+                runtime.command(task.reference_code),
+                stale,
+                task.time_limit / 1000.0,
+                artifact,
+                lambda _: OutputCapture(settings.judge.output_preview_size),
+            )
+            with closing(records):
+                for test, record in zip(stale, records):
+                    judged += 1
+                    with record.output_file:
+                        failure = get_reference_failure(record)
+                        if failure:
+                            failed += 1
+                            error = error or f"Test {test.id}: {failure}"
+                            continue
+                        output_blob = blob_storage.put_stream(
+                            NormalizedOutput(record.output_file)
+                        )
+
+                    # The input may have been edited while the reference ran;
+                    # the newer run triggered by that edit owns the output then.
+                    result = session.execute(
+                        update(Test)
+                        .where(Test.id == test.id, Test.input_hash == test.input_hash)
+                        .values(
+                            output_hash=output_blob.digest,
+                            output_size=output_blob.size,
+                            output_source=sources[test.id],
+                        )
+                    )
+                    generated += result.rowcount
+
+        if judged < len(stale):
+            failed += len(stale) - judged
+            error = error or JUDGE_FAILURE_MESSAGE
+        if generated:
+            session.execute(
+                update(CodeTask)
+                .where(CodeTask.id == task.id)
+                .values(tests_version=CodeTask.tests_version + 1)
+            )
+        session.commit()
+
+    if generated:
+        invalidate_tags_sync(task_tag(task_id))
+    logger.info(f"Generated {generated} expected outputs for task {task_id}")
+    run.mark_finished(generated, failed, error)
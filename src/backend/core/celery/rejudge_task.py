@@ -0,0 +1,76 @@
+from sqlalchemy import exists, func, select, update
+
+from core.cache import invalidate_tags_sync, module_tag, space_tag, task_tag
+from core.config import settings
+from core.judge.rejudge import RejudgeProgress
+from core.judge.scheduler import REJUDGE_PRIORITY
+from features.modules.models import AccountModuleProgress, Module
+from features.solutions.models import BaseSolution, CodeSolution
+from features.tasks.models import AccountTaskProgress, BaseTask
+from .app import app
+from .code_check_task import SessionLocal, schedule_solution
+
+
+@app.task(name="core.celery.rejudge_task.rejudge_solutions")
+def rejudge_solutions(job_id: str, task_id: int, space_id: int, after_id: int = 0):
+    progress = RejudgeProgress(job_id)
+    with SessionLocal() as session:
+        solutions = session.execute(
+            select(CodeSolution.id, CodeSolution.language)
+            .where(CodeSolution.task_id == task_id, CodeSolution.id > after_id)
+            .order_by(CodeSolution.id)
+            .limit(settings.judge.rejudge_batch_size)
+        ).all()
+
+    progress.add_enqueued(len(solutions))
+    for solution_id, language in solutions:
+        schedule_solution(solution_id, space_id, REJUDGE_PRIORITY, language, job_id)
+
+    if len(solutions) == settings.judge.rejudge_batch_size:
+        rejudge_solutions.delay(job_id, task_id, space_id, solutions[-1].id)
+    elif progress.mark_running():
+        finalize_rejudge.delay(job_id)
+
+
+@app.task(name="core.celery.rejudge_task.finalize_rejudge")
+def finalize_rejudge(job_id: str):
+    progress = RejudgeProgress(job_id)
+    task_id = progress.task_id
+    tasks = BaseTask.__table__
+
+    with SessionLocal() as session:
+        module_id, space_id = session.execute(
+            select(tasks.c.module_id, Module.space_id)
+            .join(Module, Module.id == tasks.c.module_id)
+            .where(tasks.c.id == task_id)
+        ).one()
+
+        session.execute(
+            update(AccountTaskProgress)
+            .where(AccountTaskProgress.task_id == task_id)
+            .values(
+                is_correct=exists().where(
+                    BaseSolution.task_id == AccountTaskProgress.task_id,
+                    BaseSolution.creator_id == AccountTaskProgress.account_id,
+                    BaseSolution.is_correct.is_(True),
+                )
+            )
+        )
+        session.execute(
+            update(AccountModuleProgress)
+            .where(AccountModuleProgress.module_id == module_id)
+            .values(
+                user_completed_tasks_count=select(func.count(AccountTaskProgress.id))
+                .join(tasks, tasks.c.id == AccountTaskProgress.task_id)
+                .where(
+                    tasks.c.module_id == AccountModuleProgress.module_id,
+                    AccountTaskProgress.account_id == AccountModuleProgress.account_id,
+                    AccountTaskProgress.is_correct.is_(True),
+                )
+                .scalar_subquery()
+            )
+        )
+        session.commit()
+
+    invalidate_tags_sync(task_tag(task_id), module_tag(module_id), space_tag(space_id))
+    progress.mark_finished()
@@ -1,18 +1,19 @@
-import asyncio
-
 from celery import shared_task
 
 from features.groups.crud.group_invite import update_group_invites_activity
 from features.modules.crud.module import update_modules_activity
 from features.tasks.crud.base import update_tasks_activity
+from .database import worker_db_helper
+from .event_loop import worker_loop
 
 
 @shared_task
 def run_activity_checks():
-    asyncio.run(_run_all_activity_checks())
+    worker_loop.run(_run_all_activity_checks())
 
 
 async def _run_all_activity_checks():
-    await update_tasks_activity()
-    await update_modules_activity()
-    await update_group_invites_activity()
+    async with worker_db_helper.session_factory() as session:
+        await update_tasks_activity(session)
+        await update_modules_activity(session)
+        await update_group_invites_activity(session)
@@ -32,6 +32,7 @@ class DbConfig(BaseModel):
     echo_pool: bool = False
     max_overflow: int = 10
     pool_size: int = 50
+    worker_pool_size: int = 5
 
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
@@ -126,6 +127,63 @@ class MemcachedConfig(BaseModel):
         return {"timeout": self.timeout}
 
 
+class JudgeConfig(BaseModel):
+    mode: Literal["per_test", "batch"] = "per_test"
+    driver: Literal["sync", "async"] = "sync"
+    backend: Literal["docker", "sandbox"] = "docker"
+    space_backends: dict[int, Literal["docker", "sandbox"]] = {}
+    worker_languages: list[str] = []
+    max_parallelism: int | None = None
+    wall_time_factor: float = 2.0
+    pool_size: int = 4
+    max_runs_per_container: int = 100
+    container_mem_limit: str = "256m"
+    tmpfs_size: str = "64m"
+    output_limit: str = "16m"
+    output_preview_size: int = 4096
+    checker_time_limit: int = 10
+    pids_limit: int = 64
+    max_concurrent_runs: int = 32
+    docker_socket: str = "/var/run/docker.sock"
+    docker_api_version: str = "1.41"
+    sandbox_root_dir: str = "/var/lib/oriole-judge/rootfs"
+    sandbox_uid_base: int = 60_000
+    sandbox_nofile_limit: int = 64
+    verdict_cache_ttl: int = 604_800
+    compile_mem_limit: str = "512m"
+    compile_time_limit: int = 30
+    artifact_cache_dir: str = "/tmp/oriole-judge/artifacts"
+    artifact_cache_entries: int = 1000
+    blob_cache_dir: str = "/tmp/oriole-judge/blobs"
+    blob_cache_size: str = "2g"
+    test_archive_max_tests: int = 1000
+    test_archive_max_size: str = "1g"
+    events_keepalive: int = 15
+    events_stream_timeout: int = 600
+    rejudge_batch_size: int = 500
+    rejudge_progress_ttl: int = 86_400
+    priority_weights: dict[str, float] = {"live": 8, "practice": 3, "rejudge": 1}
+    space_weights: dict[int, float] = {}
+    queue_wait_buckets: tuple[float, ...] = (0.5, 1, 2, 5, 10, 30, 60, 300)
+
+
+class BlobStorageConfig(BaseModel):
+    backend: Literal["local", "s3"] = "local"
+    local_path: str = str(BASE_DIR / "blobs")
+    s3_bucket: str | None = None
+    s3_prefix: str = "blobs"
+    s3_endpoint_url: str | None = None
+    s3_region: str | None = None
+    s3_access_key: str | None = None
+    s3_secret_key: str | None = None
+
+
+class CacheConfig(BaseModel):
+    local_ttl: int = 5
+    local_max_entries: int = 1024
+    local_max_bytes: int = 64 * 1024 * 1024
+
+
 class RateLimiterStorageConfig(Protocol):
     def get_storage_uri(self) -> str: ...
     def get_storage_options(self) -> dict: ...
@@ -165,6 +223,9 @@ class Settings(BaseSettings):
     gunicorn_run: GunicornConfig = GunicornConfig()
     api: ApiPrefix = ApiPrefix()
     auth_jwt: AuthJWT = AuthJWT()
+    judge: JudgeConfig = JudgeConfig()
+    blob_storage: BlobStorageConfig = BlobStorageConfig()
+    cache: CacheConfig = CacheConfig()
 
     @property
     def rate_limiter(self) -> RateLimiterSettings:
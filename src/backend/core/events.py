@@ -1,7 +1,9 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
+from core.cache import listen_for_invalidations
 from core.redis import redis_connection
 from database import db_helper
 from core.logging.config import setup_logging
@@ -24,8 +26,12 @@ async def lifespan(app: FastAPI):
 
     await redis_connection.connect()
     setup_logging()
+    invalidation_listener = asyncio.create_task(listen_for_invalidations())
 
     yield
 
+    invalidation_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await invalidation_listener
     await redis_connection.close()
     await db_helper.dispose()
@@ -0,0 +1,11 @@
+__all__ = (
+    "container_pool",
+    "runtime_registry",
+    "sandbox_pool",
+    "verdict_cache",
+)
+
+from .container_pool import container_pool
+from .runtimes import runtime_registry
+from .sandbox_pool import sandbox_pool
+from .verdict_cache import verdict_cache
@@ -0,0 +1,152 @@
+import argparse
+import logging
+from statistics import median
+
+from docker.utils import parse_bytes
+
+from core.judge.runtimes import runtime_registry
+from shared.enums import SolutionStatusEnum
+
+
+def parse_mix(value: str) -> dict[SolutionStatusEnum, int]:
+    mix = {}
+    for item in value.split(","):
+        status, _, weight = item.partition("=")
+        try:
+            mix[SolutionStatusEnum(status.strip())] = int(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid mix entry: {item!r}")
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m core.judge")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prebuild = commands.add_parser("prebuild", help="Build or verify runtime images")
+    prebuild.add_argument(
+        "languages",
+        nargs="*",
+        help=f"Runtimes to prepare (default: all of {', '.join(runtime_registry.runtimes)})",
+    )
+    prebuild.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild images even if they are up to date",
+    )
+
+    compare = commands.add_parser(
+        "compare",
+        help="Judge a stored solution on every execution backend and time it",
+    )
+    compare.add_argument("solution_id", type=int)
+    compare.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per backend (default: 3)",
+    )
+
+    benchmark = commands.add_parser(
+        "benchmark",
+        help="Judge synthetic submissions and report latency and throughput",
+    )
+    benchmark.add_argument(
+        "--module-id",
+        type=int,
+        required=True,
+        help="Module the synthetic task is created in",
+    )
+    benchmark.add_argument(
+        "--account-id",
+        type=int,
+        required=True,
+        help="Account that owns the synthetic task and solutions",
+    )
+    benchmark.add_argument("--submissions", type=int, default=100)
+    benchmark.add_argument("--tests", type=int, default=10)
+    benchmark.add_argument(
+        "--io-size",
+        type=parse_bytes,
+        default="1k",
+        help="Approximate size of every test input (default: 1k)",
+    )
+    benchmark.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=None,
+        help="Expected verdict weights, e.g. accepted=60,wrong_answer=20,"
+        "time_limit_exceeded=5,memory_limit_exceeded=5,runtime_error=10",
+    )
+    benchmark.add_argument("--time-limit", type=int, default=1000, help="In ms")
+    benchmark.add_argument("--memory-limit", type=int, default=64, help="In MB")
+    benchmark.add_argument("--parallelism", type=int, default=1)
+    benchmark.add_argument(
+        "--mode",
+        choices=("direct", "celery"),
+        default="direct",
+        help="Call check_code in this process or go through the judge queue",
+    )
+    benchmark.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Concurrent check_code calls in direct mode",
+    )
+    benchmark.add_argument(
+        "--timeout",
+        type=float,
+        default=600,
+        help="Seconds to wait for verdicts in celery mode",
+    )
+    benchmark.add_argument("--seed", type=int, default=None)
+    benchmark.add_argument(
+        "--keep",
+        action="store_true",
+        help="Keep the synthetic task and solutions after the run",
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "prebuild":
+        digests = runtime_registry.prepare(args.languages, rebuild=args.rebuild)
+        for language, digest in digests.items():
+            print(f"{language}\t{runtime_registry.get(language).image}\t{digest}")
+    elif args.command == "compare":
+        from core.celery.code_check_task import compare_backends
+
+        for backend, verdict, timings in compare_backends(
+            args.solution_id, args.repeat
+        ):
+            print(
+                f"{backend.value}\t{verdict.status.value}"
+                f"\tmin={min(timings):.3f}s\tmedian={median(timings):.3f}s"
+                f"\tcpu={verdict.cpu_time_ms}ms\tpeak={verdict.peak_memory_kb}KB"
+            )
+    elif args.command == "benchmark":
+        from core.judge.benchmark import DEFAULT_MIX, BenchmarkConfig, run_benchmark
+
+        report = run_benchmark(
+            BenchmarkConfig(
+                module_id=args.module_id,
+                account_id=args.account_id,
+                submissions=args.submissions,
+                tests=args.tests,
+                io_size=args.io_size,
+                mix=args.mix or DEFAULT_MIX,
+                time_limit=args.time_limit,
+                memory_limit=args.memory_limit,
+                parallelism=args.parallelism,
+                mode=args.mode,
+                concurrency=args.concurrency,
+                timeout=args.timeout,
+                seed=args.seed,
+                keep=args.keep,
+            )
+        )
+        print(report.format())
+
+
+if __name__ == "__main__":
+    main()
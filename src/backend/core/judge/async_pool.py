@@ -0,0 +1,198 @@
+import asyncio
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from logging import getLogger
+from typing import AsyncIterator, Awaitable, Callable, NamedTuple
+
+from docker.utils import parse_bytes
+
+from core.config import settings
+from core.judge.container_pool import RESET_COMMAND
+from core.judge.docker_api import AsyncDockerClient, DockerAPIError
+from core.judge.runtimes import Runtime, runtime_registry
+
+logger = getLogger("judge")
+
+EXIT_CODE_POLL_ATTEMPTS = 50
+EXIT_CODE_POLL_INTERVAL = 0.02
+
+
+class AsyncPooledContainer:
+    def __init__(self, container_id: str, image: str):
+        self.id = container_id
+        self.image = image
+        self.runs = 0
+
+
+class AsyncExecStream(NamedTuple):
+    frames: AsyncIterator[tuple[int, bytes]]
+    exit_code: Callable[[], Awaitable[int]]
+
+
+class AsyncContainerPool:
+    def __init__(
+        self,
+        size: int = settings.judge.pool_size,
+        max_runs: int = settings.judge.max_runs_per_container,
+        max_concurrency: int = settings.judge.max_concurrent_runs,
+    ):
+        self.size = size
+        self.max_runs = max_runs
+        self.max_concurrency = max_concurrency
+        self.client = AsyncDockerClient(
+            settings.judge.docker_socket, settings.judge.docker_api_version
+        )
+        self._idle: dict[str, deque[AsyncPooledContainer]] = defaultdict(deque)
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        return self._slots
+
+    async def warm_up(self, runtime: Runtime) -> None:
+        image = await asyncio.to_thread(runtime_registry.get_image, runtime)
+        while len(self._idle[image]) < self.size:
+            self._idle[image].append(await self._start(image))
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        runtime: Runtime,
+        mem_limit: str,
+    ) -> AsyncIterator[AsyncPooledContainer]:
+        image = await asyncio.to_thread(runtime_registry.get_image, runtime)
+        async with self.slots:
+            if self._idle[image]:
+                pooled = self._idle[image].popleft()
+            else:
+                pooled = await self._start(image)
+
+            failed = False
+            try:
+                await self.client.update_container(pooled.id, parse_bytes(mem_limit))
+                yield pooled
+            except Exception:
+                failed = True
+                raise
+            finally:
+                if failed:
+                    await self._discard(pooled)
+                else:
+                    await self._release(pooled)
+
+    @asynccontextmanager
+    async def exec_stream(
+        self,
+        pooled: AsyncPooledContainer,
+        command: list[str],
+        stdin: bytes | None,
+    ) -> AsyncIterator[AsyncExecStream]:
+        exec_id = await self.client.exec_create(
+            pooled.id, command, user="nobody", workdir="/tmp"
+        )
+        pooled.runs += 1
+        async with self.client.exec_start(exec_id, stdin) as frames:
+            yield AsyncExecStream(
+                frames=frames,
+                exit_code=lambda: self._wait_exit_code(exec_id),
+            )
+
+    async def exec(
+        self,
+        pooled: AsyncPooledContainer,
+        command: list[str],
+        stdin: bytes | None,
+        timeout: float,
+    ) -> tuple[bytes, bytes, int]:
+        output = {1: bytearray(), 2: bytearray()}
+        async with asyncio.timeout(timeout):
+            async with self.exec_stream(pooled, command, stdin) as execution:
+                async for stream_id, data in execution.frames:
+                    output.setdefault(stream_id, bytearray()).extend(data)
+                status_code = await execution.exit_code()
+        return bytes(output[1]), bytes(output[2]), status_code
+
+    async def close(self) -> None:
+        idle = [pooled for queue in self._idle.values() for pooled in queue]
+        self._idle.clear()
+        await asyncio.gather(*(self._remove(pooled) for pooled in idle))
+        await self.client.close()
+
+    async def _start(self, image: str) -> AsyncPooledContainer:
+        container_id = await self.client.create_container(
+            {
+                "Image": image,
+                "Entrypoint": ["sleep", "infinity"],
+                "User": "nobody",
+                "WorkingDir": "/tmp",
+                "NetworkDisabled": True,
+                "Labels": {"oriole.judge": "pool"},
+                "HostConfig": {
+                    "NetworkMode": "none",
+                    "Memory": parse_bytes(settings.judge.container_mem_limit),
+                    "MemorySwap": parse_bytes(settings.judge.container_mem_limit),
+                    "OomKillDisable": False,
+                    "ReadonlyRootfs": True,
+                    "Privileged": False,
+                    "NanoCpus": 1_000_000_000,
+                    "PidsLimit": settings.judge.pids_limit,
+                    "Tmpfs": {
+                        "/tmp": f"rw,exec,nosuid,nodev,size={settings.judge.tmpfs_size}"
+                    },
+                    "SecurityOpt": ["no-new-privileges:true"],
+                    "CapDrop": ["ALL"],
+                },
+            }
+        )
+        await self.client.start_container(container_id)
+        return AsyncPooledContainer(container_id, image)
+
+    async def _release(self, pooled: AsyncPooledContainer) -> None:
+        if pooled.runs >= self.max_runs or not await self._reset(pooled):
+            await self._discard(pooled)
+            return
+
+        if len(self._idle[pooled.image]) < self.size:
+            self._idle[pooled.image].append(pooled)
+        else:
+            await self._remove(pooled)
+
+    async def _reset(self, pooled: AsyncPooledContainer) -> bool:
+        try:
+            state = await self.client.inspect_container(pooled.id)
+            if not state["State"]["Running"]:
+                return False
+            _, _, status_code = await self.exec(pooled, RESET_COMMAND, None, 10)
+            return status_code == 0
+        except (DockerAPIError, OSError, TimeoutError):
+            return False
+
+    async def _discard(self, pooled: AsyncPooledContainer) -> None:
+        await self._remove(pooled)
+        if len(self._idle[pooled.image]) >= self.size:
+            return
+        try:
+            replacement = await self._start(pooled.image)
+        except DockerAPIError as e:
+            logger.error(f"Failed to start judge container: {e}")
+            return
+        self._idle[pooled.image].append(replacement)
+
+    async def _wait_exit_code(self, exec_id: str) -> int:
+        for _ in range(EXIT_CODE_POLL_ATTEMPTS):
+            state = await self.client.exec_inspect(exec_id)
+            if not state.get("Running"):
+                return state.get("ExitCode") or 0
+            await asyncio.sleep(EXIT_CODE_POLL_INTERVAL)
+        return -1
+
+    async def _remove(self, pooled: AsyncPooledContainer) -> None:
+        try:
+            await self.client.remove_container(pooled.id)
+        except DockerAPIError:
+            pass
+
+
+async_container_pool = AsyncContainerPool()
@@ -0,0 +1,286 @@
+import json
+import random
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from statistics import quantiles
+from typing import Literal, NamedTuple
+
+import docker
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from core.blob_storage import blob_storage
+from core.celery.code_check_task import SessionLocal, check_code, schedule_solution
+from core.judge.events import VERDICT_EVENT, get_solution_channel
+from core.judge.scheduler import LIVE_PRIORITY
+from core.redis import sync_redis_client
+from features import CodeTask, Test
+from features.modules.models import Module
+from features.solutions.models import CodeSolution
+from shared.enums import SolutionStatusEnum
+
+NUMBER_WIDTH = 7
+BENCHMARK_LANGUAGE = "Python"
+EVENT_POLL_INTERVAL = 1.0
+
+SOLUTIONS = {
+    SolutionStatusEnum.ACCEPTED: (
+        "import sys\nprint(sum(map(int, sys.stdin.read().split())))\n"
+    ),
+    SolutionStatusEnum.WRONG_ANSWER: (
+        "import sys\nprint(sum(map(int, sys.stdin.read().split())) + 1)\n"
+    ),
+    SolutionStatusEnum.TIME_LIMIT_EXCEEDED: "while True:\n    pass\n",
+    SolutionStatusEnum.MEMORY_LIMIT_EXCEEDED: "data = bytearray(1 << 34)\n",
+    SolutionStatusEnum.RUNTIME_ERROR: "raise ValueError('benchmark')\n",
+}
+
+DEFAULT_MIX = {
+    SolutionStatusEnum.ACCEPTED: 60,
+    SolutionStatusEnum.WRONG_ANSWER: 15,
+    SolutionStatusEnum.TIME_LIMIT_EXCEEDED: 5,
+    SolutionStatusEnum.MEMORY_LIMIT_EXCEEDED: 5,
+    SolutionStatusEnum.RUNTIME_ERROR: 15,
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    module_id: int
+    account_id: int
+    submissions: int = 100
+    tests: int = 10
+    io_size: int = 1024
+    mix: dict[SolutionStatusEnum, int] = field(default_factory=lambda: DEFAULT_MIX)
+    time_limit: int = 1000
+    memory_limit: int = 64
+    parallelism: int = 1
+    mode: Literal["direct", "celery"] = "direct"
+    concurrency: int = 1
+    timeout: float = 600
+    seed: int | None = None
+    keep: bool = False
+
+
+class BenchmarkFixtures(NamedTuple):
+    task_id: int
+    space_id: int
+    expected: dict[int, SolutionStatusEnum]
+
+
+class BenchmarkReport(NamedTuple):
+    submissions: int
+    completed: int
+    elapsed: float
+    latencies: list[float]
+    container_starts: int
+    verdicts: Counter
+    mismatches: int
+
+    @property
+    def throughput(self) -> float:
+        return self.completed / self.elapsed * 60 if self.elapsed else 0.0
+
+    def get_percentiles(self) -> tuple[float, float, float]:
+        if len(self.latencies) < 2:
+            latency = self.latencies[0] if self.latencies else 0.0
+            return latency, latency, latency
+        cuts = quantiles(self.latencies, n=100, method="inclusive")
+        return cuts[49], cuts[94], cuts[98]
+
+    def format(self) -> str:
+        p50, p95, p99 = self.get_percentiles()
+        lines = [
+            f"submissions\t{self.completed}/{self.submissions}",
+            f"elapsed\t{self.elapsed:.2f}s",
+            f"throughput\t{self.throughput:.1f}/min",
+            f"time to verdict\tp50={p50:.3f}s p95={p95:.3f}s p99={p99:.3f}s",
+            f"container starts\t{self.container_starts}"
+            f" ({self.container_starts / max(self.submissions, 1):.2f}/submission)",
+            f"unexpected verdicts\t{self.mismatches}",
+        ]
+        lines.extend(
+            f"verdict {status}\t{count}" for status, count in self.verdicts.items()
+        )
+        return "\n".join(lines)
+
+
+def generate_test(rng: random.Random, io_size: int) -> tuple[bytes, bytes]:
+    numbers = [rng.randint(-99_999, 999_999) for _ in range(io_size // NUMBER_WIDTH)]
+    input_data = " ".join(map(str, numbers)) or "0"
+    return input_data.encode(), f"{sum(numbers)}".encode()
+
+
+def pick_statuses(
+    rng: random.Random,
+    mix: dict[SolutionStatusEnum, int],
+    count: int,
+) -> list[SolutionStatusEnum]:
+    statuses = list(mix)
+    return rng.choices(statuses, weights=[mix[status] for status in statuses], k=count)
+
+
+def create_fixtures(session: Session, config: BenchmarkConfig) -> BenchmarkFixtures:
+    rng = random.Random(config.seed)
+    module = session.get(Module, config.module_id)
+    if module is None:
+        raise ValueError(f"Module {config.module_id} not found")
+
+    task = CodeTask(
+        title=f"Judge benchmark {datetime.now(timezone.utc):%Y-%m-%d %H:%M}",
+        description="Synthetic task created by python -m core.judge benchmark",
+        creator_id=config.account_id,
+        module_id=module.id,
+        time_limit=config.time_limit,
+        memory_limit=config.memory_limit,
+        parallelism=config.parallelism,
+    )
+    session.add(task)
+    session.flush()
+
+    for _ in range(config.tests):
+        input_data, output_data = generate_test(rng, config.io_size)
+        input_blob = blob_storage.put(input_data)
+        output_blob = blob_storage.put(output_data)
+        session.add(
+            Test(
+                task_id=task.id,
+                input_hash=input_blob.digest,
+                input_size=input_blob.size,
+                output_hash=output_blob.digest,
+                output_size=output_blob.size,
+                is_public=False,
+            )
+        )
+
+    solutions = []
+    for status in pick_statuses(rng, config.mix, config.submissions):
+        # A unique suffix keeps every submission out of the verdict cache.
+        solution = CodeSolution(
+            creator_id=config.account_id,
+            task_id=task.id,
+            code=f"{SOLUTIONS[status]}# benchmark {uuid.uuid4().hex}\n",
+            language=BENCHMARK_LANGUAGE,
+        )
+        session.add(solution)
+        solutions.append((solution, status))
+
+    session.commit()
+    return BenchmarkFixtures(
+        task_id=task.id,
+        space_id=module.space_id,
+        expected={solution.id: status for solution, status in solutions},
+    )
+
+
+def delete_fixtures(session: Session, fixtures: BenchmarkFixtures) -> None:
+    for solution in session.scalars(
+        select(CodeSolution).where(CodeSolution.id.in_(fixtures.expected))
+    ):
+        session.delete(solution)
+    session.execute(delete(Test).where(Test.task_id == fixtures.task_id))
+    session.delete(session.get(CodeTask, fixtures.task_id))
+    session.commit()
+
+
+def run_direct(fixtures: BenchmarkFixtures, concurrency: int) -> dict[int, float]:
+    def judge(solution_id: int) -> tuple[int, float]:
+        started_at = time.perf_counter()
+        check_code(solution_id)
+        return solution_id, time.perf_counter() - started_at
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return dict(executor.map(judge, fixtures.expected))
+
+
+def run_through_celery(fixtures: BenchmarkFixtures, timeout: float) -> dict[int, float]:
+    pubsub = sync_redis_client.pubsub(ignore_subscribe_messages=True)
+    channels = {
+        get_solution_channel(solution_id): solution_id
+        for solution_id in fixtures.expected
+    }
+    pubsub.subscribe(*channels)
+    try:
+        scheduled_at = {}
+        for solution_id in fixtures.expected:
+            scheduled_at[solution_id] = time.perf_counter()
+            schedule_solution(
+                solution_id, fixtures.space_id, LIVE_PRIORITY, BENCHMARK_LANGUAGE
+            )
+
+        latencies = {}
+        deadline = time.monotonic() + timeout
+        while len(latencies) < len(channels) and time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=EVENT_POLL_INTERVAL)
+            if message is None:
+                continue
+            if json.loads(message["data"])["event"] != VERDICT_EVENT:
+                continue
+            solution_id = channels[message["channel"]]
+            latencies.setdefault(
+                solution_id, time.perf_counter() - scheduled_at[solution_id]
+            )
+        return latencies
+    finally:
+        pubsub.close()
+
+
+def count_container_starts(since: datetime, until: datetime) -> int:
+    client = docker.from_env()
+    try:
+        events = client.events(
+            since=since,
+            until=until,
+            decode=True,
+            filters={"type": "container", "event": "start", "label": "oriole.judge"},
+        )
+        return sum(1 for _ in events)
+    finally:
+        client.close()
+
+
+def run_benchmark(config: BenchmarkConfig) -> BenchmarkReport:
+    with SessionLocal() as session:
+        fixtures = create_fixtures(session, config)
+
+    try:
+        started_at = datetime.now(timezone.utc)
+        timer = time.perf_counter()
+        if config.mode == "celery":
+            latencies = run_through_celery(fixtures, config.timeout)
+        else:
+            latencies = run_direct(fixtures, config.concurrency)
+        elapsed = time.perf_counter() - timer
+        container_starts = count_container_starts(
+            started_at, datetime.now(timezone.utc)
+        )
+
+        with SessionLocal() as session:
+            statuses = dict(
+                session.execute(
+                    select(CodeSolution.id, CodeSolution.status).where(
+                        CodeSolution.id.in_(fixtures.expected)
+                    )
+                ).all()
+            )
+    finally:
+        if not config.keep:
+            with SessionLocal() as session:
+                delete_fixtures(session, fixtures)
+
+    return BenchmarkReport(
+        submissions=config.submissions,
+        completed=len(latencies),
+        elapsed=elapsed,
+        latencies=sorted(latencies.values()),
+        container_starts=container_starts,
+        verdicts=Counter(statuses[solution_id] for solution_id in latencies),
+        mismatches=sum(
+            statuses[solution_id] != fixtures.expected[solution_id].value
+            for solution_id in latencies
+        ),
+    )
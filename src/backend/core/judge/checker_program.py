@@ -0,0 +1,84 @@
+import io
+import tarfile
+from typing import BinaryIO, NamedTuple
+
+from docker.utils.socket import consume_socket_output
+
+from core.blob_storage import blob_cache
+from core.config import settings
+from core.judge.container_pool import ContainerPool
+from core.judge.runtimes import CHECKER_RUNTIME
+from features.tasks.models import Test
+
+# testlib exit codes: 0 accepted, 1 wrong answer, 2 presentation error.
+ACCEPTED_EXIT_CODE = 0
+REJECTED_EXIT_CODES = (1, 2)
+
+CHECK_SCRIPT = (
+    "mkdir -p /tmp/check && cd /tmp/check && tar -xf - "
+    '&& exec timeout -s KILL "$0" ./checker input output answer'
+)
+
+
+class CheckerFailure(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class CheckerResult(NamedTuple):
+    accepted: bool
+    message: str
+
+
+def build_checker_archive(checker: bytes, test: Test, output: BinaryIO) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        _add_file(archive, "checker", io.BytesIO(checker), len(checker), 0o555)
+        _add_file(archive, "output", output, output.seek(0, io.SEEK_END))
+        for name, digest in (("input", test.input_hash), ("answer", test.output_hash)):
+            with blob_cache.get_path(digest).open("rb") as blob:
+                _add_file(archive, name, blob, blob.seek(0, io.SEEK_END))
+    return buffer.getvalue()
+
+
+def run_checker(
+    pool: ContainerPool,
+    checker: bytes,
+    test: Test,
+    output: BinaryIO,
+) -> CheckerResult:
+    time_limit = settings.judge.checker_time_limit
+    with output:
+        archive = build_checker_archive(checker, test, output)
+    with pool.acquire(CHECKER_RUNTIME, settings.judge.compile_mem_limit) as pooled:
+        with pool.exec_stream(
+            pooled,
+            ["sh", "-c", CHECK_SCRIPT, f"{time_limit}"],
+            archive,
+            time_limit + 5,
+        ) as execution:
+            stdout, stderr = consume_socket_output(execution.frames, demux=True)
+            status_code = execution.exit_code()
+
+    message = (stderr or stdout or b"")[: settings.judge.output_preview_size]
+    message = message.decode(errors="replace").strip()
+    if status_code == ACCEPTED_EXIT_CODE:
+        return CheckerResult(True, message)
+    if status_code in REJECTED_EXIT_CODES:
+        return CheckerResult(False, message)
+    raise CheckerFailure(message or f"Checker exited with code {status_code}")
+
+
+def _add_file(
+    archive: tarfile.TarFile,
+    name: str,
+    data: BinaryIO,
+    size: int,
+    mode: int = 0o444,
+) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mode = mode
+    data.seek(0)
+    archive.addfile(info, data)
@@ -0,0 +1,192 @@
+import math
+import re
+import tempfile
+from collections import Counter
+from typing import Callable
+
+from core.blob_storage import blob_cache
+from core.config import settings
+from features.tasks.models import Test
+from shared.enums import CheckerModeEnum
+
+TOKEN_PATTERN = re.compile(rb"\S+")
+LINE_PATTERN = re.compile(rb"[^\n]+")
+
+
+class OutputChecker:
+    def __init__(self, preview_size: int):
+        self.preview_size = preview_size
+        self.preview = bytearray()
+        self.size = 0
+        self.matches = True
+
+    def feed(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if len(self.preview) < self.preview_size:
+            self.preview += chunk[: self.preview_size - len(self.preview)]
+        if self.matches:
+            self.check(chunk)
+
+    def check(self, chunk: bytes) -> None:
+        pass
+
+    def finish(self) -> bool | None:
+        return None
+
+    def get_preview(self) -> str:
+        return self.preview.decode(errors="replace")
+
+
+class ExactChecker(OutputChecker):
+    def __init__(self, expected: bytes, preview_size: int):
+        super().__init__(preview_size)
+        self.expected = expected.strip()
+        self._position = 0
+        self._started = False
+        self._pending = b""
+
+    def check(self, chunk: bytes) -> None:
+        # Matches the output with surrounding whitespace stripped, like
+        # str.strip(), without keeping more than one chunk in memory.
+        if not self._started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+            self._started = True
+
+        stripped = chunk.rstrip()
+        if not stripped:
+            self._pending += chunk
+            return
+
+        content = self._pending + stripped
+        self._pending = chunk[len(stripped) :]
+        end = self._position + len(content)
+        self.matches = self.expected[self._position : end] == content
+        self._position = end
+
+    def finish(self) -> bool:
+        return self.matches and self._position == len(self.expected)
+
+
+class TokenChecker(OutputChecker):
+    def __init__(self, expected: bytes, preview_size: int):
+        super().__init__(preview_size)
+        self._expected_tokens = TOKEN_PATTERN.finditer(expected)
+        self._partial = b""
+
+    def check(self, chunk: bytes) -> None:
+        data = self._partial + chunk
+        tokens = data.split()
+        self._partial = tokens.pop() if tokens and not data[-1:].isspace() else b""
+        for token in tokens:
+            self._check_token(token)
+
+    def finish(self) -> bool:
+        if self.matches and self._partial:
+            self._check_token(self._partial)
+        return self.matches and next(self._expected_tokens, None) is None
+
+    def tokens_match(self, expected: bytes, actual: bytes) -> bool:
+        return expected == actual
+
+    def _check_token(self, token: bytes) -> None:
+        expected = next(self._expected_tokens, None)
+        if expected is None or not self.tokens_match(expected.group(), token):
+            self.matches = False
+
+
+class FloatChecker(TokenChecker):
+    def __init__(self, expected: bytes, preview_size: int, tolerance: float):
+        super().__init__(expected, preview_size)
+        self.tolerance = tolerance
+
+    def tokens_match(self, expected: bytes, actual: bytes) -> bool:
+        if expected == actual:
+            return True
+        try:
+            expected_value, actual_value = float(expected), float(actual)
+        except ValueError:
+            return False
+        return math.isclose(
+            expected_value,
+            actual_value,
+            rel_tol=self.tolerance,
+            abs_tol=self.tolerance,
+        )
+
+
+class UnorderedLinesChecker(OutputChecker):
+    def __init__(self, expected: bytes, preview_size: int):
+        super().__init__(preview_size)
+        self._remaining = Counter(
+            line
+            for match in LINE_PATTERN.finditer(expected)
+            if (line := match.group().strip())
+        )
+        self._partial = b""
+
+    def check(self, chunk: bytes) -> None:
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._check_line(line)
+
+    def finish(self) -> bool:
+        if self.matches:
+            self._check_line(self._partial)
+        return self.matches and not +self._remaining
+
+    def _check_line(self, line: bytes) -> None:
+        line = line.strip()
+        if not line:
+            return
+        if self._remaining[line] <= 0:
+            self.matches = False
+        self._remaining[line] -= 1
+
+
+class OutputCapture(OutputChecker):
+    def __init__(self, preview_size: int):
+        super().__init__(preview_size)
+        self.file = tempfile.SpooledTemporaryFile(1024 * 1024)
+
+    def check(self, chunk: bytes) -> None:
+        self.file.write(chunk)
+
+    def finish(self) -> None:
+        self.file.seek(0)
+        return None
+
+
+def create_checker(
+    mode: CheckerModeEnum,
+    expected: bytes,
+    tolerance: float,
+    preview_size: int = settings.judge.output_preview_size,
+) -> OutputChecker:
+    if mode == CheckerModeEnum.TOKENS:
+        return TokenChecker(expected, preview_size)
+    elif mode == CheckerModeEnum.FLOAT:
+        return FloatChecker(expected, preview_size, tolerance)
+    elif mode == CheckerModeEnum.UNORDERED_LINES:
+        return UnorderedLinesChecker(expected, preview_size)
+    elif mode == CheckerModeEnum.CUSTOM:
+        return OutputCapture(preview_size)
+    return ExactChecker(expected, preview_size)
+
+
+def get_checker_factory(
+    tests: list[Test],
+    mode: CheckerModeEnum,
+    tolerance: float,
+) -> Callable[[int], OutputChecker]:
+    output_hashes = {test.id: test.output_hash for test in tests}
+
+    def create_test_checker(test_id: int) -> OutputChecker:
+        if mode == CheckerModeEnum.CUSTOM:
+            return create_checker(mode, b"", tolerance)
+        expected = blob_cache.read(output_hashes[test_id])
+        return create_checker(mode, expected, tolerance)
+
+    return create_test_checker
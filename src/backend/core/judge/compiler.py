@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import os
+import threading
+from logging import getLogger
+from pathlib import Path
+
+from docker.utils.socket import consume_socket_output
+
+from core.config import settings
+from core.judge.async_pool import AsyncContainerPool
+from core.judge.container_pool import ContainerPool
+from core.judge.runtimes import ARTIFACT_NAME, Runtime, runtime_registry
+
+logger = getLogger("judge")
+
+COMPILE_SCRIPT = 'source="$1"; shift; cat > "$source" && "$@" >&2 && cat "$ARTIFACT"'
+
+
+class CompilationError(Exception):
+    def __init__(self, output: str):
+        super().__init__(output)
+        self.output = output
+
+
+def get_artifact_key(
+    runtime_digest: str,
+    compile_command: list[str],
+    source: str,
+) -> str:
+    digest = hashlib.sha256()
+    for part in (*compile_command, source):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return f"{runtime_digest.removeprefix('sha256:')}-{digest.hexdigest()}"
+
+
+class ArtifactCache:
+    def __init__(self, path: Path, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        artifact = self.path / key
+        try:
+            data = artifact.read_bytes()
+        except FileNotFoundError:
+            return None
+        artifact.touch()
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            partial = self.path / f".{key}.{threading.get_ident()}"
+            partial.write_bytes(data)
+            os.replace(partial, self.path / key)
+            self._evict()
+
+    def _evict(self) -> None:
+        artifacts = sorted(
+            (entry for entry in os.scandir(self.path) if entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in artifacts[: max(0, len(artifacts) - self.max_entries)]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def get_compile_command(runtime: Runtime) -> list[str]:
+    return [
+        "env",
+        f"ARTIFACT={ARTIFACT_NAME}",
+        "timeout",
+        "-s",
+        "KILL",
+        f"{settings.judge.compile_time_limit}",
+        "sh",
+        "-c",
+        COMPILE_SCRIPT,
+        "compile",
+        runtime.source_file,
+        *runtime.compile_command,
+    ]
+
+
+def check_compilation(
+    artifact: bytes | None,
+    output: bytes | None,
+    status_code: int,
+) -> bytes:
+    if status_code != 0:
+        output = (output or b"").decode(errors="replace").strip()
+        raise CompilationError(output or "Compilation failed")
+    return artifact
+
+
+def compile_source(pool: ContainerPool, runtime: Runtime, source: str) -> bytes:
+    with pool.acquire(runtime, settings.judge.compile_mem_limit) as pooled:
+        with pool.exec_stream(
+            pooled,
+            get_compile_command(runtime),
+            source.encode(),
+            settings.judge.compile_time_limit + 5,
+        ) as execution:
+            artifact, output = consume_socket_output(execution.frames, demux=True)
+            status_code = execution.exit_code()
+    return check_compilation(artifact, output, status_code)
+
+
+async def compile_source_async(
+    pool: AsyncContainerPool,
+    runtime: Runtime,
+    source: str,
+) -> bytes:
+    async with pool.acquire(runtime, settings.judge.compile_mem_limit) as pooled:
+        artifact, output, status_code = await pool.exec(
+            pooled,
+            get_compile_command(runtime),
+            source.encode(),
+            settings.judge.compile_time_limit + 5,
+        )
+    return check_compilation(artifact, output, status_code)
+
+
+def get_or_compile(pool: ContainerPool, runtime: Runtime, source: str) -> bytes:
+    key = get_artifact_key(
+        runtime_registry.get_image(runtime), get_compile_command(runtime), source
+    )
+    artifact = artifact_cache.get(key)
+    if artifact is None:
+        artifact = compile_source(pool, runtime, source)
+        artifact_cache.put(key, artifact)
+    return artifact
+
+
+async def get_or_compile_async(
+    pool: AsyncContainerPool,
+    runtime: Runtime,
+    source: str,
+) -> bytes:
+    digest = await asyncio.to_thread(runtime_registry.get_image, runtime)
+    key = get_artifact_key(digest, get_compile_command(runtime), source)
+    artifact = await asyncio.to_thread(artifact_cache.get, key)
+    if artifact is None:
+        artifact = await compile_source_async(pool, runtime, source)
+        await asyncio.to_thread(artifact_cache.put, key, artifact)
+    return artifact
+
+
+artifact_cache = ArtifactCache(
+    Path(settings.judge.artifact_cache_dir),
+    settings.judge.artifact_cache_entries,
+)
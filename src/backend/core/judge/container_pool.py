@@ -0,0 +1,198 @@
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from logging import getLogger
+from typing import Callable, Iterator, NamedTuple
+
+import docker
+from docker.errors import APIError, NotFound
+from docker.models.containers import Container
+from docker.utils.socket import frames_iter
+
+from core.config import settings
+from core.judge.runtimes import Runtime, runtime_registry
+
+logger = getLogger("judge")
+
+TIMEOUT_EXIT_CODE = 124
+KILLED_EXIT_CODE = 137
+EXIT_CODE_POLL_ATTEMPTS = 50
+EXIT_CODE_POLL_INTERVAL = 0.02
+
+RESET_COMMAND = [
+    "sh",
+    "-c",
+    "kill -9 -1 2>/dev/null; rm -rf /tmp/* /tmp/.[!.]* 2>/dev/null; true",
+]
+
+
+class PooledContainer:
+    def __init__(self, container: Container, image: str):
+        self.container = container
+        self.image = image
+        self.runs = 0
+
+
+class ExecStream(NamedTuple):
+    frames: Iterator[tuple[int, bytes]]
+    exit_code: Callable[[], int]
+
+
+class ContainerPool:
+    def __init__(
+        self,
+        size: int = settings.judge.pool_size,
+        max_runs: int = settings.judge.max_runs_per_container,
+    ):
+        self.size = size
+        self.max_runs = max_runs
+        self._client: docker.DockerClient | None = None
+        self._idle: dict[str, deque[PooledContainer]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> docker.DockerClient:
+        if self._client is None:
+            self._client = docker.from_env()
+        return self._client
+
+    def warm_up(self, runtime: Runtime) -> None:
+        image = runtime_registry.get_image(runtime)
+        while len(self._idle[image]) < self.size:
+            self._idle[image].append(self._start(image))
+
+    @contextmanager
+    def acquire(self, runtime: Runtime, mem_limit: str) -> Iterator[PooledContainer]:
+        image = runtime_registry.get_image(runtime)
+        with self._lock:
+            pooled = self._idle[image].popleft() if self._idle[image] else None
+        if pooled is None:
+            pooled = self._start(image)
+
+        failed = False
+        try:
+            pooled.container.update(mem_limit=mem_limit, memswap_limit=mem_limit)
+            yield pooled
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if failed:
+                self._discard(pooled)
+            else:
+                self._release(pooled)
+
+    @contextmanager
+    def exec_stream(
+        self,
+        pooled: PooledContainer,
+        command: list[str],
+        stdin: bytes | None,
+        timeout: float,
+    ) -> Iterator[ExecStream]:
+        api = self.client.api
+        exec_id = api.exec_create(
+            pooled.container.id,
+            cmd=command,
+            stdin=True,
+            user="nobody",
+            workdir="/tmp",
+        )["Id"]
+        pooled.runs += 1
+
+        stream = api.exec_start(exec_id, socket=True)
+        raw_socket = getattr(stream, "_sock", stream)
+        try:
+            raw_socket.settimeout(timeout)
+            if stdin:
+                raw_socket.sendall(stdin)
+            raw_socket.shutdown(socket.SHUT_WR)
+            yield ExecStream(
+                frames=frames_iter(stream, tty=False),
+                exit_code=lambda: self._wait_exit_code(exec_id),
+            )
+        finally:
+            stream.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [pooled for queue in self._idle.values() for pooled in queue]
+            self._idle.clear()
+        for pooled in idle:
+            self._remove(pooled)
+
+    def _start(self, image: str) -> PooledContainer:
+        container = self.client.containers.run(
+            image=image,
+            entrypoint=["sleep", "infinity"],
+            detach=True,
+            network_mode="none",
+            mem_limit=settings.judge.container_mem_limit,
+            memswap_limit=settings.judge.container_mem_limit,
+            oom_kill_disable=False,
+            read_only=True,
+            privileged=False,
+            nano_cpus=1_000_000_000,
+            pids_limit=settings.judge.pids_limit,
+            user="nobody",
+            working_dir="/tmp",
+            tmpfs={"/tmp": f"rw,exec,nosuid,nodev,size={settings.judge.tmpfs_size}"},
+            security_opt=["no-new-privileges:true"],
+            cap_drop=["ALL"],
+            labels={"oriole.judge": "pool"},
+        )
+        return PooledContainer(container, image)
+
+    def _release(self, pooled: PooledContainer) -> None:
+        if pooled.runs >= self.max_runs or not self._reset(pooled):
+            self._discard(pooled)
+            return
+
+        with self._lock:
+            if len(self._idle[pooled.image]) < self.size:
+                self._idle[pooled.image].append(pooled)
+                return
+        self._remove(pooled)
+
+    def _reset(self, pooled: PooledContainer) -> bool:
+        try:
+            pooled.container.reload()
+            if pooled.container.status != "running":
+                return False
+            result = pooled.container.exec_run(RESET_COMMAND, user="nobody")
+            return result.exit_code == 0
+        except (APIError, NotFound):
+            return False
+
+    def _discard(self, pooled: PooledContainer) -> None:
+        self._remove(pooled)
+        with self._lock:
+            if len(self._idle[pooled.image]) >= self.size:
+                return
+        try:
+            replacement = self._start(pooled.image)
+        except APIError as e:
+            logger.error(f"Failed to start judge container: {e}")
+            return
+        with self._lock:
+            self._idle[pooled.image].append(replacement)
+
+    def _wait_exit_code(self, exec_id: str) -> int:
+        for _ in range(EXIT_CODE_POLL_ATTEMPTS):
+            state = self.client.api.exec_inspect(exec_id)
+            if not state.get("Running"):
+                return state.get("ExitCode") or 0
+            time.sleep(EXIT_CODE_POLL_INTERVAL)
+        return -1
+
+    @staticmethod
+    def _remove(pooled: PooledContainer) -> None:
+        try:
+            pooled.container.remove(force=True)
+        except (APIError, NotFound):
+            pass
+
+
+container_pool = ContainerPool()
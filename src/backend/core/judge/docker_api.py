@@ -0,0 +1,146 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+
+FRAME_HEADER_SIZE = 8
+UPGRADED_STATUSES = (b"101", b"200")
+
+
+class DockerAPIError(Exception):
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"{status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+class AsyncDockerClient:
+    def __init__(self, socket_path: str, api_version: str):
+        self.socket_path = socket_path
+        self.prefix = f"/v{api_version}"
+        self._http: httpx.AsyncClient | None = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=self.socket_path),
+                base_url=f"http://docker{self.prefix}",
+                timeout=30,
+            )
+        return self._http
+
+    async def create_container(self, config: dict) -> str:
+        response = await self._request("POST", "/containers/create", json=config)
+        return response.json()["Id"]
+
+    async def start_container(self, container_id: str) -> None:
+        await self._request("POST", f"/containers/{container_id}/start")
+
+    async def update_container(self, container_id: str, memory: int) -> None:
+        await self._request(
+            "POST",
+            f"/containers/{container_id}/update",
+            json={"Memory": memory, "MemorySwap": memory},
+        )
+
+    async def inspect_container(self, container_id: str) -> dict:
+        response = await self._request("GET", f"/containers/{container_id}/json")
+        return response.json()
+
+    async def remove_container(self, container_id: str) -> None:
+        await self._request(
+            "DELETE", f"/containers/{container_id}", params={"force": "true"}
+        )
+
+    async def exec_create(
+        self,
+        container_id: str,
+        command: list[str],
+        user: str,
+        workdir: str,
+    ) -> str:
+        response = await self._request(
+            "POST",
+            f"/containers/{container_id}/exec",
+            json={
+                "AttachStdin": True,
+                "AttachStdout": True,
+                "AttachStderr": True,
+                "Tty": False,
+                "Cmd": command,
+                "User": user,
+                "WorkingDir": workdir,
+            },
+        )
+        return response.json()["Id"]
+
+    async def exec_inspect(self, exec_id: str) -> dict:
+        response = await self._request("GET", f"/exec/{exec_id}/json")
+        return response.json()
+
+    @asynccontextmanager
+    async def exec_start(
+        self,
+        exec_id: str,
+        stdin: bytes | None,
+    ) -> AsyncIterator[AsyncIterator[tuple[int, bytes]]]:
+        reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        try:
+            body = json.dumps({"Detach": False, "Tty": False}).encode()
+            writer.write(
+                f"POST {self.prefix}/exec/{exec_id}/start HTTP/1.1\r\n"
+                "Host: docker\r\n"
+                "Content-Type: application/json\r\n"
+                "Connection: Upgrade\r\n"
+                "Upgrade: tcp\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+
+            headers = await reader.readuntil(b"\r\n\r\n")
+            status = headers.split(b" ", 2)[1]
+            if status not in UPGRADED_STATUSES:
+                raise DockerAPIError(int(status), headers.decode(errors="replace"))
+
+            if stdin:
+                writer.write(stdin)
+                await writer.drain()
+            writer.write_eof()
+
+            yield self._iter_frames(reader)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        response = await self.http.request(method, path, **kwargs)
+        if response.is_error:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise DockerAPIError(response.status_code, message)
+        return response
+
+    @staticmethod
+    async def _iter_frames(
+        reader: asyncio.StreamReader,
+    ) -> AsyncIterator[tuple[int, bytes]]:
+        while True:
+            try:
+                header = await reader.readexactly(FRAME_HEADER_SIZE)
+            except asyncio.IncompleteReadError:
+                return
+            size = int.from_bytes(header[4:], "big")
+            yield header[0], await reader.readexactly(size)
@@ -0,0 +1,47 @@
+import json
+from logging import getLogger
+
+from redis.exceptions import RedisError
+
+from core.judge.verdict import Verdict
+from core.redis import sync_redis_client
+
+logger = getLogger("judge")
+
+STARTED_EVENT = "started"
+TEST_EVENT = "test"
+VERDICT_EVENT = "verdict"
+
+
+def get_solution_channel(solution_id: int) -> str:
+    return f"judge:solutions:{solution_id}"
+
+
+class SolutionEventPublisher:
+    def __init__(self, solution_id: int):
+        self.channel = get_solution_channel(solution_id)
+
+    def started(self, tests_count: int) -> None:
+        self.publish(STARTED_EVENT, {"tests": tests_count})
+
+    def test_judged(self, test_id: int, verdict: Verdict) -> None:
+        self.publish(
+            TEST_EVENT,
+            {
+                "test_id": test_id,
+                "status": verdict.status.value,
+                "cpu_time_ms": verdict.cpu_time_ms,
+                "peak_memory_kb": verdict.peak_memory_kb,
+            },
+        )
+
+    def finished(self, solution: dict) -> None:
+        self.publish(VERDICT_EVENT, solution)
+
+    def publish(self, event: str, data: dict) -> None:
+        try:
+            sync_redis_client.publish(
+                self.channel, json.dumps({"event": event, "data": data})
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to publish judge event to {self.channel}: {e}")
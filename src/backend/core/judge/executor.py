@@ -0,0 +1,100 @@
+import asyncio
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Sequence, TypeVar
+
+from core.config import settings
+
+T = TypeVar("T")
+
+
+def get_parallelism(requested: int) -> int:
+    available = settings.judge.max_parallelism or os.cpu_count() or 1
+    return max(1, min(requested, available))
+
+
+def run_until_first_failure(
+    jobs: Sequence[Callable[[], T]],
+    is_failure: Callable[[T], bool],
+    parallelism: int = 1,
+) -> list[T]:
+    if parallelism <= 1 or len(jobs) <= 1:
+        results = []
+        for job in jobs:
+            results.append(job())
+            if is_failure(results[-1]):
+                break
+        return results
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(parallelism, len(jobs)), thread_name_prefix="judge"
+    )
+    futures: dict[Future, int] = {
+        executor.submit(job): index for index, job in enumerate(jobs)
+    }
+    results: dict[int, T] = {}
+    cutoff = len(jobs)
+
+    try:
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                if future.cancelled() or index > cutoff:
+                    continue
+                results[index] = future.result()
+                if is_failure(results[index]) and index < cutoff:
+                    cutoff = index
+
+            for future in pending:
+                if futures[future] > cutoff:
+                    future.cancel()
+            pending = {future for future in pending if futures[future] < cutoff}
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return [results[index] for index in range(min(cutoff + 1, len(jobs)))]
+
+
+async def run_until_first_failure_async(
+    jobs: Sequence[Callable[[], Awaitable[T]]],
+    is_failure: Callable[[T], bool],
+    parallelism: int = 1,
+) -> list[T]:
+    slots = asyncio.Semaphore(max(1, parallelism))
+
+    async def run_job(job: Callable[[], Awaitable[T]]) -> T:
+        async with slots:
+            return await job()
+
+    tasks = {
+        asyncio.ensure_future(run_job(job)): index for index, job in enumerate(jobs)
+    }
+    results: dict[int, T] = {}
+    cutoff = len(jobs)
+
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                index = tasks[task]
+                if task.cancelled() or index > cutoff:
+                    continue
+                results[index] = task.result()
+                if is_failure(results[index]) and index < cutoff:
+                    cutoff = index
+
+            for task in pending:
+                if tasks[task] > cutoff:
+                    task.cancel()
+            pending = {task for task in pending if tasks[task] < cutoff}
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return [results[index] for index in range(min(cutoff + 1, len(jobs)))]
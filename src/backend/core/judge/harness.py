@@ -0,0 +1,214 @@
+import io
+import tarfile
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple
+
+from docker.utils import parse_bytes
+
+from core.blob_storage import blob_cache
+from core.config import settings
+from core.judge.checkers import OutputChecker
+from core.judge.container_pool import (
+    TIMEOUT_EXIT_CODE,
+    ContainerPool,
+    PooledContainer,
+)
+from core.judge.runtimes import ARTIFACT_NAME
+from core.judge.sandbox_pool import Sandbox, SandboxPool
+from features.tasks.models import Test
+
+HARNESS_SCRIPT = (Path(__file__).parent / "harness.sh").read_text()
+RECORD_PREFIX = b"@@test"
+RECORD_FIELDS = 8
+OUTPUT_LIMIT_EXIT_CODE = 153
+STDOUT_STREAM = 1
+
+
+class HarnessProtocolError(ValueError):
+    pass
+
+
+class HarnessRecord(NamedTuple):
+    test_id: int
+    exit_code: int
+    time_ms: int
+    cpu_time_ms: int
+    peak_memory_kb: int
+    oom_killed: bool
+    stdout: str
+    stderr: str
+    output_size: int = 0
+    output_matches: bool | None = None
+    output_file: BinaryIO | None = None
+
+    @property
+    def timed_out(self) -> bool:
+        return self.exit_code == TIMEOUT_EXIT_CODE
+
+    @property
+    def output_limit_exceeded(self) -> bool:
+        return self.exit_code == OUTPUT_LIMIT_EXIT_CODE
+
+
+def build_test_archive(tests: list[Test], artifact: bytes | None = None) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        if artifact is not None:
+            _add_file(archive, ARTIFACT_NAME, artifact, 0o555)
+        index = "".join(f"{test.id}\n" for test in tests).encode()
+        _add_file(archive, "tests/index", index)
+        for test in tests:
+            input_data = blob_cache.read(test.input_hash) + b"\n"
+            _add_file(archive, f"tests/{test.id}.in", input_data)
+    return buffer.getvalue()
+
+
+class HarnessRecordParser:
+    def __init__(
+        self,
+        create_checker: Callable[[int], OutputChecker] | None = None,
+        preview_size: int = settings.judge.output_preview_size,
+    ):
+        self.create_checker = create_checker or (
+            lambda _: OutputChecker(self.preview_size)
+        )
+        self.preview_size = preview_size
+        self._buffer = bytearray()
+        self._header: tuple[int, ...] | None = None
+        self._stdout: OutputChecker | None = None
+        self._stderr = bytearray()
+        self._stdout_left = 0
+        self._stderr_left = 0
+
+    def feed(self, stream_id: int, data: bytes) -> list[HarnessRecord]:
+        if stream_id != STDOUT_STREAM or not data:
+            return []
+        buffer = self._buffer
+        buffer += data
+
+        records = []
+        while True:
+            if self._header is None:
+                newline = buffer.find(b"\n")
+                if newline == -1:
+                    break
+                self._start_record(bytes(buffer[:newline]).split())
+                del buffer[: newline + 1]
+
+            if self._stdout_left:
+                chunk = bytes(buffer[: self._stdout_left])
+                del buffer[: len(chunk)]
+                self._stdout_left -= len(chunk)
+                self._stdout.feed(chunk)
+                if self._stdout_left:
+                    break
+
+            if self._stderr_left:
+                chunk = buffer[: self._stderr_left]
+                del buffer[: len(chunk)]
+                self._stderr_left -= len(chunk)
+                self._stderr += chunk[: self.preview_size - len(self._stderr)]
+                if self._stderr_left:
+                    break
+
+            records.append(self._finish_record())
+        return records
+
+    def _start_record(self, header: list[bytes]) -> None:
+        if len(header) != RECORD_FIELDS + 1 or header[0] != RECORD_PREFIX:
+            raise HarnessProtocolError(f"Malformed harness record: {header!r}")
+        try:
+            self._header = tuple(map(int, header[1:]))
+        except ValueError:
+            raise HarnessProtocolError(f"Malformed harness record: {header!r}")
+        test_id, *_, self._stdout_left, self._stderr_left = self._header
+        self._stdout = self.create_checker(test_id)
+        self._stderr = bytearray()
+
+    def _finish_record(self) -> HarnessRecord:
+        (
+            test_id,
+            exit_code,
+            time_ms,
+            cpu_time_ms,
+            peak_memory_kb,
+            oom_killed,
+            _,
+            _,
+        ) = self._header
+        self._header = None
+        return HarnessRecord(
+            test_id=test_id,
+            exit_code=exit_code,
+            time_ms=time_ms,
+            cpu_time_ms=cpu_time_ms,
+            peak_memory_kb=peak_memory_kb,
+            oom_killed=bool(oom_killed),
+            stdout=self._stdout.get_preview(),
+            stderr=self._stderr.decode(errors="replace"),
+            output_size=self._stdout.size,
+            output_matches=self._stdout.finish(),
+            output_file=getattr(self._stdout, "file", None),
+        )
+
+
+def iter_harness_records(
+    frames: Iterable[tuple[int, bytes]],
+    create_checker: Callable[[int], OutputChecker] | None = None,
+) -> Iterator[HarnessRecord]:
+    parser = HarnessRecordParser(create_checker)
+    for stream_id, data in frames:
+        yield from parser.feed(stream_id, data)
+
+
+def get_wall_limit(time_limit: float) -> float:
+    return time_limit * settings.judge.wall_time_factor + 0.5
+
+
+def build_harness_command(command: list[str], time_limit: float) -> list[str]:
+    wall_limit = get_wall_limit(time_limit)
+    return [
+        "sh",
+        "-c",
+        HARNESS_SCRIPT,
+        "harness",
+        f"{int(time_limit * 1000)}",
+        f"{wall_limit}",
+        f"{int(wall_limit * 1000)}",
+        f"{parse_bytes(settings.judge.output_limit)}",
+        *command,
+    ]
+
+
+def get_harness_timeout(tests: list[Test], time_limit: float) -> float:
+    return (get_wall_limit(time_limit) + 1) * len(tests) + 5
+
+
+def run_tests_in_batch(
+    pool: ContainerPool | SandboxPool,
+    pooled: PooledContainer | Sandbox,
+    command: list[str],
+    tests: list[Test],
+    time_limit: float,
+    artifact: bytes | None = None,
+    create_checker: Callable[[int], OutputChecker] | None = None,
+) -> Iterator[HarnessRecord]:
+    with pool.exec_stream(
+        pooled,
+        build_harness_command(command, time_limit),
+        build_test_archive(tests, artifact),
+        get_harness_timeout(tests, time_limit),
+    ) as execution:
+        yield from iter_harness_records(execution.frames, create_checker)
+
+
+def _add_file(
+    archive: tarfile.TarFile,
+    name: str,
+    data: bytes,
+    mode: int = 0o444,
+) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = mode
+    archive.addfile(info, io.BytesIO(data))
@@ -0,0 +1,87 @@
+#!/bin/sh
+# Runs a program over every test shipped as a tar archive on stdin.
+# Usage: sh -c "$(cat harness.sh)" harness <time_limit_ms> <wall_limit> <wall_limit_ms> <output_limit> <command...>
+#
+# CPU time and OOM kills are read from the container's cgroup (v2), peak RSS
+# from GNU time when the runtime image ships it. Without a cgroup (the process
+# sandbox) CPU time falls back to GNU time's user + system time. Output goes to
+# files capped at output_limit bytes; a program writing past the cap gets
+# SIGXFSZ.
+
+time_limit_ms="$1"
+wall_limit="$2"
+wall_limit_ms="$3"
+output_limit="$4"
+shift 4
+
+cgroup=/sys/fs/cgroup
+cpu_rlimit=$(( time_limit_ms / 1000 + 1 ))
+file_rlimit=$(( output_limit / 512 + 1 ))
+cpu_accounting=0
+[ -r "$cgroup/cpu.stat" ] && cpu_accounting=1
+
+cpu_usage() {
+    value=$(sed -n 's/^usage_usec //p' "$cgroup/cpu.stat" 2>/dev/null)
+    echo "${value:-0}"
+}
+
+oom_kills() {
+    value=$(sed -n 's/^oom_kill //p' "$cgroup/memory.events" 2>/dev/null)
+    echo "${value:-0}"
+}
+
+root=/tmp/judge
+mkdir -p "$root/work" "$root/out" || exit 70
+tar -xf - -C "$root" || exit 70
+chmod -R a-w "$root/tests"
+cd "$root/work" || exit 70
+
+if [ -x /usr/bin/time ]; then
+    set -- /usr/bin/time -q -f '%M %U %S' -o "$root/out/peak" "$@"
+fi
+
+while read -r id; do
+    rm -f "$root/out/peak"
+    oom_before=$(oom_kills)
+    cpu_before=$(cpu_usage)
+    start=$(date +%s%N)
+    (
+        ulimit -t "$cpu_rlimit"
+        ulimit -f "$file_rlimit"
+        exec timeout -s KILL "$wall_limit" "$@"
+    ) < "$root/tests/$id.in" > "$root/out/$id.out" 2> "$root/out/$id.err"
+    code=$?
+    end=$(date +%s%N)
+    cpu_after=$(cpu_usage)
+    oom_after=$(oom_kills)
+
+    elapsed_ms=$(( (end - start) / 1000000 ))
+    cpu_ms=$(( (cpu_after - cpu_before) / 1000 ))
+    oom_killed=$(( oom_after > oom_before ))
+    stdout_size=$(wc -c < "$root/out/$id.out")
+    stderr_size=$(wc -c < "$root/out/$id.err")
+    usage=$(tail -n 1 "$root/out/peak" 2>/dev/null)
+    peak_kb=${usage%% *}
+    case "$peak_kb" in
+        ''|*[!0-9]*) peak_kb=0 ;;
+    esac
+    if [ "$cpu_accounting" -eq 0 ]; then
+        cpu_ms=$(echo "$usage" | awk '{ printf "%d", ($2 + $3) * 1000 }')
+    fi
+
+    if [ "$code" -eq 124 ] || [ "$cpu_ms" -gt "$time_limit_ms" ] \
+        || { [ "$code" -eq 137 ] && [ "$elapsed_ms" -ge "$wall_limit_ms" ]; } \
+        || { [ "$code" -eq 137 ] && [ "$cpu_accounting" -eq 0 ] \
+            && [ "$elapsed_ms" -gt "$time_limit_ms" ]; } \
+        || [ "$code" -eq 152 ]; then
+        code=124
+    elif [ "$code" -eq 153 ] || [ "$stdout_size" -gt "$output_limit" ] \
+        || [ "$stderr_size" -gt "$output_limit" ]; then
+        code=153
+    fi
+
+    printf '@@test %s %s %s %s %s %s %s %s\n' "$id" "$code" "$elapsed_ms" \
+        "$cpu_ms" "$peak_kb" "$oom_killed" "$stdout_size" "$stderr_size"
+    cat "$root/out/$id.out" "$root/out/$id.err"
+    rm -f "$root/out/$id.out" "$root/out/$id.err"
+done < "$root/tests/index"
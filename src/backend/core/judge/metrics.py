@@ -0,0 +1,36 @@
+from prometheus_client.core import GaugeMetricFamily, HistogramMetricFamily
+from prometheus_client.registry import Collector
+from redis.exceptions import RedisError
+
+from core.judge.runtimes import RUNTIMES
+from core.judge.scheduler import PRIORITIES, FairShareScheduler, judge_scheduler
+
+
+class JudgeQueueCollector(Collector):
+    def __init__(self, scheduler: FairShareScheduler = judge_scheduler):
+        self.scheduler = scheduler
+
+    def collect(self):
+        depth = GaugeMetricFamily(
+            "judge_queue_depth",
+            "Solutions waiting to be judged",
+            labels=["language", "priority", "space_id"],
+        )
+        wait_time = HistogramMetricFamily(
+            "judge_queue_wait_seconds",
+            "Time between submission and the start of judging",
+            labels=["priority"],
+        )
+        try:
+            for runtime in RUNTIMES:
+                depths = self.scheduler.get_depths(runtime.slug)
+                for (priority, space_id), size in depths.items():
+                    depth.add_metric([runtime.slug, priority, space_id], size)
+            for priority in PRIORITIES:
+                buckets, total = self.scheduler.get_wait_times(priority)
+                wait_time.add_metric([priority], buckets, total)
+        except RedisError:
+            return
+
+        yield depth
+        yield wait_time
@@ -0,0 +1,53 @@
+import hashlib
+
+from core.config import settings
+from core.judge.rejudge import FINISHED_STATUS, PENDING_STATUS, RUNNING_STATUS
+from core.redis import sync_redis_client
+
+FAILED_STATUS = "failed"
+
+
+def get_reference_run_key(task_id: int) -> str:
+    return f"judge:reference:tasks:{task_id}"
+
+
+def get_output_source(reference_code: str, language: str, input_hash: str) -> str:
+    digest = hashlib.sha256()
+    for part in (language, reference_code, input_hash):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_pending_reference_run(task_id: int) -> dict:
+    return {
+        "task_id": task_id,
+        "status": PENDING_STATUS,
+        "total": 0,
+        "generated": 0,
+        "failed": 0,
+        "error": "",
+    }
+
+
+class ReferenceRun:
+    def __init__(self, task_id: int):
+        self.task_id = task_id
+        self.key = get_reference_run_key(task_id)
+
+    def mark_running(self, total: int) -> None:
+        self._update(status=RUNNING_STATUS, total=total, generated=0, failed=0)
+
+    def mark_finished(self, generated: int, failed: int, error: str = "") -> None:
+        self._update(
+            status=FAILED_STATUS if error else FINISHED_STATUS,
+            generated=generated,
+            failed=failed,
+            error=error,
+        )
+
+    def _update(self, **fields) -> None:
+        with sync_redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(self.key, mapping={"task_id": self.task_id, **fields})
+            pipe.expire(self.key, settings.judge.rejudge_progress_ttl)
+            pipe.execute()
@@ -0,0 +1,88 @@
+from itertools import chain
+
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.redis import sync_redis_client
+
+PENDING_STATUS = "pending"
+RUNNING_STATUS = "running"
+FINISHED_STATUS = "finished"
+ACTIVE_STATUSES = (PENDING_STATUS, RUNNING_STATUS)
+JOB_KEY_PREFIX = "judge:rejudge:jobs"
+
+# Hands the task's rejudge slot to a new job and creates its progress in one
+# step, unless the job holding the slot is still pending or running.
+START_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    local status = redis.call('HGET', ARGV[1] .. ':' .. current, 'status')
+    if status == ARGV[2] or status == ARGV[3] then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[2], unpack(ARGV, 6))
+redis.call('SET', KEYS[1], ARGV[4], 'EX', ARGV[5])
+return 1
+"""
+
+
+def get_rejudge_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}:{job_id}"
+
+
+def get_task_rejudge_key(task_id: int) -> str:
+    return f"judge:rejudge:tasks:{task_id}"
+
+
+async def start_task_rejudge(redis: AsyncRedis, task_id: int, progress: dict) -> bool:
+    job_id = progress["job_id"]
+    start = redis.register_script(START_SCRIPT)
+    started = await start(
+        keys=[get_task_rejudge_key(task_id), get_rejudge_key(job_id)],
+        args=[
+            JOB_KEY_PREFIX,
+            *ACTIVE_STATUSES,
+            job_id,
+            settings.judge.rejudge_progress_ttl,
+            *chain.from_iterable(progress.items()),
+        ],
+    )
+    return bool(started)
+
+
+class RejudgeProgress:
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.key = get_rejudge_key(job_id)
+
+    @property
+    def task_id(self) -> int:
+        return int(sync_redis_client.hget(self.key, "task_id"))
+
+    def add_enqueued(self, count: int) -> None:
+        sync_redis_client.hincrby(self.key, "enqueued", count)
+
+    def mark_running(self) -> bool:
+        sync_redis_client.hset(self.key, "status", RUNNING_STATUS)
+        return self._claim_finalization()
+
+    def mark_done(self) -> bool:
+        try:
+            sync_redis_client.hincrby(self.key, "done", 1)
+            return self._claim_finalization()
+        except RedisError:
+            return False
+
+    def mark_finished(self) -> None:
+        sync_redis_client.hset(self.key, "status", FINISHED_STATUS)
+        sync_redis_client.expire(self.key, settings.judge.rejudge_progress_ttl)
+
+    def _claim_finalization(self) -> bool:
+        progress = sync_redis_client.hgetall(self.key)
+        if progress.get("status") != RUNNING_STATUS:
+            return False
+        if int(progress.get("done", 0)) < int(progress.get("enqueued", 0)):
+            return False
+        return bool(sync_redis_client.hsetnx(self.key, "finalizing", 1))
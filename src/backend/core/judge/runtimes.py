@@ -0,0 +1,172 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Callable
+
+import docker
+from docker.errors import ImageNotFound
+
+from core.config import BASE_DIR
+from shared.exceptions.existence import LanguageNotFountException
+
+logger = getLogger("judge")
+
+RUNTIMES_DIR = BASE_DIR / "core/celery/runtimes"
+CONTEXT_HASH_LABEL = "oriole.runtime.context"
+
+ARTIFACT_NAME = "solution"
+ARTIFACT_PATH = f"/tmp/judge/{ARTIFACT_NAME}"
+
+
+@dataclass(frozen=True)
+class Runtime:
+    language: str
+    slug: str
+    image: str
+    build_path: Path
+    command: Callable[[str], list[str]]
+    source_file: str | None = None
+    compile_command: tuple[str, ...] | None = None
+
+    @property
+    def is_compiled(self) -> bool:
+        return self.compile_command is not None
+
+    @property
+    def queue(self) -> str:
+        return f"judge.{self.slug}"
+
+
+RUNTIMES = (
+    Runtime(
+        language="Python",
+        slug="python",
+        image="runner-python:3.9",
+        build_path=RUNTIMES_DIR / "python",
+        command=lambda code: ["python", "-c", code],
+    ),
+    Runtime(
+        language="JavaScript",
+        slug="javascript",
+        image="runner-js:20",
+        build_path=RUNTIMES_DIR / "javascript",
+        command=lambda code: ["node", "-e", code],
+    ),
+    Runtime(
+        language="C++",
+        slug="cpp",
+        image="runner-cpp:13",
+        build_path=RUNTIMES_DIR / "cpp",
+        command=lambda _: [ARTIFACT_PATH],
+        source_file="solution.cpp",
+        compile_command=(
+            "g++",
+            "-O2",
+            "-std=c++17",
+            "-o",
+            ARTIFACT_NAME,
+            "solution.cpp",
+        ),
+    ),
+)
+
+CHECKER_RUNTIME = Runtime(
+    language="Checker",
+    slug="checker",
+    image="runner-cpp:13",
+    build_path=RUNTIMES_DIR / "cpp",
+    command=lambda _: ["./checker"],
+    source_file="checker.cpp",
+    compile_command=(
+        "g++",
+        "-O2",
+        "-std=c++17",
+        "-static",
+        "-o",
+        ARTIFACT_NAME,
+        "checker.cpp",
+    ),
+)
+
+
+def get_context_hash(build_path: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(build_path.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(build_path).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class RuntimeRegistry:
+    def __init__(self, runtimes: tuple[Runtime, ...] = RUNTIMES):
+        self.runtimes = {runtime.language: runtime for runtime in runtimes}
+        self._digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, language: str) -> Runtime:
+        if language not in self.runtimes:
+            raise LanguageNotFountException()
+        return self.runtimes[language]
+
+    def get_image(self, runtime: Runtime) -> str:
+        with self._lock:
+            if runtime.language not in self._digests:
+                client = docker.from_env()
+                try:
+                    self._digests[runtime.language] = self._ensure_image(
+                        client, runtime
+                    )
+                finally:
+                    client.close()
+            return self._digests[runtime.language]
+
+    def prepare(
+        self,
+        languages: list[str] | None = None,
+        rebuild: bool = False,
+    ) -> dict[str, str]:
+        runtimes = [self.get(language) for language in languages or self.runtimes]
+        client = docker.from_env()
+        try:
+            with self._lock:
+                for runtime in runtimes:
+                    self._digests[runtime.language] = self._ensure_image(
+                        client, runtime, rebuild
+                    )
+                return {
+                    runtime.language: self._digests[runtime.language]
+                    for runtime in runtimes
+                }
+        finally:
+            client.close()
+
+    @staticmethod
+    def _ensure_image(
+        client: docker.DockerClient,
+        runtime: Runtime,
+        rebuild: bool = False,
+    ) -> str:
+        context_hash = get_context_hash(runtime.build_path)
+        if not rebuild:
+            try:
+                image = client.images.get(runtime.image)
+                if image.labels.get(CONTEXT_HASH_LABEL) == context_hash:
+                    return image.id
+            except ImageNotFound:
+                pass
+
+        logger.info(f"Building runtime image {runtime.image}")
+        image, _ = client.images.build(
+            path=str(runtime.build_path),
+            dockerfile="Dockerfile",
+            tag=runtime.image,
+            labels={CONTEXT_HASH_LABEL: context_hash},
+            rm=True,
+        )
+        return image.id
+
+
+runtime_registry = RuntimeRegistry()
@@ -0,0 +1,279 @@
+# Runs a command inside a read-only chroot with its own namespaces.
+#
+# Executed as a fresh interpreter so that namespace setup happens in a
+# single-threaded process; only the standard library may be imported here.
+
+import ctypes
+import os
+import platform
+import resource
+import signal
+import struct
+import sys
+
+CLONE_NEWNS = 0x00020000
+CLONE_NEWUTS = 0x04000000
+CLONE_NEWIPC = 0x08000000
+CLONE_NEWPID = 0x20000000
+CLONE_NEWNET = 0x40000000
+
+MS_RDONLY = 0x1
+MS_NOSUID = 0x2
+MS_NODEV = 0x4
+MS_NOEXEC = 0x8
+MS_REMOUNT = 0x20
+MS_BIND = 0x1000
+MS_REC = 0x4000
+MS_PRIVATE = 0x40000
+
+PR_SET_PDEATHSIG = 1
+PR_SET_NO_NEW_PRIVS = 38
+PR_SET_SECCOMP = 22
+SECCOMP_MODE_FILTER = 2
+
+BPF_LD_W_ABS = 0x20
+BPF_JEQ_K = 0x15
+BPF_JGE_K = 0x35
+BPF_RET_K = 0x06
+SECCOMP_RET_KILL_PROCESS = 0x80000000
+SECCOMP_RET_ERRNO = 0x00050000
+SECCOMP_RET_ALLOW = 0x7FFF0000
+X32_SYSCALL_BIT = 0x40000000
+
+DEVICES = ("null", "zero", "random", "urandom")
+SANDBOX_PATH = "/usr/local/bin:/usr/local/sbin:/usr/bin:/usr/sbin:/bin:/sbin"
+SETUP_FAILED_EXIT_CODE = 71
+USAGE = (
+    "usage: sandbox_launcher.py <root> <uid> <mem_limit> <nproc> <nofile>"
+    " <tmpfs_size> -- <command...>"
+)
+
+# Syscalls a judged program has no business making. Everything else is left
+# to the namespaces, the chroot and the unprivileged uid.
+DENIED_SYSCALLS = {
+    "x86_64": (
+        0xC000003E,
+        {
+            "acct": 163,
+            "add_key": 248,
+            "adjtimex": 159,
+            "bpf": 321,
+            "chroot": 161,
+            "clock_settime": 227,
+            "delete_module": 176,
+            "finit_module": 313,
+            "init_module": 175,
+            "ioperm": 173,
+            "iopl": 172,
+            "kexec_file_load": 320,
+            "kexec_load": 246,
+            "keyctl": 250,
+            "lookup_dcookie": 212,
+            "mount": 165,
+            "name_to_handle_at": 303,
+            "open_by_handle_at": 304,
+            "perf_event_open": 298,
+            "pivot_root": 155,
+            "process_vm_readv": 310,
+            "process_vm_writev": 311,
+            "ptrace": 101,
+            "quotactl": 179,
+            "reboot": 169,
+            "request_key": 249,
+            "setns": 308,
+            "settimeofday": 164,
+            "swapoff": 168,
+            "swapon": 167,
+            "syslog": 103,
+            "umount2": 166,
+            "unshare": 272,
+            "userfaultfd": 323,
+        },
+    ),
+    "aarch64": (
+        0xC00000B7,
+        {
+            "acct": 89,
+            "add_key": 217,
+            "adjtimex": 171,
+            "bpf": 280,
+            "chroot": 51,
+            "clock_settime": 112,
+            "delete_module": 106,
+            "finit_module": 273,
+            "init_module": 105,
+            "kexec_file_load": 294,
+            "kexec_load": 104,
+            "keyctl": 219,
+            "lookup_dcookie": 18,
+            "mount": 40,
+            "name_to_handle_at": 264,
+            "open_by_handle_at": 265,
+            "perf_event_open": 241,
+            "pivot_root": 41,
+            "process_vm_readv": 270,
+            "process_vm_writev": 271,
+            "ptrace": 117,
+            "quotactl": 60,
+            "reboot": 142,
+            "request_key": 218,
+            "setns": 268,
+            "settimeofday": 170,
+            "swapoff": 225,
+            "swapon": 224,
+            "syslog": 116,
+            "umount2": 39,
+            "unshare": 97,
+            "userfaultfd": 282,
+        },
+    ),
+}
+
+libc = ctypes.CDLL(None, use_errno=True)
+libc.mount.argtypes = (
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_ulong,
+    ctypes.c_char_p,
+)
+libc.prctl.argtypes = (
+    ctypes.c_int,
+    ctypes.c_ulong,
+    ctypes.c_ulong,
+    ctypes.c_ulong,
+    ctypes.c_ulong,
+)
+
+
+class SockFilterProgram(ctypes.Structure):
+    _fields_ = (("len", ctypes.c_ushort), ("filter", ctypes.c_void_p))
+
+
+def check(result: int, action: str) -> None:
+    if result != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"{action}: {os.strerror(errno)}")
+
+
+def mount(
+    source: str | None,
+    target: str,
+    fstype: str | None,
+    flags: int,
+    data: str | None = None,
+) -> None:
+    check(
+        libc.mount(
+            source and source.encode(),
+            target.encode(),
+            fstype and fstype.encode(),
+            flags,
+            data and data.encode(),
+        ),
+        f"mount {target}",
+    )
+
+
+def build_seccomp_filter() -> bytes:
+    arch, syscalls = DENIED_SYSCALLS[platform.machine()]
+    denied = sorted(syscalls.values())
+    instructions = [
+        (BPF_LD_W_ABS, 0, 0, 4),
+        (BPF_JEQ_K, 1, 0, arch),
+        (BPF_RET_K, 0, 0, SECCOMP_RET_KILL_PROCESS),
+        (BPF_LD_W_ABS, 0, 0, 0),
+        (BPF_JGE_K, len(denied) + 1, 0, X32_SYSCALL_BIT),
+    ]
+    for index, number in enumerate(denied):
+        instructions.append((BPF_JEQ_K, len(denied) - index, 0, number))
+    instructions.append((BPF_RET_K, 0, 0, SECCOMP_RET_ALLOW))
+    instructions.append((BPF_RET_K, 0, 0, SECCOMP_RET_ERRNO | 1))
+    return b"".join(struct.pack("HBBI", *instruction) for instruction in instructions)
+
+
+def install_seccomp_filter(instructions: bytes) -> None:
+    buffer = ctypes.create_string_buffer(instructions)
+    program = SockFilterProgram(len(instructions) // 8, ctypes.addressof(buffer))
+    check(libc.prctl(PR_SET_NO_NEW_PRIVS, 1, 0, 0, 0), "no_new_privs")
+    check(
+        libc.prctl(
+            PR_SET_SECCOMP, SECCOMP_MODE_FILTER, ctypes.addressof(program), 0, 0
+        ),
+        "seccomp",
+    )
+
+
+def prepare_root(root: str, tmpfs_size: str) -> None:
+    mount(None, "/", None, MS_REC | MS_PRIVATE)
+    mount(root, root, None, MS_BIND)
+    mount(None, root, None, MS_REMOUNT | MS_BIND | MS_RDONLY | MS_NOSUID | MS_NODEV)
+    mount(
+        "tmpfs",
+        f"{root}/tmp",
+        "tmpfs",
+        MS_NOSUID | MS_NODEV,
+        f"size={tmpfs_size},mode=1777",
+    )
+    mount("proc", f"{root}/proc", "proc", MS_NOSUID | MS_NODEV | MS_NOEXEC)
+    mount("tmpfs", f"{root}/dev", "tmpfs", MS_NOSUID | MS_NOEXEC, "size=64k,mode=755")
+    for device in DEVICES:
+        target = f"{root}/dev/{device}"
+        open(target, "w").close()
+        mount(f"/dev/{device}", target, None, MS_BIND)
+    os.chroot(root)
+    os.chdir("/tmp")
+
+
+def find_executable(name: str) -> str:
+    if "/" in name:
+        return name
+    for directory in SANDBOX_PATH.split(":"):
+        path = f"{directory}/{name}"
+        if os.access(path, os.X_OK):
+            return path
+    raise FileNotFoundError(2, f"{name}: command not found")
+
+
+def drop_privileges(uid: int, mem_limit: int, nproc: int, nofile: int) -> None:
+    resource.setrlimit(resource.RLIMIT_AS, (mem_limit, mem_limit))
+    resource.setrlimit(resource.RLIMIT_NPROC, (nproc, nproc))
+    resource.setrlimit(resource.RLIMIT_NOFILE, (nofile, nofile))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    os.setgroups([])
+    os.setgid(uid)
+    os.setuid(uid)
+
+
+def run_sandboxed(argv: list[str]) -> None:
+    root, uid, mem_limit, nproc, nofile, tmpfs_size, separator, *command = argv
+    if separator != "--" or not command:
+        raise SystemExit(USAGE)
+
+    seccomp_filter = build_seccomp_filter()
+    check(
+        libc.unshare(
+            CLONE_NEWNS | CLONE_NEWPID | CLONE_NEWNET | CLONE_NEWIPC | CLONE_NEWUTS
+        ),
+        "unshare",
+    )
+    pid = os.fork()
+    if pid:
+        _, status = os.waitpid(pid, 0)
+        code = os.waitstatus_to_exitcode(status)
+        os._exit(128 - code if code < 0 else code)
+
+    try:
+        check(libc.prctl(PR_SET_PDEATHSIG, signal.SIGKILL, 0, 0, 0), "pdeathsig")
+        prepare_root(root, tmpfs_size)
+        drop_privileges(int(uid), int(mem_limit), int(nproc), int(nofile))
+        executable = find_executable(command[0])
+        install_seccomp_filter(seccomp_filter)
+        os.execve(executable, command, {"PATH": SANDBOX_PATH, "HOME": "/tmp"})
+    except OSError as e:
+        print(f"sandbox: {e}", file=sys.stderr)
+        os._exit(SETUP_FAILED_EXIT_CODE)
+
+
+if __name__ == "__main__":
+    run_sandboxed(sys.argv[1:])
@@ -0,0 +1,189 @@
+import os
+import selectors
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from logging import getLogger
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import docker
+from docker.utils import parse_bytes
+
+from core.config import settings
+from core.judge.container_pool import ExecStream
+from core.judge.runtimes import Runtime, runtime_registry
+
+logger = getLogger("judge")
+
+LAUNCHER_PATH = Path(__file__).parent / "sandbox_launcher.py"
+MOUNT_POINTS = ("tmp", "proc", "dev")
+READ_SIZE = 65536
+STDOUT_STREAM = 1
+STDERR_STREAM = 2
+
+
+class Sandbox:
+    def __init__(self, root: Path, uid: int, mem_limit: int):
+        self.root = root
+        self.uid = uid
+        self.mem_limit = mem_limit
+        self.runs = 0
+
+
+class SandboxPool:
+    def __init__(
+        self,
+        root_dir: Path = Path(settings.judge.sandbox_root_dir),
+        uid_base: int = settings.judge.sandbox_uid_base,
+        max_concurrency: int = settings.judge.max_concurrent_runs,
+    ):
+        self.root_dir = root_dir
+        self._uids = deque(range(uid_base, uid_base + max_concurrency))
+        self._slots = threading.Semaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+
+    def warm_up(self, runtime: Runtime) -> None:
+        self.get_root(runtime)
+
+    def get_root(self, runtime: Runtime) -> Path:
+        image = runtime_registry.get_image(runtime)
+        root = self.root_dir / image.removeprefix("sha256:")
+        if root.is_dir():
+            return root
+
+        with self._export_lock:
+            if not root.is_dir():
+                self._export(image, root)
+        return root
+
+    @contextmanager
+    def acquire(self, runtime: Runtime, mem_limit: str) -> Iterator[Sandbox]:
+        root = self.get_root(runtime)
+        with self._slots:
+            with self._lock:
+                uid = self._uids.popleft()
+            try:
+                yield Sandbox(root, uid, parse_bytes(mem_limit))
+            finally:
+                with self._lock:
+                    self._uids.append(uid)
+
+    @contextmanager
+    def exec_stream(
+        self,
+        sandbox: Sandbox,
+        command: list[str],
+        stdin: bytes | None,
+        timeout: float,
+    ) -> Iterator[ExecStream]:
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-I",
+                str(LAUNCHER_PATH),
+                str(sandbox.root),
+                f"{sandbox.uid}",
+                f"{sandbox.mem_limit}",
+                f"{settings.judge.pids_limit}",
+                f"{settings.judge.sandbox_nofile_limit}",
+                settings.judge.tmpfs_size,
+                "--",
+                *command,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        sandbox.runs += 1
+
+        writer = threading.Thread(
+            target=_write_stdin, args=(process.stdin, stdin), daemon=True
+        )
+        writer.start()
+        try:
+            yield ExecStream(
+                frames=_iter_frames(process, time.monotonic() + timeout),
+                exit_code=process.wait,
+            )
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            writer.join()
+            process.stdout.close()
+            process.stderr.close()
+
+    def close(self) -> None:
+        pass
+
+    def _export(self, image: str, root: Path) -> None:
+        logger.info(f"Exporting runtime image {image} to {root}")
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        partial = Path(tempfile.mkdtemp(prefix=f".{root.name}.", dir=self.root_dir))
+        client = docker.from_env()
+        try:
+            container = client.containers.create(image, entrypoint=["true"])
+            try:
+                with tempfile.TemporaryFile() as exported:
+                    for chunk in container.export():
+                        exported.write(chunk)
+                    exported.seek(0)
+                    with tarfile.open(fileobj=exported) as archive:
+                        # The image is built by us, and absolute symlinks inside
+                        # it are resolved within the chroot at run time.
+                        archive.extractall(partial, filter="fully_trusted")
+            finally:
+                container.remove(force=True)
+
+            for mount_point in MOUNT_POINTS:
+                (partial / mount_point).mkdir(exist_ok=True)
+            partial.chmod(0o755)
+            os.rename(partial, root)
+        finally:
+            client.close()
+            shutil.rmtree(partial, ignore_errors=True)
+
+
+def _write_stdin(pipe: BinaryIO, data: bytes | None) -> None:
+    try:
+        if data:
+            pipe.write(data)
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            pipe.close()
+        except BrokenPipeError:
+            pass
+
+
+def _iter_frames(
+    process: subprocess.Popen,
+    deadline: float,
+) -> Iterator[tuple[int, bytes]]:
+    streams = {process.stdout: STDOUT_STREAM, process.stderr: STDERR_STREAM}
+    with selectors.DefaultSelector() as selector:
+        for stream in streams:
+            selector.register(stream, selectors.EVENT_READ)
+
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Sandboxed process timed out")
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fd, READ_SIZE)
+                if not data:
+                    selector.unregister(key.fileobj)
+                    continue
+                yield streams[key.fileobj], data
+
+
+sandbox_pool = SandboxPool()
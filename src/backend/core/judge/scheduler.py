@@ -0,0 +1,192 @@
+import json
+import time
+from typing import NamedTuple
+
+import redis
+
+from core.config import settings
+from core.redis import sync_redis_client
+
+LIVE_PRIORITY = "live"
+REJUDGE_PRIORITY = "rejudge"
+PRACTICE_PRIORITY = "practice"
+PRIORITIES = (LIVE_PRIORITY, REJUDGE_PRIORITY, PRACTICE_PRIORITY)
+
+KEY_PREFIX = "judge:scheduler"
+
+# Weighted fair queueing on two levels: a priority class is picked by its
+# virtual time, then a space inside that class by its own virtual time. A
+# class or space that has just become backlogged starts at the current clock
+# so it cannot claim the time it spent idle. Every runtime has its own set of
+# queues, so that a worker pool only takes the languages it keeps warm.
+ENQUEUE_SCRIPT = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+if not redis.call('ZSCORE', KEYS[2], ARGV[2]) then
+    redis.call('ZADD', KEYS[2], tonumber(redis.call('GET', KEYS[4]) or 0), ARGV[2])
+end
+if not redis.call('ZSCORE', KEYS[3], ARGV[3]) then
+    redis.call('ZADD', KEYS[3], tonumber(redis.call('GET', KEYS[5]) or 0), ARGV[3])
+end
+return redis.call('LLEN', KEYS[1])
+"""
+
+DEQUEUE_SCRIPT = """
+local priority_weights = cjson.decode(ARGV[1])
+local space_weights = cjson.decode(ARGV[2])
+local prefix = ARGV[3]
+while true do
+    local head = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    if #head == 0 then
+        return false
+    end
+    local priority, priority_time = head[1], tonumber(head[2])
+    local spaces_key = prefix .. ':spaces:' .. priority
+    local spaces = redis.call('ZRANGE', spaces_key, 0, 0, 'WITHSCORES')
+    if #spaces == 0 then
+        redis.call('ZREM', KEYS[1], priority)
+    else
+        local space, space_time = spaces[1], tonumber(spaces[2])
+        local queue_key = prefix .. ':queue:' .. priority .. ':' .. space
+        local payload = redis.call('LPOP', queue_key)
+        redis.call('SET', KEYS[2], priority_time)
+        redis.call('SET', prefix .. ':clock:' .. priority, space_time)
+
+        if redis.call('LLEN', queue_key) > 0 then
+            local weight = tonumber(space_weights[space]) or 1
+            redis.call('ZADD', spaces_key, space_time + 1 / weight, space)
+        else
+            redis.call('ZREM', spaces_key, space)
+        end
+        if redis.call('ZCARD', spaces_key) > 0 then
+            local weight = tonumber(priority_weights[priority]) or 1
+            redis.call('ZADD', KEYS[1], priority_time + 1 / weight, priority)
+        else
+            redis.call('ZREM', KEYS[1], priority)
+        end
+
+        if payload then
+            return payload
+        end
+    end
+end
+"""
+
+
+def get_runtime_prefix(slug: str) -> str:
+    return f"{KEY_PREFIX}:{slug}"
+
+
+def get_priorities_key(slug: str) -> str:
+    return f"{get_runtime_prefix(slug)}:priorities"
+
+
+def get_clock_key(slug: str) -> str:
+    return f"{get_runtime_prefix(slug)}:clock"
+
+
+def get_queue_key(slug: str, priority: str, space_id: int | str) -> str:
+    return f"{get_runtime_prefix(slug)}:queue:{priority}:{space_id}"
+
+
+def get_spaces_key(slug: str, priority: str) -> str:
+    return f"{get_runtime_prefix(slug)}:spaces:{priority}"
+
+
+def get_space_clock_key(slug: str, priority: str) -> str:
+    return f"{get_runtime_prefix(slug)}:clock:{priority}"
+
+
+def get_wait_key(priority: str) -> str:
+    return f"{KEY_PREFIX}:wait:{priority}"
+
+
+class ScheduledSolution(NamedTuple):
+    solution_id: int
+    space_id: int
+    priority: str
+    rejudge_job_id: str | None
+    enqueued_at: float
+
+
+class FairShareScheduler:
+    def __init__(
+        self,
+        client: redis.Redis,
+        priority_weights: dict[str, float],
+        space_weights: dict[int, float],
+        wait_buckets: tuple[float, ...],
+    ):
+        self.client = client
+        self.priority_weights = json.dumps(priority_weights)
+        self.space_weights = json.dumps(space_weights)
+        self.wait_buckets = wait_buckets
+        self._enqueue = client.register_script(ENQUEUE_SCRIPT)
+        self._dequeue = client.register_script(DEQUEUE_SCRIPT)
+
+    def enqueue(
+        self,
+        solution_id: int,
+        space_id: int,
+        priority: str,
+        slug: str,
+        rejudge_job_id: str | None = None,
+    ) -> int:
+        scheduled = ScheduledSolution(
+            solution_id, space_id, priority, rejudge_job_id, time.time()
+        )
+        return self._enqueue(
+            keys=[
+                get_queue_key(slug, priority, space_id),
+                get_spaces_key(slug, priority),
+                get_priorities_key(slug),
+                get_space_clock_key(slug, priority),
+                get_clock_key(slug),
+            ],
+            args=[json.dumps(scheduled._asdict()), space_id, priority],
+        )
+
+    def dequeue(self, slug: str) -> ScheduledSolution | None:
+        payload = self._dequeue(
+            keys=[get_priorities_key(slug), get_clock_key(slug)],
+            args=[self.priority_weights, self.space_weights, get_runtime_prefix(slug)],
+        )
+        if payload is None:
+            return None
+
+        scheduled = ScheduledSolution(**json.loads(payload))
+        self._observe_wait(scheduled.priority, time.time() - scheduled.enqueued_at)
+        return scheduled
+
+    def get_depths(self, slug: str) -> dict[tuple[str, str], int]:
+        depths = {}
+        for priority in PRIORITIES:
+            for space_id in self.client.zrange(get_spaces_key(slug, priority), 0, -1):
+                depths[priority, space_id] = self.client.llen(
+                    get_queue_key(slug, priority, space_id)
+                )
+        return depths
+
+    def get_wait_times(self, priority: str) -> tuple[list[tuple[str, int]], float]:
+        observed = self.client.hgetall(get_wait_key(priority))
+        buckets, total = [], 0
+        for bound in (*self.wait_buckets, "+Inf"):
+            total += int(observed.get(str(bound), 0))
+            buckets.append((str(bound), total))
+        return buckets, float(observed.get("sum", 0))
+
+    def _observe_wait(self, priority: str, seconds: float) -> None:
+        bucket = next(
+            (str(bound) for bound in self.wait_buckets if seconds <= bound), "+Inf"
+        )
+        with self.client.pipeline(transaction=False) as pipe:
+            pipe.hincrby(get_wait_key(priority), bucket, 1)
+            pipe.hincrbyfloat(get_wait_key(priority), "sum", seconds)
+            pipe.execute()
+
+
+judge_scheduler = FairShareScheduler(
+    sync_redis_client,
+    settings.judge.priority_weights,
+    settings.judge.space_weights,
+    settings.judge.queue_wait_buckets,
+)
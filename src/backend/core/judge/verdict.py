@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+from shared.enums import SolutionStatusEnum
+
+
+class Verdict(NamedTuple):
+    status: SolutionStatusEnum
+    result: dict | int
+    cpu_time_ms: int = 0
+    peak_memory_kb: int = 0
+
+    @property
+    def is_failed(self) -> bool:
+        return bool(self.result)
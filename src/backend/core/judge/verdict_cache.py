@@ -0,0 +1,84 @@
+import hashlib
+import json
+from logging import getLogger
+
+import redis
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.judge.verdict import Verdict
+from core.redis import sync_redis_client
+from shared.enums import SolutionStatusEnum
+
+logger = getLogger("judge")
+
+KEY_PREFIX = "judge:verdict"
+CACHEABLE_STATUSES = (
+    SolutionStatusEnum.ACCEPTED,
+    SolutionStatusEnum.WRONG_ANSWER,
+    SolutionStatusEnum.RUNTIME_ERROR,
+    SolutionStatusEnum.MEMORY_LIMIT_EXCEEDED,
+    SolutionStatusEnum.OUTPUT_LIMIT_EXCEEDED,
+    SolutionStatusEnum.COMPILATION_ERROR,
+)
+
+
+def get_verdict_key(
+    code: str,
+    runtime_digest: str,
+    task_id: int,
+    tests_version: int,
+    time_limit: int,
+    memory_limit: int,
+    backend: str,
+) -> str:
+    code_hash = hashlib.sha256(code.encode()).hexdigest()
+    return (
+        f"{KEY_PREFIX}:{runtime_digest}:{code_hash}"
+        f":{task_id}:{tests_version}:{time_limit}:{memory_limit}:{backend}"
+    )
+
+
+class VerdictCache:
+    def __init__(self, client: redis.Redis, ttl: int):
+        self.client = client
+        self.ttl = ttl
+
+    def get(self, key: str) -> Verdict | None:
+        try:
+            cached = self.client.get(key)
+        except RedisError as e:
+            logger.warning(f"Verdict cache lookup failed: {e}")
+            return None
+        if cached is None:
+            return None
+
+        verdict = json.loads(cached)
+        return Verdict(
+            status=SolutionStatusEnum(verdict["status"]),
+            result=verdict["result"],
+            cpu_time_ms=verdict.get("cpu_time_ms", 0),
+            peak_memory_kb=verdict.get("peak_memory_kb", 0),
+        )
+
+    def set(self, key: str, verdict: Verdict) -> None:
+        if verdict.status not in CACHEABLE_STATUSES:
+            return
+        try:
+            self.client.set(
+                key,
+                json.dumps(
+                    {
+                        "status": verdict.status.value,
+                        "result": verdict.result,
+                        "cpu_time_ms": verdict.cpu_time_ms,
+                        "peak_memory_kb": verdict.peak_memory_kb,
+                    }
+                ),
+                ex=self.ttl,
+            )
+        except RedisError as e:
+            logger.warning(f"Verdict cache update failed: {e}")
+
+
+verdict_cache = VerdictCache(sync_redis_client, settings.judge.verdict_cache_ttl)
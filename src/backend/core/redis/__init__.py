@@ -1,4 +1,7 @@
-__all__ = ("redis_connection",)
+__all__ = (
+    "redis_connection",
+    "sync_redis_client",
+)
 
 
-from .connection import redis_connection
+from .connection import redis_connection, sync_redis_client
@@ -1,3 +1,4 @@
+import redis as sync_redis
 import redis.asyncio as redis
 from core.config import settings
 
@@ -16,3 +17,9 @@ class RedisConnection:
 
 
 redis_connection = RedisConnection(settings.redis.get_storage_uri())
+
+sync_redis_client = sync_redis.Redis.from_url(
+    settings.redis.get_storage_uri(),
+    decode_responses=True,
+    socket_timeout=settings.redis.socket_timeout,
+)
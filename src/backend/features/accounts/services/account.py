@@ -6,6 +6,7 @@ import features.groups.crud.group_invite as group_invite_crud
 import features.spaces.crud.space_join_request as space_join_request_crud
 import features.spaces.mappers as space_mapper
 import features.users.crud.user_profile as user_profile_crud
+from core.cache import get_collection_tag, invalidate_tags, space_tag
 from features.accounts.schemas import (
     AccountRole,
     AccountRead,
@@ -109,6 +110,7 @@ async def remove_user_from_space(
 
     await account_crud.delete_solutions_by_account_id(session, remove_account.id)
     await account_crud.delete_account(session, remove_account)
+    await invalidate_tags(space_tag(space_id), get_collection_tag("groups"))
 
 
 async def leave_from_space(
@@ -138,6 +140,7 @@ async def leave_from_space(
                 new_owner.role = AccountRole.OWNER
 
     await account_crud.delete_account(session, account)
+    await invalidate_tags(space_tag(space_id), get_collection_tag("groups"))
 
 
 async def join_to_group(
@@ -178,6 +181,9 @@ async def join_to_group(
         await account_crud.create_account(
             session, user_id, group_invite.space_id, AccountRole.MEMBER.value
         )
+        await invalidate_tags(
+            space_tag(group_invite.space_id), get_collection_tag("groups")
+        )
 
         return space_mapper.build_space_join_status_read(
             SpaceJoinStatusEnum.JOINED, user_id, group_invite.space_id
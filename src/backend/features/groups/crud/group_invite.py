@@ -5,8 +5,6 @@ from typing import Any
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.config import settings
-from database import DbHelper
 from features.groups.models import GroupInvite
 from features.groups.schemas import GroupInviteCreate
 from utils import get_current_utc
@@ -94,25 +92,20 @@ async def update_group_invite(
     return group_invite
 
 
-async def update_group_invites_activity():
-    local_db_helper = DbHelper(url=str(settings.db.url))
+async def update_group_invites_activity(session: AsyncSession) -> None:
+    group_invites = await get_group_invites(session)
 
-    async with local_db_helper.session_factory() as session:
-        group_invites = await get_group_invites(session)
+    updated = False
+    for group_invite in group_invites:
+        if group_invite.expires_at is None:
+            continue
+        new_status = group_invite.expires_at >= get_current_utc()
+        if group_invite.is_active != new_status:
+            group_invite.is_active = new_status
+            updated = True
 
-        updated = False
-        for group_invite in group_invites:
-            if group_invite.expires_at is None:
-                continue
-            new_status = group_invite.expires_at >= get_current_utc()
-            if group_invite.is_active != new_status:
-                group_invite.is_active = new_status
-                updated = True
-
-        if updated:
-            await session.commit()
-
-        await local_db_helper.dispose()
+    if updated:
+        await session.commit()
 
 
 async def increment_group_invite_user_usages_count(
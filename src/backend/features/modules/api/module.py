@@ -3,10 +3,12 @@ from http import HTTPStatus
 from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_policy
 from database import db_helper
 from features.modules.schemas import ModuleCreate, ModuleUpdate
 from features.modules.services import module as service
 from features.users.services.auth import get_current_active_auth_user_id
+from shared.enums import CacheScopeEnum
 from utils.response_func import create_json_response
 from utils.schemas import SuccessResponse, SuccessListResponse
 
@@ -32,6 +34,7 @@ async def create_module(
     response_model=SuccessResponse,
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=60, scope=CacheScopeEnum.USER)
 async def get_module(
     module_id: int,
     session: AsyncSession = Depends(db_helper.dependency_session_getter),
@@ -47,6 +50,7 @@ async def get_module(
     response_model=list[SuccessListResponse],
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=60, scope=CacheScopeEnum.USER)
 async def get_user_modules(
     request: Request,
     is_active: bool | None = None,
@@ -3,8 +3,6 @@ from typing import Any
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.config import settings
-from database import DbHelper
 from features.modules.models import Module
 from features.modules.schemas import ModuleCreate
 from utils import get_current_utc
@@ -77,25 +75,18 @@ async def update_module(
     return module
 
 
-async def update_modules_activity():
-    local_db_helper = DbHelper(url=str(settings.db.url))
+async def update_modules_activity(session: AsyncSession) -> None:
+    modules = await get_modules(session)
 
-    async with local_db_helper.session_factory() as session:
-        modules = await get_modules(session)
+    updated = False
+    for module in modules:
+        new_status = module.start_datetime <= get_current_utc() <= module.end_datetime
+        if module.is_active != new_status:
+            module.is_active = new_status
+            updated = True
 
-        updated = False
-        for module in modules:
-            new_status = (
-                module.start_datetime <= get_current_utc() <= module.end_datetime
-            )
-            if module.is_active != new_status:
-                module.is_active = new_status
-                updated = True
-
-        if updated:
-            await session.commit()
-
-        await local_db_helper.dispose()
+    if updated:
+        await session.commit()
 
 
 async def increment_module_tasks_count(
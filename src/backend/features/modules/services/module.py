@@ -8,6 +8,7 @@ import features.modules.mappers as mapper
 import features.solutions.crud.base as solution_crud
 import features.tasks.crud.account_task_progress as task_progress_crud
 import features.tasks.crud.base as task_crud
+from core.cache import invalidate_tags, space_tag, tag_response, task_tag
 from features.groups.validators import check_user_is_admin_or_owner, get_account_or_404
 from features.modules.schemas import ModuleCreate, ModuleRead, ModuleUpdate
 from features.modules.schemas.module import (
@@ -38,6 +39,7 @@ async def create_module(
     check_end_time_is_after_start_time(module_in.start_datetime, module_in.end_datetime)
 
     module = await module_crud.create_module(session, module_in, account.id)
+    await invalidate_tags(space_tag(module.space_id))
 
     return mapper.build_module_read_with_progress(module)
 
@@ -51,6 +53,7 @@ async def get_module(
     module = await get_module_or_404(session, module_id)
     _ = await get_space_or_404(session, module.space_id)
     account = await get_account_or_404(session, user_id, module.space_id)
+    tag_response(space_tag(module.space_id))
 
     account_module_progress = await module_progress_crud.get_account_module_progress_by_account_id_and_module_id(
         session, account.id, module_id
@@ -141,6 +144,7 @@ async def update_module(
         check_end_time_is_after_start_time(start, end)
 
     module = await module_crud.update_module(session, module, update_data)
+    await invalidate_tags(space_tag(module.space_id))
     account_module_progress = await module_progress_crud.get_account_module_progress_by_account_id_and_module_id(
         session, account.id, module_id
     )
@@ -170,3 +174,6 @@ async def delete_module(
         session, module_id
     )
     await module_crud.delete_module(session, module)
+    await invalidate_tags(
+        space_tag(module.space_id), *(task_tag(task.id) for task in tasks)
+    )
@@ -14,9 +14,14 @@ class CodeSolution(BaseSolution):
         ForeignKey("solutions.id", ondelete="CASCADE"), primary_key=True
     )
     code: Mapped[str] = mapped_column(default="")
+    language: Mapped[str] = mapped_column(
+        String(32), default="Python", server_default="Python"
+    )
     status: Mapped[str] = mapped_column(
         String, nullable=False, server_default=SolutionStatusEnum.SUBMITTING.value
     )
+    cpu_time_ms: Mapped[int | None] = mapped_column(nullable=True)
+    peak_memory_kb: Mapped[int | None] = mapped_column(nullable=True)
 
     def get_validation_schema(self) -> CodeSolutionRead:
         return CodeSolutionRead.model_validate(self)
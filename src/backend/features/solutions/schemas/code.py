@@ -10,6 +10,7 @@ from features.solutions.schemas.solution_feedback import SolutionFeedbackRead
 
 class CodeSolutionBase(BaseSolutionModel):
     code: str
+    language: str = "Python"
 
 
 class CodeSolutionCreate(CodeSolutionBase, BaseSolutionCreate):
@@ -18,6 +19,8 @@ class CodeSolutionCreate(CodeSolutionBase, BaseSolutionCreate):
 
 class CodeSolutionRead(CodeSolutionBase, BaseSolutionRead):
     status: str
+    cpu_time_ms: int | None = None
+    peak_memory_kb: int | None = None
 
     def to_with_feedbacks(
         self, feedbacks: list[SolutionFeedbackRead]
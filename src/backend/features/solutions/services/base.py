@@ -1,8 +1,16 @@
+import json
+import time
+from typing import AsyncIterator
+
+from redis.asyncio.client import PubSub
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import features.solutions.crud.base as base_solution_crud
 import features.solutions.crud.solution_feedback as solution_feedback_crud
 import features.solutions.mappers as solution_mapper
+from core.config import settings
+from core.judge.events import VERDICT_EVENT, get_solution_channel
+from core.redis import redis_connection
 from features.groups.validators import check_user_is_admin_or_owner, get_account_or_404
 from features.modules.validators import get_module_or_404
 from features.solutions.schemas import BaseSolutionRead
@@ -11,6 +19,8 @@ from features.solutions.validators.membership import check_user_is_creator_of_so
 from features.spaces.validators import get_space_or_404
 from features.tasks.models import BaseTask
 from features.tasks.validators import get_task_or_404
+from shared.enums import SolutionStatusEnum
+from utils.response_func import format_server_sent_event
 
 
 async def get_solution(
@@ -85,3 +95,53 @@ async def delete_solution(
     check_user_is_admin_or_owner(account.role)
 
     await base_solution_crud.delete_solution(session, solution)
+
+
+async def stream_solution_events(
+    session: AsyncSession,
+    user_id: int,
+    solution_id: int,
+) -> AsyncIterator[str]:
+    solution = await get_solution_or_404(session, solution_id)
+    task = await get_task_or_404(session, solution.task_id)
+    module = await get_module_or_404(session, task.module_id)
+    _ = await get_space_or_404(session, module.space_id)
+    account = await get_account_or_404(session, user_id, module.space_id)
+
+    check_user_is_creator_of_solution(account, solution)
+
+    pubsub = redis_connection.redis.pubsub()
+    await pubsub.subscribe(get_solution_channel(solution_id))
+
+    await session.refresh(solution)
+    if getattr(solution, "status", None) == SolutionStatusEnum.SUBMITTING.value:
+        return _iter_judge_events(pubsub)
+    return _iter_judge_events(pubsub, solution.get_validation_schema())
+
+
+async def _iter_judge_events(
+    pubsub: PubSub,
+    solution: BaseSolutionRead | None = None,
+) -> AsyncIterator[str]:
+    try:
+        if solution is not None:
+            yield format_server_sent_event(VERDICT_EVENT, solution.model_dump_json())
+            return
+
+        deadline = time.monotonic() + settings.judge.events_stream_timeout
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=settings.judge.events_keepalive,
+            )
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+
+            event = json.loads(message["data"])
+            yield format_server_sent_event(event["event"], json.dumps(event["data"]))
+            if event["event"] == VERDICT_EVENT:
+                return
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
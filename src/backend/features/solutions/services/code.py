@@ -3,7 +3,9 @@ from typing import cast
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import features.solutions.crud.code as code_solution_crud
-from core.celery.code_check_task import check_code
+import features.tasks.crud.account_task_progress as progress_crud
+from core.celery.code_check_task import schedule_solution
+from core.judge.scheduler import LIVE_PRIORITY, PRACTICE_PRIORITY
 from features.groups.validators import get_account_or_404, get_group_or_404
 from features.modules.validators import get_module_or_404
 from features.solutions.schemas import CodeSolutionCreate, CodeSolutionRead
@@ -14,6 +16,7 @@ from features.solutions.validators import (
 from features.tasks.models import CodeTask
 from features.tasks.validators import get_task_or_404
 from features.tasks.validators.existence import get_tests_or_404
+from utils.code_check import get_runtime_or_404
 
 
 async def create_code_solution(
@@ -26,8 +29,15 @@ async def create_code_solution(
     _ = await get_group_or_404(session, module.space_id)
     account = await get_account_or_404(session, user_id, module.space_id)
     _ = await get_tests_or_404(session, task.id)
+    runtime = get_runtime_or_404(solution_in.language)
 
     await validate_solution_before_creation(session, account.id, task)
+    account_task_progress = (
+        await progress_crud.get_account_task_progress_by_account_id_and_task_id(
+            session, account.id, task.id
+        )
+    )
+    priority = PRACTICE_PRIORITY if account_task_progress.is_correct else LIVE_PRIORITY
 
     solution = await code_solution_crud.create_solution(
         session, solution_in, account.id
@@ -35,6 +45,6 @@ async def create_code_solution(
 
     await validate_solution_after_creation(session, account.id, task, solution)
 
-    check_code.delay(solution.id)
+    schedule_solution(solution.id, module.space_id, priority, runtime.language)
 
     return solution.get_validation_schema()
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import features.solutions.crud.solution_feedback as solution_feedback_crud
+from core.cache import invalidate_tags, solution_tag
 from features.groups.validators import get_account_or_404, check_user_is_admin_or_owner
 from features.modules.validators import get_module_or_404
 from features.solutions.mappers import build_base_solution_feedback_read_list
@@ -34,6 +35,7 @@ async def create_solution_feedback(
     solution_feedback = await solution_feedback_crud.create_solution_feedback(
         session, solution_feedback_create, solution_id, account.id
     )
+    await invalidate_tags(solution_tag(solution_id))
 
     return solution_feedback.get_validation_schema()
 
@@ -94,6 +96,7 @@ async def update_solution_feedback(
     solution_feedback = await solution_feedback_crud.update_solution_feedback(
         session, solution_feedback, update_data
     )
+    await invalidate_tags(solution_tag(solution.id))
 
     return solution_feedback.get_validation_schema()
 
@@ -115,3 +118,4 @@ async def delete_solution_feedback(
     check_user_is_admin_or_owner(account.role)
 
     await solution_feedback_crud.delete_solution_feedback(session, solution_feedback)
+    await invalidate_tags(solution_tag(solution.id))
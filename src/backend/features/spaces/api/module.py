@@ -3,9 +3,11 @@ from http import HTTPStatus
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_policy
 from database import db_helper
 from features.modules.services import module as service
 from features.users.services.auth import get_current_active_auth_user_id
+from shared.enums import CacheScopeEnum
 from utils.response_func import create_json_response
 from utils.schemas import SuccessListResponse
 
@@ -17,6 +19,7 @@ router = APIRouter()
     response_model=SuccessListResponse,
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=60, scope=CacheScopeEnum.USER)
 async def get_modules_in_space(
     space_id: int,
     request: Request,
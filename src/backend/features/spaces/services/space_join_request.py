@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import features.accounts.crud.account as account_crud
 import features.spaces.crud.space_join_request as space_join_request_crud
+from core.cache import get_collection_tag, invalidate_tags, space_tag
 from features.accounts.schemas import AccountRole
 from features.groups.validators import (
     get_account_or_404,
@@ -79,6 +80,9 @@ async def update_space_join_request(
             space_join_request.space_id,
             AccountRole.MEMBER.value,
         )
+        await invalidate_tags(
+            space_tag(space_join_request.space_id), get_collection_tag("groups")
+        )
 
     return space_join_request.get_validation_schema()
 
@@ -115,6 +119,12 @@ async def update_space_join_requests_in_space(
                 session, updated.user_id, updated.space_id, AccountRole.MEMBER.value
             )
 
+    if any(
+        request.status == SpaceJoinRequestStatusEnum.APPROVED
+        for request in updated_requests
+    ):
+        await invalidate_tags(space_tag(space_id), get_collection_tag("groups"))
+
     return [
         space_join_request.get_validation_schema()
         for space_join_request in updated_requests
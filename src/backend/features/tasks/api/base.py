@@ -3,13 +3,15 @@ from http import HTTPStatus
 from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_policy
 from database import db_helper
 from features.solutions.schemas import SolutionFeedbackCreate, SolutionFeedbackUpdate
 from features.solutions.services import base as solution_service
 from features.solutions.services import solution_feedback as solution_feedback_service
 from features.tasks.services import base as task_service
 from features.users.services.auth import get_current_active_auth_user_id
-from utils.response_func import create_json_response
+from shared.enums import CacheScopeEnum
+from utils.response_func import create_event_stream_response, create_json_response
 from utils.schemas import SuccessListResponse, SuccessResponse
 
 router = APIRouter()
@@ -20,6 +22,7 @@ router = APIRouter()
     response_model=SuccessResponse,
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=60, scope=CacheScopeEnum.USER)
 async def get_task(
     task_id: int,
     include: list[str] | None = Query(None),
@@ -35,6 +38,7 @@ async def get_task(
     response_model=SuccessListResponse,
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=60, scope=CacheScopeEnum.USER)
 async def get_user_tasks(
     request: Request,
     is_active: bool | None = None,
@@ -70,6 +74,7 @@ async def delete_task(
     response_model=SuccessResponse,
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=0)
 async def get_solution(
     solution_id: int,
     include: list[str] | None = Query(None),
@@ -80,11 +85,28 @@ async def get_solution(
     return create_json_response(data=data)
 
 
+@router.get(
+    "/solutions/{solution_id}/events/",
+    status_code=HTTPStatus.OK,
+)
+@cache_policy(ttl=0)
+async def stream_solution_events(
+    solution_id: int,
+    session: AsyncSession = Depends(db_helper.dependency_session_getter),
+    user_id: int = Depends(get_current_active_auth_user_id),
+):
+    events = await solution_service.stream_solution_events(
+        session, user_id, solution_id
+    )
+    return create_event_stream_response(events)
+
+
 @router.get(
     "/{task_id}/solutions/",
     response_model=SuccessListResponse,
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=0)
 async def get_solutions_in_task(
     request: Request,
     task_id: int,
@@ -108,6 +130,7 @@ async def get_solutions_in_task(
     response_model=SuccessListResponse,
     status_code=HTTPStatus.OK,
 )
+@cache_policy(ttl=0)
 async def get_user_solutions(
     request: Request,
     task_id: int,
@@ -1,11 +1,12 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, File, Request, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import features.solutions.services.code as solution_service
 import features.tasks.services.code as task_service
 import features.tasks.services.test as test_service
+from core.cache import cache_policy
 from database import db_helper
 from features.solutions.schemas import CodeSolutionCreate
 from features.tasks.schemas import (
@@ -51,6 +52,64 @@ async def update_code_task(
     return create_json_response(data=data)
 
 
+@router.post(
+    "/{task_id}/rejudge/",
+    response_model=SuccessResponse,
+    status_code=HTTPStatus.CREATED,
+)
+async def start_code_task_rejudge(
+    task_id: int,
+    session: AsyncSession = Depends(db_helper.dependency_session_getter),
+    user_id: int = Depends(get_current_active_auth_user_id),
+):
+    data = await task_service.start_code_task_rejudge(session, user_id, task_id)
+    return create_json_response(data=data)
+
+
+@router.get(
+    "/{task_id}/rejudge/",
+    response_model=SuccessResponse,
+    status_code=HTTPStatus.OK,
+)
+@cache_policy(ttl=0)
+async def get_code_task_rejudge(
+    task_id: int,
+    session: AsyncSession = Depends(db_helper.dependency_session_getter),
+    user_id: int = Depends(get_current_active_auth_user_id),
+):
+    data = await task_service.get_code_task_rejudge(session, user_id, task_id)
+    return create_json_response(data=data)
+
+
+@router.post(
+    "/{task_id}/reference/",
+    response_model=SuccessResponse,
+    status_code=HTTPStatus.CREATED,
+)
+async def start_code_task_reference_run(
+    task_id: int,
+    session: AsyncSession = Depends(db_helper.dependency_session_getter),
+    user_id: int = Depends(get_current_active_auth_user_id),
+):
+    data = await task_service.start_code_task_reference_run(session, user_id, task_id)
+    return create_json_response(data=data)
+
+
+@router.get(
+    "/{task_id}/reference/",
+    response_model=SuccessResponse,
+    status_code=HTTPStatus.OK,
+)
+@cache_policy(ttl=0)
+async def get_code_task_reference_run(
+    task_id: int,
+    session: AsyncSession = Depends(db_helper.dependency_session_getter),
+    user_id: int = Depends(get_current_active_auth_user_id),
+):
+    data = await task_service.get_code_task_reference_run(session, user_id, task_id)
+    return create_json_response(data=data)
+
+
 @router.post(
     "/tests",
     status_code=HTTPStatus.CREATED,
@@ -65,6 +124,25 @@ async def create_test(
     return create_json_response(data=data)
 
 
+@router.post(
+    "/{task_id}/tests/upload",
+    status_code=HTTPStatus.CREATED,
+    response_model=SuccessResponse,
+)
+async def upload_tests(
+    task_id: int,
+    archive: UploadFile = File(...),
+    is_public: bool = Form(False),
+    replace: bool = Form(False),
+    session: AsyncSession = Depends(db_helper.dependency_session_getter),
+    user_id: int = Depends(get_current_active_auth_user_id),
+):
+    data = await test_service.upload_tests(
+        session, user_id, task_id, archive.file, is_public, replace
+    )
+    return create_json_response(data=data)
+
+
 @router.get(
     "/tests/{test_id}",
     response_model=SuccessResponse,
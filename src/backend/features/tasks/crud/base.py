@@ -3,8 +3,6 @@ from typing import Type, Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.config import settings
-from database import DbHelper
 from features.tasks.models import BaseTask
 from utils import get_current_utc
 
@@ -63,23 +61,18 @@ async def update_task(
     return task
 
 
-async def update_tasks_activity():
-    local_db_helper = DbHelper(url=str(settings.db.url))
+async def update_tasks_activity(session: AsyncSession) -> None:
+    tasks = await get_tasks(session)
 
-    async with local_db_helper.session_factory() as session:
-        tasks = await get_tasks(session)
+    updated = False
+    for task in tasks:
+        new_status = task.start_datetime <= get_current_utc() <= task.end_datetime
+        if task.is_active != new_status:
+            task.is_active = new_status
+            updated = True
 
-        updated = False
-        for task in tasks:
-            new_status = task.start_datetime <= get_current_utc() <= task.end_datetime
-            if task.is_active != new_status:
-                task.is_active = new_status
-                updated = True
-
-        if updated:
-            await session.commit()
-
-        await local_db_helper.dispose()
+    if updated:
+        await session.commit()
 
 
 async def delete_task(
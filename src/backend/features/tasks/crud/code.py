@@ -1,5 +1,7 @@
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from features.solutions.models import CodeSolution
 from features.tasks.models import CodeTask
 from features.tasks.schemas import CodeTaskCreate
 from utils import get_current_utc
@@ -20,3 +22,22 @@ async def create_code_task(
     await session.commit()
     await session.refresh(task)
     return task
+
+
+async def bump_tests_version(
+    session: AsyncSession,
+    task_id: int,
+) -> None:
+    stmt = (
+        update(CodeTask)
+        .where(CodeTask.id == task_id)
+        .values(tests_version=CodeTask.tests_version + 1)
+    )
+    await session.execute(stmt)
+
+
+async def count_code_solutions(session: AsyncSession, task_id: int) -> int:
+    result = await session.execute(
+        select(func.count(CodeSolution.id)).where(CodeSolution.task_id == task_id)
+    )
+    return result.scalar_one()
@@ -1,32 +1,96 @@
+import asyncio
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.blob_storage import BlobRef, blob_storage
+from features.tasks.crud.code import bump_tests_version
 from features.tasks.models import Test
 from features.tasks.schemas import TestCreate
+from utils.test_archive import ArchivedTest
+from utils.test_output import normalize_output
+
+
+async def put_test_payload(data: str | None) -> BlobRef:
+    return await asyncio.to_thread(blob_storage.put, (data or "").encode())
+
+
+async def put_test_output(data: str | None) -> BlobRef:
+    return await asyncio.to_thread(
+        blob_storage.put, normalize_output((data or "").encode())
+    )
+
+
+async def get_test_payload(digest: str, size: int | None = None) -> str:
+    data = await asyncio.to_thread(blob_storage.read, digest, size)
+    return data.decode(errors="replace")
 
 
 async def create_test(
     session: AsyncSession,
     test_in: TestCreate,
 ) -> Test:
+    input_blob = await put_test_payload(test_in.input_data)
+    output_blob = await put_test_output(test_in.correct_output)
     test = Test(
-        **test_in.model_dump(),
+        **test_in.model_dump(exclude={"input_data", "correct_output"}),
+        input_hash=input_blob.digest,
+        input_size=input_blob.size,
+        output_hash=output_blob.digest,
+        output_size=output_blob.size,
     )
     session.add(test)
+    await bump_tests_version(session, test.task_id)
     await session.commit()
     await session.refresh(test)
     return test
 
 
+async def create_tests(
+    session: AsyncSession,
+    task_id: int,
+    archived_tests: list[ArchivedTest],
+    is_public: bool,
+    replace: bool = False,
+) -> list[int]:
+    if replace:
+        await session.execute(delete(Test).where(Test.task_id == task_id))
+    result = await session.execute(
+        insert(Test).returning(Test.id, sort_by_parameter_order=True),
+        [
+            {
+                "task_id": task_id,
+                "is_public": is_public,
+                "input_hash": test.input_blob.digest,
+                "input_size": test.input_blob.size,
+                "output_hash": test.output_blob.digest,
+                "output_size": test.output_blob.size,
+            }
+            for test in archived_tests
+        ],
+    )
+    test_ids = list(result.scalars().all())
+    await bump_tests_version(session, task_id)
+    await session.commit()
+    return test_ids
+
+
 async def update_test(
     session: AsyncSession,
     test: Test,
     test_update: dict[str, Any],
 ) -> Test:
+    if "input_data" in test_update:
+        input_blob = await put_test_payload(test_update.pop("input_data"))
+        test.input_hash, test.input_size = input_blob
+    if "correct_output" in test_update:
+        output_blob = await put_test_output(test_update.pop("correct_output"))
+        test.output_hash, test.output_size = output_blob
+        test.output_source = None
     for key, value in test_update.items():
         setattr(test, key, value)
+    await bump_tests_version(session, test.task_id)
     await session.commit()
     await session.refresh(test)
     return test
@@ -55,4 +119,5 @@ async def delete_test(
     test: Test,
 ) -> None:
     await session.delete(test)
+    await bump_tests_version(session, test.task_id)
     await session.commit()
@@ -8,12 +8,29 @@ __all__ = [
     "InvalidStringMatchTaskWithNumberConfiguration",
     "InvalidStringMatchTaskWithStringConfiguration",
     "TaskHasNoTests",
+    "InvalidTestArchive",
+    "RejudgeNotFoundException",
     "TestIsNotPublic",
+    "RejudgeAlreadyRunning",
+    "CustomCheckerCodeRequired",
+    "ReferenceRunNotFoundException",
+    "ReferenceSolutionRequired",
+    "CorrectOutputRequired",
 ]
-from .existence import TaskHasNoTests, TaskNotFoundException
+from .existence import (
+    InvalidTestArchive,
+    ReferenceRunNotFoundException,
+    RejudgeNotFoundException,
+    TaskHasNoTests,
+    TaskNotFoundException,
+)
 from .rules import (
     InvalidStringMatchTaskWithNumberConfiguration,
+    CorrectOutputRequired,
+    CustomCheckerCodeRequired,
     InvalidStringMatchTaskWithStringConfiguration,
+    ReferenceSolutionRequired,
+    RejudgeAlreadyRunning,
     TaskAlreadySolved,
     TaskCounterLimitExceededException,
     TaskInactiveException,
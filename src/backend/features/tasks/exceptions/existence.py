@@ -7,3 +7,15 @@ class TaskNotFoundException(NotFoundException):
 
 class TaskHasNoTests(BadRequest):
     detail: str = "Task has no tests"
+
+
+class RejudgeNotFoundException(NotFoundException):
+    detail: str = "Rejudge not found"
+
+
+class InvalidTestArchive(BadRequest):
+    detail: str = "Invalid test archive"
+
+
+class ReferenceRunNotFoundException(NotFoundException):
+    detail: str = "Reference solution run not found"
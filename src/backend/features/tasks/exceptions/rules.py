@@ -1,4 +1,6 @@
-from shared.exceptions import InactiveObjectException, RuleException
+from http import HTTPStatus
+
+from shared.exceptions import AppException, InactiveObjectException, RuleException
 
 
 class TaskInactiveException(InactiveObjectException):
@@ -27,3 +29,20 @@ class InvalidStringMatchTaskWithStringConfiguration(RuleException):
     detail: str = (
         "If compare_as_number is False, string comparison options must be explicitly set"
     )
+
+
+class RejudgeAlreadyRunning(AppException):
+    status_code: int = HTTPStatus.CONFLICT
+    detail: str = "Rejudge of this task is already running"
+
+
+class CustomCheckerCodeRequired(RuleException):
+    detail: str = "Custom checker mode requires checker code"
+
+
+class ReferenceSolutionRequired(RuleException):
+    detail: str = "Task has no reference solution"
+
+
+class CorrectOutputRequired(RuleException):
+    detail: str = "Correct output is required when the task has no reference solution"
@@ -5,6 +5,7 @@ __all__ = [
     "build_code_task_read_with_progress",
     "build_multiple_choice_task_read_with_progress",
     "build_string_match_task_read_with_correctness",
+    "build_test_read",
     "build_test_read_list",
 ]
 from .base import (
@@ -15,4 +16,4 @@ from .base import (
 from .code import build_code_task_read_with_progress
 from .multiple_choice import build_multiple_choice_task_read_with_progress
 from .string_match import build_string_match_task_read_with_correctness
-from .test import build_test_read_list
+from .test import build_test_read, build_test_read_list
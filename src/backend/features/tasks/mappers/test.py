@@ -2,7 +2,17 @@ from features.tasks.models import Test
 from features.tasks.schemas import TestRead
 
 
+def build_test_read(
+    test: Test,
+    payloads: dict[str, str],
+) -> TestRead:
+    return test.get_validation_schema(
+        payloads[test.input_hash], payloads[test.output_hash]
+    )
+
+
 def build_test_read_list(
     tests: list[Test],
+    payloads: dict[str, str],
 ) -> list[TestRead]:
-    return [test.get_validation_schema() for test in tests]
+    return [build_test_read(test, payloads) for test in tests]
@@ -1,11 +1,11 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from features.tasks.models import BaseTask
 from features.tasks.schemas import CodeTaskRead
-from shared.enums import TaskTypeEnum
+from shared.enums import CheckerModeEnum, TaskTypeEnum
 
 if TYPE_CHECKING:
     from features.tasks.models.test import Test
@@ -20,6 +20,22 @@ class CodeTask(BaseTask):
     )
     time_limit: Mapped[int] = mapped_column(nullable=False)
     memory_limit: Mapped[int] = mapped_column(nullable=False)
+    parallelism: Mapped[int] = mapped_column(default=1, server_default="1")
+    tests_version: Mapped[int] = mapped_column(default=1, server_default="1")
+    checker_mode: Mapped[str] = mapped_column(
+        String(32),
+        default=CheckerModeEnum.EXACT.value,
+        server_default=CheckerModeEnum.EXACT.value,
+    )
+    checker_tolerance: Mapped[float] = mapped_column(
+        default=1e-6, server_default="1e-6"
+    )
+    checker_code: Mapped[str | None] = mapped_column(Text, nullable=True)
+    reference_code: Mapped[str | None] = mapped_column(Text, nullable=True)
+    reference_language: Mapped[str] = mapped_column(
+        String(32), default="Python", server_default="Python"
+    )
+    execution_backend: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
     tests: Mapped[list["Test"]] = relationship(back_populates="task")
 
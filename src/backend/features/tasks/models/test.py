@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import IdIntPkMixin, Base
@@ -12,11 +12,22 @@ if TYPE_CHECKING:
 
 class Test(Base, IdIntPkMixin):
     task_id: Mapped[int] = mapped_column(ForeignKey("code_tasks.id"))
-    correct_output: Mapped[str] = mapped_column(nullable=False)
-    input_data: Mapped[str] = mapped_column(nullable=True)
+    input_hash: Mapped[str] = mapped_column(String(64))
+    input_size: Mapped[int] = mapped_column(Integer)
+    output_hash: Mapped[str] = mapped_column(String(64))
+    output_size: Mapped[int] = mapped_column(Integer)
+    output_source: Mapped[str | None] = mapped_column(String(64), nullable=True)
     is_public: Mapped[bool] = mapped_column(default=True)
 
     task: Mapped["CodeTask"] = relationship(back_populates="tests")
 
-    def get_validation_schema(self) -> TestRead:
-        return TestRead.model_validate(self)
+    def get_validation_schema(self, input_data: str, correct_output: str) -> TestRead:
+        return TestRead(
+            id=self.id,
+            task_id=self.task_id,
+            is_public=self.is_public,
+            input_data=input_data,
+            correct_output=correct_output,
+            input_size=self.input_size,
+            output_size=self.output_size,
+        )
@@ -17,9 +17,12 @@ __all__ = [
     "CodeTaskReadWithProgress",
     "CodeTaskReadWithSolutions",
     "CodeTaskUpdate",
+    "RejudgeRead",
+    "ReferenceRunRead",
     "TestCreate",
     "TestRead",
     "TestUpdate",
+    "TestUploadRead",
     "MultipleChoiceTaskBase",
     "MultipleChoiceTaskCreate",
     "MultipleChoiceTaskRead",
@@ -43,6 +46,8 @@ from .code import (
     CodeTaskReadWithProgress,
     CodeTaskReadWithSolutions,
     CodeTaskUpdate,
+    ReferenceRunRead,
+    RejudgeRead,
 )
 from .multiple_choice import (
     MultipleChoiceTaskBase,
@@ -60,4 +65,4 @@ from .string_match import (
     StringMatchTaskReadWithSolutions,
     StringMatchTaskUpdate,
 )
-from .test import TestCreate, TestRead, TestUpdate
+from .test import TestCreate, TestRead, TestUpdate, TestUploadRead
@@ -1,4 +1,7 @@
+from pydantic import BaseModel, Field
+
 from features.solutions.schemas import CodeSolutionRead
+from shared.enums import CheckerModeEnum, ExecutionBackendEnum
 from features.tasks.schemas import (
     BaseTaskCreate,
     BaseTaskModel,
@@ -12,10 +15,16 @@ from features.tasks.schemas import (
 class CodeTaskBase(BaseTaskModel):
     time_limit: int
     memory_limit: int
+    parallelism: int = Field(default=1, ge=1)
+    checker_mode: CheckerModeEnum = CheckerModeEnum.EXACT
+    checker_tolerance: float = Field(default=1e-6, ge=0)
+    execution_backend: ExecutionBackendEnum | None = None
 
 
 class CodeTaskCreate(CodeTaskBase, BaseTaskCreate):
-    pass
+    checker_code: str | None = None
+    reference_code: str | None = None
+    reference_language: str = "Python"
 
 
 class CodeTaskRead(CodeTaskBase, BaseTaskRead):
@@ -55,3 +64,28 @@ class CodeTaskReadWithSolutions(CodeTaskRead, BaseTaskReadWithSolutions):
 class CodeTaskUpdate(BaseTaskUpdate):
     time_limit: int | None = None
     memory_limit: int | None = None
+    parallelism: int | None = Field(default=None, ge=1)
+    checker_mode: CheckerModeEnum | None = None
+    checker_tolerance: float | None = Field(default=None, ge=0)
+    checker_code: str | None = None
+    reference_code: str | None = None
+    reference_language: str | None = None
+    execution_backend: ExecutionBackendEnum | None = None
+
+
+class RejudgeRead(BaseModel):
+    job_id: str
+    task_id: int
+    status: str
+    total: int
+    enqueued: int
+    done: int
+
+
+class ReferenceRunRead(BaseModel):
+    task_id: int
+    status: str
+    total: int
+    generated: int
+    failed: int
+    error: str | None = None
@@ -9,11 +9,14 @@ class TestBase(BaseModel):
 
 class TestCreate(TestBase):
     task_id: int
+    correct_output: str | None = None
 
 
 class TestRead(TestBase):
     id: int
     task_id: int
+    input_size: int
+    output_size: int
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -22,3 +25,9 @@ class TestUpdate(TestBase):
     correct_output: str | None = None
     is_public: bool | None = None
     input_data: str | None = None
+
+
+class TestUploadRead(BaseModel):
+    task_id: int
+    tests_count: int
+    test_ids: list[int]
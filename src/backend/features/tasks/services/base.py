@@ -6,6 +6,7 @@ import features.solutions.crud.base as base_solution_crud
 import features.tasks.crud.account_task_progress as progress_crud
 import features.tasks.crud.base as base_task_crud
 import features.tasks.mappers as mapper
+from core.cache import invalidate_tags, module_tag, space_tag, tag_response, task_tag
 from features.groups.validators import check_user_is_admin_or_owner, get_account_or_404
 from features.modules.validators import get_module_or_404
 from features.spaces.validators import get_space_or_404
@@ -26,6 +27,7 @@ async def get_task(
     module = await get_module_or_404(session, task.module_id)
     _ = await get_space_or_404(session, module.space_id)
     account = await get_account_or_404(session, user_id, module.space_id)
+    tag_response(module_tag(module.id), space_tag(module.space_id))
 
     account_task_progress = (
         await progress_crud.get_account_task_progress_by_account_id_and_task_id(
@@ -52,6 +54,7 @@ async def get_tasks_in_module(
     module = await get_module_or_404(session, module_id)
     _ = await get_space_or_404(session, module.space_id)
     account = await get_account_or_404(session, user_id, module.space_id)
+    tag_response(space_tag(module.space_id))
 
     tasks = await base_task_crud.get_tasks_by_module_id(session, module_id, is_active)
     if not tasks:
@@ -76,6 +79,7 @@ async def get_user_tasks(
     accounts = await account_crud.get_accounts_by_user_id(session, user_id)
     if not accounts:
         return []
+    tag_response(*(space_tag(account.space_id) for account in accounts))
 
     modules = await module_crud.get_modules_by_space_ids(
         session, [account.space_id for account in accounts], is_active
@@ -88,6 +92,7 @@ async def get_user_tasks(
     )
     if not tasks:
         return []
+    tag_response(*(task_tag(task.id) for task in tasks))
 
     account_task_progresses = (
         await progress_crud.get_account_task_progresses_by_account_ids_and_task_ids(
@@ -115,3 +120,4 @@ async def delete_task(
     await base_solution_crud.delete_solutions_by_task_id(session, task_id)
     await progress_crud.delete_account_task_progresses_by_task_id(session, task_id)
     await base_task_crud.delete_task(session, task)
+    await invalidate_tags(module_tag(module.id), space_tag(module.space_id))
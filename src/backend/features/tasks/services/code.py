@@ -1,3 +1,4 @@
+import uuid
 from typing import cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,23 +8,47 @@ import features.tasks.crud.account_task_progress as progress_crud
 import features.tasks.crud.base as base_task_crud
 import features.tasks.crud.code as task_crud
 import features.tasks.mappers as mapper
+from core.cache import invalidate_tags, module_tag, space_tag
+from core.celery.reference_task import generate_expected_outputs
+from core.celery.rejudge_task import rejudge_solutions
+from core.judge.reference import get_pending_reference_run, get_reference_run_key
+from core.judge.rejudge import (
+    PENDING_STATUS,
+    get_rejudge_key,
+    get_task_rejudge_key,
+    start_task_rejudge,
+)
+from core.redis import redis_connection
 from features.groups.validators import (
     check_user_is_admin_or_owner,
     get_account_or_404,
     get_group_or_404,
 )
 from features.modules.validators import get_module_or_404
+from features.tasks.exceptions import (
+    ReferenceRunNotFoundException,
+    ReferenceSolutionRequired,
+    RejudgeAlreadyRunning,
+    RejudgeNotFoundException,
+)
 from features.tasks.models import CodeTask
 from features.tasks.schemas import (
     CodeTaskCreate,
     CodeTaskRead,
     CodeTaskReadWithProgress,
     CodeTaskUpdate,
+    ReferenceRunRead,
+    RejudgeRead,
 )
 from features.tasks.validators import (
     get_task_or_404,
+    validate_checker_configuration,
     validate_task_deadlines,
 )
+from utils.code_check import get_runtime_or_404
+
+CHECKER_FIELDS = {"checker_mode", "checker_tolerance", "checker_code"}
+REFERENCE_FIELDS = {"reference_code", "reference_language"}
 
 
 async def create_code_task(
@@ -43,9 +68,14 @@ async def create_code_task(
         module.start_datetime,
         module.end_datetime,
     )
+    validate_checker_configuration(task_in.checker_mode, task_in.checker_code)
+    _ = get_runtime_or_404(task_in.reference_language)
 
     task = await task_crud.create_code_task(session, task_in, account.id)
     await module_crud.increment_module_tasks_count(session, module.id)
+    await invalidate_tags(module_tag(module.id), space_tag(module.space_id))
+    if task.reference_code:
+        await schedule_reference_run(task)
 
     return mapper.build_code_task_read_with_progress(cast(CodeTask, task))
 
@@ -71,7 +101,18 @@ async def update_code_task(
     validate_task_deadlines(
         updated_start, updated_end, module.start_datetime, module.end_datetime
     )
+    validate_checker_configuration(
+        update_data.get("checker_mode", task.checker_mode),
+        update_data.get("checker_code", task.checker_code),
+    )
+    if update_data.get("reference_language"):
+        _ = get_runtime_or_404(update_data["reference_language"])
+    if CHECKER_FIELDS & update_data.keys():
+        await task_crud.bump_tests_version(session, task.id)
     task = await base_task_crud.update_task(session, task, update_data)
+    await invalidate_tags(module_tag(module.id), space_tag(module.space_id))
+    if task.reference_code and REFERENCE_FIELDS & update_data.keys():
+        await schedule_reference_run(task)
 
     account_task_progress = (
         await progress_crud.get_account_task_progress_by_account_id_and_task_id(
@@ -82,3 +123,93 @@ async def update_code_task(
     return mapper.build_code_task_read_with_progress(
         cast(CodeTask, task), account_task_progress
     )
+
+
+async def start_code_task_rejudge(
+    session: AsyncSession,
+    user_id: int,
+    task_id: int,
+) -> RejudgeRead:
+    task = await get_task_or_404(session, task_id, CodeTask)
+    module = await get_module_or_404(session, task.module_id)
+    account = await get_account_or_404(session, user_id, module.space_id)
+
+    check_user_is_admin_or_owner(account.role)
+
+    job_id = uuid.uuid4().hex
+    progress = {
+        "job_id": job_id,
+        "task_id": task.id,
+        "status": PENDING_STATUS,
+        "total": await task_crud.count_code_solutions(session, task.id),
+        "enqueued": 0,
+        "done": 0,
+    }
+    if not await start_task_rejudge(redis_connection.redis, task.id, progress):
+        raise RejudgeAlreadyRunning()
+
+    rejudge_solutions.delay(job_id, task.id, module.space_id)
+    return RejudgeRead(**progress)
+
+
+async def get_code_task_rejudge(
+    session: AsyncSession,
+    user_id: int,
+    task_id: int,
+) -> RejudgeRead:
+    task = await get_task_or_404(session, task_id, CodeTask)
+    module = await get_module_or_404(session, task.module_id)
+    account = await get_account_or_404(session, user_id, module.space_id)
+
+    check_user_is_admin_or_owner(account.role)
+
+    redis = redis_connection.redis
+    job_id = await redis.get(get_task_rejudge_key(task.id))
+    progress = await redis.hgetall(get_rejudge_key(job_id)) if job_id else None
+    if not progress:
+        raise RejudgeNotFoundException()
+
+    return RejudgeRead(**progress)
+
+
+async def schedule_reference_run(task: CodeTask) -> ReferenceRunRead:
+    progress = get_pending_reference_run(task.id)
+    await redis_connection.redis.hset(get_reference_run_key(task.id), mapping=progress)
+    generate_expected_outputs.apply_async(
+        (task.id,), queue=get_runtime_or_404(task.reference_language).queue
+    )
+    return ReferenceRunRead(**progress)
+
+
+async def start_code_task_reference_run(
+    session: AsyncSession,
+    user_id: int,
+    task_id: int,
+) -> ReferenceRunRead:
+    task = await get_task_or_404(session, task_id, CodeTask)
+    module = await get_module_or_404(session, task.module_id)
+    account = await get_account_or_404(session, user_id, module.space_id)
+
+    check_user_is_admin_or_owner(account.role)
+
+    if not task.reference_code:
+        raise ReferenceSolutionRequired()
+    return await schedule_reference_run(task)
+
+
+async def get_code_task_reference_run(
+    session: AsyncSession,
+    user_id: int,
+    task_id: int,
+) -> ReferenceRunRead:
+    task = await get_task_or_404(session, task_id, CodeTask)
+    module = await get_module_or_404(session, task.module_id)
+    account = await get_account_or_404(session, user_id, module.space_id)
+
+    check_user_is_admin_or_owner(account.role)
+
+    progress = await redis_connection.redis.hgetall(get_reference_run_key(task.id))
+    if not progress:
+        raise ReferenceRunNotFoundException()
+
+    return ReferenceRunRead(**progress)
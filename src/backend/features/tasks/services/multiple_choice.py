@@ -7,6 +7,7 @@ import features.tasks.crud.account_task_progress as progress_crud
 import features.tasks.crud.base as base_task_crud
 import features.tasks.crud.multiple_choice as choice_crud
 import features.tasks.mappers as mapper
+from core.cache import invalidate_tags, module_tag, space_tag
 from features.groups.validators import check_user_is_admin_or_owner, get_account_or_404
 from features.modules.validators import get_module_or_404
 from features.spaces.validators import get_space_or_404
@@ -43,6 +44,7 @@ async def create_multiple_choice_task(
 
     task = await choice_crud.create_multiple_choice_task(session, task_in, account.id)
     await module_crud.increment_module_tasks_count(session, module.id)
+    await invalidate_tags(module_tag(module.id), space_tag(module.space_id))
 
     return mapper.build_multiple_choice_task_read_with_progress(
         cast(MultipleChoiceTask, task)
@@ -70,6 +72,7 @@ async def update_multiple_choice_task(
         updated_start, updated_end, module.start_datetime, module.end_datetime
     )
     task = await base_task_crud.update_task(session, task, update_data)
+    await invalidate_tags(module_tag(module.id), space_tag(module.space_id))
 
     account_task_progress = (
         await progress_crud.get_account_task_progress_by_account_id_and_task_id(
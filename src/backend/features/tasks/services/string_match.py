@@ -7,6 +7,7 @@ import features.tasks.crud.account_task_progress as progress_crud
 import features.tasks.crud.base as base_task_crud
 import features.tasks.crud.string_match as task_crud
 import features.tasks.mappers as mapper
+from core.cache import invalidate_tags, module_tag, space_tag
 from features.groups.validators import check_user_is_admin_or_owner, get_account_or_404
 from features.modules.validators import get_module_or_404
 from features.spaces.validators import get_space_or_404
@@ -44,6 +45,7 @@ async def create_string_match_task(
     validate_string_match_task_configuration(task_in)
     task = await task_crud.create_string_match_task(session, task_in, account.id)
     await module_crud.increment_module_tasks_count(session, module.id)
+    await invalidate_tags(module_tag(module.id), space_tag(module.space_id))
 
     return mapper.build_string_match_task_read_with_correctness(
         cast(StringMatchTask, task)
@@ -77,6 +79,7 @@ async def update_string_match_task(
     ):
         validate_string_match_task_configuration(update_data)
     task = await base_task_crud.update_task(session, task, update_data)
+    await invalidate_tags(module_tag(module.id), space_tag(module.space_id))
 
     account_task_progress = (
         await progress_crud.get_account_task_progress_by_account_id_and_task_id(
@@ -1,16 +1,25 @@
+import asyncio
+from typing import BinaryIO
+
+from docker.utils import parse_bytes
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import features.tasks.crud.test as test_crud
 import features.tasks.mappers as mapper
+from core.cache import invalidate_tags, task_tag
+from core.config import settings
 from features.groups.validators import (
     get_account_or_404,
     check_user_is_admin_or_owner,
 )
 from features.modules.validators import get_module_or_404
 from features.spaces.validators import get_space_or_404
-from features.tasks.exceptions import TestIsNotPublic
-from features.tasks.schemas import TestRead, TestUpdate, TestCreate
+from features.tasks.exceptions import CorrectOutputRequired, TestIsNotPublic
+from features.tasks.models import CodeTask, Test
+from features.tasks.schemas import TestCreate, TestRead, TestUpdate, TestUploadRead
+from features.tasks.services.code import schedule_reference_run
 from features.tasks.validators import get_task_or_404, get_test_or_404
+from utils.test_archive import read_test_archive
 
 
 async def create_test(
@@ -18,14 +27,50 @@ async def create_test(
     user_id: int,
     test_in: TestCreate,
 ) -> TestRead:
-    task = await get_task_or_404(session, test_in.task_id)
+    task = await get_task_or_404(session, test_in.task_id, CodeTask)
     module = await get_module_or_404(session, task.module_id)
     _ = await get_space_or_404(session, module.space_id)
     account = await get_account_or_404(session, user_id, module.space_id)
     check_user_is_admin_or_owner(account.role)
 
+    if test_in.correct_output is None and not task.reference_code:
+        raise CorrectOutputRequired()
+
     test = await test_crud.create_test(session, test_in)
-    return test.get_validation_schema()
+    await invalidate_tags(task_tag(task.id))
+    if task.reference_code:
+        await schedule_reference_run(task)
+    return mapper.build_test_read(test, await get_test_payloads([test]))
+
+
+async def upload_tests(
+    session: AsyncSession,
+    user_id: int,
+    task_id: int,
+    archive: BinaryIO,
+    is_public: bool,
+    replace: bool,
+) -> TestUploadRead:
+    task = await get_task_or_404(session, task_id, CodeTask)
+    module = await get_module_or_404(session, task.module_id)
+    _ = await get_space_or_404(session, module.space_id)
+    account = await get_account_or_404(session, user_id, module.space_id)
+    check_user_is_admin_or_owner(account.role)
+
+    archived_tests = await asyncio.to_thread(
+        read_test_archive,
+        archive,
+        settings.judge.test_archive_max_tests,
+        parse_bytes(settings.judge.test_archive_max_size),
+        not task.reference_code,
+    )
+    test_ids = await test_crud.create_tests(
+        session, task.id, archived_tests, is_public, replace
+    )
+    await invalidate_tags(task_tag(task.id))
+    if task.reference_code:
+        await schedule_reference_run(task)
+    return TestUploadRead(task_id=task.id, tests_count=len(test_ids), test_ids=test_ids)
 
 
 async def update_test(
@@ -35,7 +80,7 @@ async def update_test(
     test_update: TestUpdate,
 ) -> TestRead:
     test = await get_test_or_404(session, test_id)
-    task = await get_task_or_404(session, test.task_id)
+    task = await get_task_or_404(session, test.task_id, CodeTask)
     module = await get_module_or_404(session, task.module_id)
     _ = await get_space_or_404(session, module.space_id)
     account = await get_account_or_404(session, user_id, module.space_id)
@@ -44,7 +89,10 @@ async def update_test(
     update_data = test_update.model_dump(exclude_unset=True)
 
     test = await test_crud.update_test(session, test, update_data)
-    return test.get_validation_schema()
+    await invalidate_tags(task_tag(task.id))
+    if task.reference_code and update_data.keys() & {"input_data", "correct_output"}:
+        await schedule_reference_run(task)
+    return mapper.build_test_read(test, await get_test_payloads([test]))
 
 
 async def get_test(
@@ -60,7 +108,7 @@ async def get_test(
 
     if not test.is_public:
         raise TestIsNotPublic()
-    return test.get_validation_schema()
+    return mapper.build_test_read(test, await get_test_payloads([test]))
 
 
 async def delete_test(
@@ -77,6 +125,7 @@ async def delete_test(
     check_user_is_admin_or_owner(account.role)
 
     await test_crud.delete_test(session, test)
+    await invalidate_tags(task_tag(task.id))
 
 
 async def get_tests_in_task(
@@ -93,4 +142,18 @@ async def get_tests_in_task(
     if not tests:
         return []
     tests = [test for test in tests if test.is_public]
-    return mapper.build_test_read_list(tests)
+    payloads = await get_test_payloads(tests, settings.judge.output_preview_size)
+    return mapper.build_test_read_list(tests, payloads)
+
+
+async def get_test_payloads(
+    tests: list[Test],
+    size: int | None = None,
+) -> dict[str, str]:
+    digests = list(
+        {test.input_hash for test in tests} | {test.output_hash for test in tests}
+    )
+    payloads = await asyncio.gather(
+        *(test_crud.get_test_payload(digest, size) for digest in digests)
+    )
+    return dict(zip(digests, payloads))
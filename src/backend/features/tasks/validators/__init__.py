@@ -1,6 +1,7 @@
 __all__ = [
     "get_task_or_404",
     "get_test_or_404",
+    "validate_checker_configuration",
     "validate_string_match_task_configuration",
     "check_task_start_deadline_after_module_start",
     "check_task_end_deadline_before_module_end",
@@ -8,7 +9,10 @@ __all__ = [
 ]
 
 from .existence import get_task_or_404, get_test_or_404
-from .rules import validate_string_match_task_configuration
+from .rules import (
+    validate_checker_configuration,
+    validate_string_match_task_configuration,
+)
 from .timing import (
     check_task_end_deadline_before_module_end,
     check_task_start_deadline_after_module_start,
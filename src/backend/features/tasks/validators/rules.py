@@ -1,7 +1,9 @@
 from features.tasks.exceptions import (
+    CustomCheckerCodeRequired,
     InvalidStringMatchTaskWithNumberConfiguration,
     InvalidStringMatchTaskWithStringConfiguration,
 )
+from shared.enums import CheckerModeEnum
 
 
 def validate_string_match_task_configuration(task) -> None:
@@ -11,3 +13,11 @@ def validate_string_match_task_configuration(task) -> None:
     else:
         if task.is_case_sensitive is None or task.normalize_whitespace is None:
             raise InvalidStringMatchTaskWithStringConfiguration()
+
+
+def validate_checker_configuration(
+    checker_mode: CheckerModeEnum,
+    checker_code: str | None,
+) -> None:
+    if checker_mode == CheckerModeEnum.CUSTOM and not checker_code:
+        raise CustomCheckerCodeRequired()
@@ -12,6 +12,7 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_policy
 from database import db_helper
 from features.users.schemas.token import TokenResponseForOAuth2
 from features.users.schemas.user import (
@@ -96,6 +97,7 @@ async def refresh_tokens(
     response_model=UserRead,
     status_code=status.HTTP_200_OK,
 )
+@cache_policy(ttl=0)
 async def check_auth(
     payload: dict = Depends(service.get_non_expire_payload_token),
     session: AsyncSession = Depends(db_helper.dependency_session_getter),
@@ -145,6 +147,7 @@ async def send_confirmation_email_again(
 
 
 @router.get("/me", response_model=UserAuthRead)
+@cache_policy(ttl=0)
 async def get_current_user_info(
     current_user: UserAuthRead = Depends(service.get_current_auth_user),
 ):
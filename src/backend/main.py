@@ -2,21 +2,24 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.middleware import SlowAPIMiddleware
+from prometheus_client import REGISTRY
 from prometheus_fastapi_instrumentator import Instrumentator
 import sentry_sdk
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
 import os
 
 from api import router as api_router
+from core.cache import CachePolicy
 from core.config import settings
 from core.events import lifespan
+from core.judge.metrics import JudgeQueueCollector
 from middlewares import (
     LoggingMiddleware,
     AutoCacheMiddleware,
+    ConditionalGetMiddleware,
     ExceptionHandlerMiddleware,
 )
 
-
 is_dev = os.getenv("IS_DEV", "false").lower() == "true"
 
 sentry_sdk.init(
@@ -31,6 +34,7 @@ app.add_middleware(ExceptionHandlerMiddleware)
 app.add_middleware(SentryAsgiMiddleware)
 
 Instrumentator().instrument(app).expose(app)
+REGISTRY.register(JudgeQueueCollector())
 
 if settings.redis.limiter_enabled:
     app.add_middleware(SlowAPIMiddleware)
@@ -41,12 +45,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 if not (is_dev):
     app.add_middleware(
         AutoCacheMiddleware,
-        ttl=600,
+        default_policy=CachePolicy(ttl=600),
         exclude_paths=[
             "docs",
             "openapi.json",
@@ -54,8 +59,8 @@ if not (is_dev):
             "static",
             "docs#",
         ],
-        invalidate_paths=["auth", "verify"],
     )
+app.add_middleware(ConditionalGetMiddleware)
 app.add_middleware(LoggingMiddleware)
 
 app.include_router(
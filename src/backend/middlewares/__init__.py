@@ -2,8 +2,10 @@ __all__ = (
     "LoggingMiddleware",
     "ExceptionHandlerMiddleware",
     "AutoCacheMiddleware",
+    "ConditionalGetMiddleware",
 )
 
 from .cache import AutoCacheMiddleware
+from .conditional import ConditionalGetMiddleware
 from .exception import ExceptionHandlerMiddleware
 from .logging import LoggingMiddleware
@@ -1,13 +1,34 @@
 import hashlib
 import inspect
+import json
 
+import jwt
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.routing import Match
 
+from core.cache import (
+    ENTITY_PARAMS,
+    SECTION_ENTITIES,
+    CacheEntry,
+    CachePolicy,
+    collect_response_tags,
+    get_cache_policy,
+    get_collection_tag,
+    get_entry_key,
+    get_path_tags,
+    get_version_key,
+    invalidate_tags,
+    local_cache,
+)
 from core.redis import redis_connection
+from database import db_helper
+from features.accounts.crud import account as account_crud
 from logging import getLogger
-
+from shared.enums import CacheScopeEnum
+from utils.JWT import get_current_token_payload
+from utils.response_func import make_etag
 
 logger = getLogger("redis")
 
@@ -16,73 +37,183 @@ class AutoCacheMiddleware(BaseHTTPMiddleware):
     def __init__(
         self,
         app,
-        ttl: int = 600,
+        default_policy: CachePolicy = CachePolicy(),
         exclude_paths: list[str] = None,
-        invalidate_paths: list[str] = None,
     ):
         super().__init__(app)
-        self.ttl = ttl
+        self.default_policy = default_policy
         self.exclude_paths = exclude_paths or []
-        self.invalidate_paths = invalidate_paths or []
         self.redis = redis_connection.redis
 
-    def make_cache_key(self, request: Request) -> str:
-        query = str(sorted(request.query_params.items()))
-        return (
-            "cache:" + hashlib.sha256((request.url.path + query).encode()).hexdigest()
+    def resolve_policy(self, request: Request) -> tuple[CachePolicy, dict]:
+        for route in request.app.router.routes:
+            match, child_scope = route.matches(request.scope)
+            if match == Match.FULL:
+                return (
+                    get_cache_policy(child_scope.get("endpoint"), self.default_policy),
+                    child_scope.get("path_params", {}),
+                )
+        return self.default_policy, {}
+
+    def get_user_id(self, request: Request) -> str | None:
+        token = request.cookies.get("access_token") or request.headers.get(
+            "authorization"
         )
+        if not token:
+            return None
+        try:
+            return get_current_token_payload(token).get("sub")
+        except jwt.PyJWTError:
+            return None
+
+    async def is_space_member(self, user_id: int, space_id: int) -> bool:
+        async with db_helper.session_factory() as session:
+            account = await account_crud.get_account_by_user_id_and_space_id(
+                session, user_id, space_id
+            )
+        return account is not None
+
+    # Space-scoped entries are shared by every member of the space, so access
+    # is checked here rather than left to the endpoint behind a cache hit.
+    async def get_cache_identity(
+        self,
+        request: Request,
+        policy: CachePolicy,
+        path_params: dict,
+    ) -> str | None:
+        if policy.scope == CacheScopeEnum.PUBLIC:
+            return "public"
+
+        user_id = self.get_user_id(request)
+        if user_id is None:
+            return None
+        if policy.scope == CacheScopeEnum.SPACE:
+            space_id = path_params.get(policy.space_param)
+            try:
+                user_id, space_id = int(user_id), int(space_id)
+            except (TypeError, ValueError):
+                return None
+            if not await self.is_space_member(user_id, space_id):
+                return None
+            return f"space:{space_id}"
+        return f"user:{user_id}"
+
+    def make_cache_key(
+        self,
+        request: Request,
+        policy: CachePolicy,
+        identity: str,
+    ) -> str:
+        query = str(sorted(request.query_params.items()))
+        vary = str([(header, request.headers.get(header)) for header in policy.vary])
+        key = "\n".join((request.url.path, query, identity, vary))
+        return get_entry_key(hashlib.sha256(key.encode()).hexdigest())
 
-    def make_tag_key(self, path: str) -> str:
+    def get_vary_header(self, policy: CachePolicy) -> str | None:
+        headers = list(policy.vary)
+        if policy.scope != CacheScopeEnum.PUBLIC:
+            headers += ["authorization", "cookie"]
+        return ", ".join(headers) or None
+
+    def make_section(self, path: str) -> str:
         path = path.replace("/api/", "")
         segments = [segment for segment in path.split("/") if segment]
-        return f"tag:{segments[0]}" if segments else "tag:root"
+        return segments[0] if segments else "root"
+
+    def make_tags(self, path: str, path_params: dict) -> list[str]:
+        return get_path_tags(path_params) or [
+            get_collection_tag(self.make_section(path))
+        ]
 
-    async def cache_set(self, key: str, tag: str, value: str):
+    # Writes bump their own entities; the collection listing them only changes
+    # when one of its entities is deleted (creates have no entity to tag, so
+    # they fall back to the collection tag already). Writes that change reads
+    # tagged with another entity, e.g. a test of a task, invalidate those tags
+    # in their services.
+    def make_write_tags(self, method: str, path: str, path_params: dict) -> list[str]:
+        tags = self.make_tags(path, path_params)
+        if method == "DELETE" and self.is_section_entity(path, path_params):
+            tags.append(get_collection_tag(self.make_section(path)))
+        return tags
+
+    def is_section_entity(self, path: str, path_params: dict) -> bool:
+        if not path_params:
+            return False
+        name, value = list(path_params.items())[-1]
+        entity = SECTION_ENTITIES.get(self.make_section(path))
+        return (
+            entity is not None
+            and ENTITY_PARAMS.get(name) == entity
+            and path.rstrip("/").endswith(f"/{value}")
+        )
+
+    # Entries carry the versions of their tags; bumping a version makes every
+    # entry stored under the old one a miss, and those expire with their TTL.
+    async def cache_get(
+        self,
+        key: str,
+        tags: list[str],
+    ) -> tuple[CacheEntry | None, list[str | None] | None]:
         try:
-            await self.redis.setex(key, self.ttl, value)
-            await self.redis.sadd(tag, key)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.mget([get_version_key(tag) for tag in tags])
+                pipe.get(key)
+                versions, cached = await pipe.execute()
+            if not cached:
+                return None, versions
+
+            header, _, body = cached.partition("\n")
+            header = json.loads(header)
+            current = versions
+            if header["tags"]:
+                current = versions + await self.get_versions(header["tags"])
         except Exception as e:
             logger.error(
                 f"Redis get error in {inspect.currentframe().f_code.co_name}: {e}"
             )
+            return None, None
 
-    async def invalidate_tag(self, tag_key: str):
+        if header["versions"] != current or "etag" not in header:
+            return None, versions
+        return CacheEntry(body, header["etag"], tags + header["tags"]), versions
+
+    async def get_versions(self, tags: list[str]) -> list[str | None]:
+        return await self.redis.mget([get_version_key(tag) for tag in tags])
+
+    async def cache_set(
+        self,
+        key: str,
+        versions: list[str | None],
+        response_tags: list[str],
+        value: str,
+        etag: str,
+        ttl: int,
+    ):
         try:
-            keys = await self.redis.smembers(tag_key)
-            if keys:
-                await self.redis.delete(*keys)
-            await self.redis.delete(tag_key)
+            if response_tags:
+                versions = versions + await self.get_versions(response_tags)
+            header = json.dumps(
+                {"tags": response_tags, "versions": versions, "etag": etag}
+            )
+            await self.redis.setex(key, ttl, f"{header}\n{value}")
         except Exception as e:
             logger.error(
                 f"Redis get error in {inspect.currentframe().f_code.co_name}: {e}"
             )
 
-    def is_excluded(self, path: str) -> bool:
-        return any(
-            path.startswith(f"/api/{ex}") or path.startswith(f"{ex}")
-            for ex in self.exclude_paths
+    def make_cached_response(self, entry: CacheEntry, headers: dict) -> Response:
+        return Response(
+            content=entry.body.encode(),
+            headers={**headers, "ETag": entry.etag},
+            media_type="application/json",
         )
 
-    def is_invalidated(self, path: str) -> bool:
+    def is_excluded(self, path: str) -> bool:
         return any(
             path.startswith(f"/api/{ex}") or path.startswith(f"{ex}")
-            for ex in self.invalidate_paths
+            for ex in self.exclude_paths
         )
 
-    async def invalidate_all_cache(self):
-        try:
-            cache_keys = await self.redis.keys("cache:*")
-            tag_keys = await self.redis.keys("tag:*")
-
-            if cache_keys:
-                await self.redis.delete(*cache_keys)
-            if tag_keys:
-                await self.redis.delete(*tag_keys)
-        except Exception as e:
-            logger.error(
-                f"Redis get error in {inspect.currentframe().f_code.co_name}: {e}"
-            )
-
     async def dispatch(self, request: Request, call_next):
         method = request.method.upper()
         path = request.url.path
@@ -90,23 +221,28 @@ class AutoCacheMiddleware(BaseHTTPMiddleware):
         if self.is_excluded(path):
             return await call_next(request)
 
-        if self.is_invalidated(path):
-            await self.invalidate_all_cache()
-
-        tag_key = self.make_tag_key(path)
+        policy, path_params = self.resolve_policy(request)
+        tags = self.make_tags(path, path_params)
 
         if method == "GET":
-            cache_key = self.make_cache_key(request)
-            try:
-                cached = await self.redis.get(cache_key)
-            except Exception as e:
-                logger.error(
-                    f"Redis get error in {inspect.currentframe().f_code.co_name}: {e}"
-                )
-                cached = None
+            identity = await self.get_cache_identity(request, policy, path_params)
+            if not policy.is_cacheable or identity is None:
+                return await call_next(request)
+
+            cache_key = self.make_cache_key(request, policy, identity)
+            vary = self.get_vary_header(policy)
+            headers = {"Vary": vary} if vary else {}
+            cached = local_cache.get(cache_key)
             if cached:
-                return Response(content=cached.encode(), media_type="application/json")
+                return self.make_cached_response(cached, headers)
 
+            generation = local_cache.generation
+            cached, versions = await self.cache_get(cache_key, tags)
+            if cached:
+                local_cache.put(cache_key, cached, policy.ttl, generation)
+                return self.make_cached_response(cached, headers)
+
+            response_tags = collect_response_tags()
             response = await call_next(request)
 
             if "application/json" not in response.headers.get("content-type", ""):
@@ -114,8 +250,27 @@ class AutoCacheMiddleware(BaseHTTPMiddleware):
 
             body = [chunk async for chunk in response.body_iterator]
             full_body = b"".join(body)
+            etag = response.headers.get("etag") or make_etag(full_body)
 
-            await self.cache_set(cache_key, tag_key, full_body.decode())
+            if versions is not None and response.status_code < 400:
+                extra_tags = sorted(response_tags.difference(tags))
+                await self.cache_set(
+                    cache_key,
+                    versions,
+                    extra_tags,
+                    full_body.decode(),
+                    etag,
+                    policy.ttl,
+                )
+                local_cache.put(
+                    cache_key,
+                    CacheEntry(full_body.decode(), etag, tags + extra_tags),
+                    policy.ttl,
+                    generation,
+                )
+            response.headers["ETag"] = etag
+            if vary:
+                response.headers["Vary"] = vary
             return Response(
                 content=full_body,
                 status_code=response.status_code,
@@ -124,7 +279,9 @@ class AutoCacheMiddleware(BaseHTTPMiddleware):
             )
 
         elif method in {"POST", "PUT", "DELETE", "PATCH"}:
-            await self.invalidate_tag(tag_key)
-            return await call_next(request)
+            response = await call_next(request)
+            if response.status_code < 400:
+                await invalidate_tags(*self.make_write_tags(method, path, path_params))
+            return response
 
         return await call_next(request)
@@ -0,0 +1,31 @@
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from utils.response_func import is_etag_match
+
+NOT_MODIFIED_HEADERS = ("etag", "vary", "cache-control")
+
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method.upper() not in {"GET", "HEAD"}:
+            return response
+        if not 200 <= response.status_code < 300:
+            return response
+
+        etag = response.headers.get("etag")
+        if etag is None or not is_etag_match(
+            request.headers.get("if-none-match"), etag
+        ):
+            return response
+
+        return Response(
+            status_code=304,
+            headers={
+                header: response.headers[header]
+                for header in NOT_MODIFIED_HEADERS
+                if header in response.headers
+            },
+        )
@@ -1,4 +1,7 @@
 __all__ = [
+    "CacheScopeEnum",
+    "CheckerModeEnum",
+    "ExecutionBackendEnum",
     "SolutionStatusEnum",
     "SpaceTypeEnum",
     "SpaceJoinStatusEnum",
@@ -7,6 +10,9 @@ __all__ = [
     "TaskTypeEnum",
 ]
 
+from .cache import CacheScopeEnum
+from .checker import CheckerModeEnum
+from .execution import ExecutionBackendEnum
 from .solution import SolutionStatusEnum
 from .space import SpaceTypeEnum
 from .space_join_request import (
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CacheScopeEnum(str, Enum):
+    PUBLIC = "public"
+    USER = "user"
+    SPACE = "space"
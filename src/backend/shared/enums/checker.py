@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class CheckerModeEnum(str, Enum):
+    EXACT = "exact"
+    TOKENS = "tokens"
+    FLOAT = "float"
+    UNORDERED_LINES = "unordered_lines"
+    CUSTOM = "custom"
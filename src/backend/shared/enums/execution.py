@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExecutionBackendEnum(str, Enum):
+    DOCKER = "docker"
+    SANDBOX = "sandbox"
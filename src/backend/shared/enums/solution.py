@@ -8,3 +8,5 @@ class SolutionStatusEnum(str, Enum):
     TIME_LIMIT_EXCEEDED = "time_limit_exceeded"
     RUNTIME_ERROR = "runtime_error"
     MEMORY_LIMIT_EXCEEDED = "memory_limit_exceeded"
+    OUTPUT_LIMIT_EXCEEDED = "output_limit_exceeded"
+    COMPILATION_ERROR = "compilation_error"
@@ -1,7 +1,9 @@
-from typing import Any
+import hashlib
+import json
+from typing import Any, AsyncIterator
 
 from fastapi.encoders import jsonable_encoder
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 
 from utils import get_current_utc
 from utils.schemas import (
@@ -83,6 +85,21 @@ def create_list_response(
     return response_content
 
 
+def make_etag(content: bytes) -> str:
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def is_etag_match(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
 def create_json_response(
     data: list | Any,
     page: int | None = None,
@@ -104,7 +121,24 @@ def create_json_response(
                 data=data, meta=Meta(version="v1", timestamp=str(get_current_utc()))
             )
         )
-    return JSONResponse(content=response_content, status_code=201)
+    # The meta timestamp changes on every call, so it is left out of the ETag.
+    payload = {key: value for key, value in response_content.items() if key != "meta"}
+    etag = make_etag(json.dumps(payload, sort_keys=True, default=str).encode())
+    return JSONResponse(
+        content=response_content, status_code=201, headers={"ETag": etag}
+    )
+
+
+def format_server_sent_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def create_event_stream_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 """
@@ -0,0 +1,93 @@
+import tarfile
+import zipfile
+from pathlib import PurePosixPath
+from typing import BinaryIO, Callable, Iterator, NamedTuple
+
+from core.blob_storage import BlobRef, blob_storage
+from features.tasks.exceptions import InvalidTestArchive
+from utils.test_output import NormalizedOutput
+
+INPUT_SUFFIXES = (".in",)
+OUTPUT_SUFFIXES = (".out", ".ans")
+
+
+class ArchivedTest(NamedTuple):
+    number: int
+    input_blob: BlobRef
+    output_blob: BlobRef
+
+
+def read_test_archive(
+    file: BinaryIO,
+    max_tests: int,
+    max_size: int,
+    require_outputs: bool = True,
+) -> list[ArchivedTest]:
+    inputs: dict[int, BlobRef] = {}
+    outputs: dict[int, BlobRef] = {}
+    total_size = 0
+
+    for name, size, open_member in _iter_members(file):
+        path = PurePosixPath(name)
+        if path.suffix in INPUT_SUFFIXES:
+            payloads = inputs
+        elif path.suffix in OUTPUT_SUFFIXES:
+            payloads = outputs
+        else:
+            continue
+        if not path.stem.isdigit():
+            raise InvalidTestArchive(detail=f"Test file {name} is not numbered")
+
+        number = int(path.stem)
+        if number in payloads:
+            raise InvalidTestArchive(detail=f"Test {number} is duplicated")
+        if len(payloads) >= max_tests:
+            raise InvalidTestArchive(detail=f"Archive has more than {max_tests} tests")
+        total_size += size
+        if total_size > max_size:
+            raise InvalidTestArchive(detail="Archive is too large")
+
+        with open_member() as member:
+            if payloads is outputs:
+                member = NormalizedOutput(member)
+            payloads[number] = blob_storage.put_stream(member)
+
+    if not inputs and not outputs:
+        raise InvalidTestArchive(detail="Archive has no tests")
+    if not require_outputs and inputs.keys() >= outputs.keys():
+        empty_output = blob_storage.put(b"")
+        outputs = {number: outputs.get(number, empty_output) for number in inputs}
+    if unmatched := sorted(inputs.keys() ^ outputs.keys()):
+        raise InvalidTestArchive(
+            detail=f"Tests without input or output: {', '.join(map(str, unmatched))}"
+        )
+
+    return [
+        ArchivedTest(number, inputs[number], outputs[number])
+        for number in sorted(inputs)
+    ]
+
+
+def _iter_members(
+    file: BinaryIO,
+) -> Iterator[tuple[str, int, Callable[[], BinaryIO]]]:
+    if zipfile.is_zipfile(file):
+        file.seek(0)
+        with zipfile.ZipFile(file) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    yield info.filename, info.file_size, lambda info=info: archive.open(
+                        info
+                    )
+        return
+
+    file.seek(0)
+    try:
+        with tarfile.open(fileobj=file, mode="r:*") as archive:
+            for info in archive:
+                if info.isfile():
+                    yield info.name, info.size, lambda info=info: archive.extractfile(
+                        info
+                    )
+    except tarfile.TarError:
+        raise InvalidTestArchive(detail="Archive must be a zip or tar file")
@@ -0,0 +1,23 @@
+from typing import BinaryIO
+
+
+def normalize_output(data: bytes) -> bytes:
+    return data.rstrip()
+
+
+class NormalizedOutput:
+    """Reads a stream with its trailing whitespace removed."""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.pending = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while chunk := self.stream.read(size):
+            data = self.pending + chunk
+            stripped = data.rstrip()
+            self.pending = data[len(stripped) :]
+            if stripped:
+                return stripped
+        self.pending = b""
+        return b""
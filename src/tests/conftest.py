@@ -3,8 +3,8 @@ from unittest.mock import MagicMock, AsyncMock, patch
 
 import pytest
 
-from features.groups.schemas import AccountRole
-from features.tasks.schemas import TaskCreate
+from features.accounts.schemas import AccountRole
+from features.tasks.schemas import StringMatchTaskCreate as TaskCreate
 
 
 @pytest.fixture
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+import redis
+
+from core.cache import flush_cache_sync, get_entry_key, get_version_key, tags
+from core.config import settings
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = redis.Redis.from_url(
+        settings.redis.get_storage_uri(), decode_responses=True
+    )
+    try:
+        client.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis is not available")
+    monkeypatch.setattr(tags, "sync_redis_client", client)
+    yield client
+    client.delete(get_version_key("task:flush"))
+    client.close()
+
+
+def test_flush_drops_entries_and_notifies_workers(client, monkeypatch):
+    monkeypatch.setattr(tags, "FLUSH_BATCH_SIZE", 2)
+    keys = [get_entry_key(f"flush-{index}") for index in range(5)]
+    for key in keys:
+        client.setex(key, 60, "{}\n{}")
+    client.set(get_version_key("task:flush"), 3)
+    pubsub = client.pubsub()
+    pubsub.subscribe(tags.INVALIDATION_CHANNEL)
+    assert pubsub.get_message(timeout=1)["type"] == "subscribe"
+
+    assert flush_cache_sync() >= len(keys)
+
+    assert client.exists(*keys) == 0
+    assert client.get(get_version_key("task:flush")) == "3"
+    message = pubsub.get_message(timeout=1)
+    assert json.loads(message["data"]) is None
+    pubsub.close()
@@ -0,0 +1,78 @@
+import asyncio
+import uuid
+
+import pytest
+import redis
+import redis.asyncio
+
+from core.config import settings
+from core.judge.rejudge import (
+    FINISHED_STATUS,
+    PENDING_STATUS,
+    START_SCRIPT,
+    get_rejudge_key,
+    get_task_rejudge_key,
+    start_task_rejudge,
+)
+
+
+@pytest.fixture
+def client():
+    client = redis.Redis.from_url(
+        settings.redis.get_storage_uri(), decode_responses=True
+    )
+    try:
+        client.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis is not available")
+    client.script_load(START_SCRIPT)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def task_id(client):
+    task_id = uuid.uuid4().int % 10**9
+    yield task_id
+    job_id = client.get(get_task_rejudge_key(task_id))
+    client.delete(get_task_rejudge_key(task_id))
+    if job_id:
+        client.delete(get_rejudge_key(job_id))
+
+
+def make_progress(task_id: int) -> dict:
+    return {"job_id": uuid.uuid4().hex, "task_id": task_id, "status": PENDING_STATUS}
+
+
+async def start_concurrently(task_id: int, count: int) -> list[bool]:
+    async_client = redis.asyncio.Redis.from_url(
+        settings.redis.get_storage_uri(), decode_responses=True
+    )
+    try:
+        return await asyncio.gather(
+            *(
+                start_task_rejudge(async_client, task_id, make_progress(task_id))
+                for _ in range(count)
+            )
+        )
+    finally:
+        await async_client.aclose()
+
+
+def test_concurrent_starts_create_one_job(client, task_id):
+    started = asyncio.run(start_concurrently(task_id, 5))
+
+    job_id = client.get(get_task_rejudge_key(task_id))
+    assert started.count(True) == 1
+    assert client.hgetall(get_rejudge_key(job_id))["status"] == PENDING_STATUS
+    assert client.ttl(get_task_rejudge_key(task_id)) > 0
+
+
+def test_finished_job_can_be_replaced(client, task_id):
+    asyncio.run(start_concurrently(task_id, 1))
+    first_job_id = client.get(get_task_rejudge_key(task_id))
+    client.hset(get_rejudge_key(first_job_id), "status", FINISHED_STATUS)
+
+    assert asyncio.run(start_concurrently(task_id, 1)) == [True]
+    assert client.get(get_task_rejudge_key(task_id)) != first_job_id
+    client.delete(get_rejudge_key(first_job_id))
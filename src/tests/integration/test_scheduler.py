@@ -0,0 +1,107 @@
+import uuid
+
+import pytest
+import redis
+
+from core.config import settings
+from core.judge.scheduler import (
+    LIVE_PRIORITY,
+    REJUDGE_PRIORITY,
+    FairShareScheduler,
+    get_runtime_prefix,
+)
+
+
+@pytest.fixture
+def client():
+    client = redis.Redis.from_url(
+        settings.redis.get_storage_uri(), decode_responses=True
+    )
+    try:
+        client.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis is not available")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def slug(client):
+    slug = f"test-{uuid.uuid4().hex}"
+    yield slug
+    keys = list(client.scan_iter(f"{get_runtime_prefix(slug)}:*"))
+    if keys:
+        client.delete(*keys)
+
+
+@pytest.fixture
+def scheduler(client):
+    return FairShareScheduler(
+        client,
+        {LIVE_PRIORITY: 2, REJUDGE_PRIORITY: 1},
+        {},
+        (1, 5),
+    )
+
+
+def drain(scheduler: FairShareScheduler, slug: str) -> list[int]:
+    solution_ids = []
+    while (scheduled := scheduler.dequeue(slug)) is not None:
+        solution_ids.append(scheduled.solution_id)
+    return solution_ids
+
+
+def drain_count(scheduler: FairShareScheduler, slug: str, count: int) -> list[int]:
+    return [scheduler.dequeue(slug).solution_id for _ in range(count)]
+
+
+def test_solutions_of_one_space_are_served_in_order(scheduler, slug):
+    for solution_id in (1, 2, 3):
+        scheduler.enqueue(solution_id, 1, LIVE_PRIORITY, slug, "job")
+
+    scheduled = scheduler.dequeue(slug)
+
+    assert scheduled.solution_id == 1
+    assert scheduled.space_id == 1
+    assert scheduled.rejudge_job_id == "job"
+    assert drain(scheduler, slug) == [2, 3]
+
+
+def test_spaces_share_a_priority_class_fairly(scheduler, slug):
+    for solution_id in (1, 2, 3, 4):
+        scheduler.enqueue(solution_id, 1, LIVE_PRIORITY, slug)
+    for solution_id in (5, 6):
+        scheduler.enqueue(solution_id, 2, LIVE_PRIORITY, slug)
+
+    assert drain(scheduler, slug) == [1, 5, 2, 6, 3, 4]
+
+
+def test_priority_classes_are_served_by_weight(scheduler, slug):
+    for solution_id in range(1, 7):
+        scheduler.enqueue(solution_id, 1, LIVE_PRIORITY, slug)
+    for solution_id in range(11, 14):
+        scheduler.enqueue(solution_id, 1, REJUDGE_PRIORITY, slug)
+
+    served = [scheduler.dequeue(slug).priority for _ in range(6)]
+
+    assert served.count(LIVE_PRIORITY) == 4
+    assert served.count(REJUDGE_PRIORITY) == 2
+
+
+def test_newly_backlogged_space_starts_at_current_clock(scheduler, slug):
+    for solution_id in (1, 2, 3, 4):
+        scheduler.enqueue(solution_id, 1, LIVE_PRIORITY, slug)
+    assert drain_count(scheduler, slug, 2) == [1, 2]
+
+    for solution_id in (10, 11, 12):
+        scheduler.enqueue(solution_id, 2, LIVE_PRIORITY, slug)
+
+    assert drain(scheduler, slug) == [10, 3, 11, 4, 12]
+
+
+def test_runtimes_have_separate_queues(scheduler, slug):
+    other = f"{slug}-other"
+    scheduler.enqueue(1, 1, LIVE_PRIORITY, slug)
+
+    assert scheduler.dequeue(other) is None
+    assert scheduler.get_depths(slug) == {(LIVE_PRIORITY, "1"): 1}
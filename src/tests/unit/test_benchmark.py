@@ -0,0 +1,80 @@
+import random
+from collections import Counter
+
+import pytest
+
+from core.judge.benchmark import (
+    DEFAULT_MIX,
+    BenchmarkReport,
+    generate_test,
+    pick_statuses,
+)
+from shared.enums import SolutionStatusEnum
+
+
+def make_report(latencies: list[float], **kwargs) -> BenchmarkReport:
+    return BenchmarkReport(
+        **{
+            "submissions": len(latencies),
+            "completed": len(latencies),
+            "elapsed": 30.0,
+            "latencies": latencies,
+            "container_starts": 0,
+            "verdicts": Counter(),
+            "mismatches": 0,
+        }
+        | kwargs
+    )
+
+
+@pytest.mark.parametrize("io_size", [0, 10, 1024])
+def test_generate_test_output_is_sum_of_input(io_size):
+    input_data, output_data = generate_test(random.Random(1), io_size)
+
+    assert sum(map(int, input_data.split())) == int(output_data)
+    assert len(input_data) <= max(io_size, 1)
+
+
+def test_pick_statuses_is_seeded_and_weighted():
+    statuses = pick_statuses(random.Random(1), DEFAULT_MIX, 1000)
+
+    assert statuses == pick_statuses(random.Random(1), DEFAULT_MIX, 1000)
+    assert Counter(statuses).most_common(1)[0][0] == SolutionStatusEnum.ACCEPTED
+    assert (
+        pick_statuses(random.Random(1), {SolutionStatusEnum.WRONG_ANSWER: 1}, 3)
+        == [SolutionStatusEnum.WRONG_ANSWER] * 3
+    )
+
+
+@pytest.mark.parametrize(
+    "latencies, percentiles",
+    [
+        ([], (0.0, 0.0, 0.0)),
+        ([2.0], (2.0, 2.0, 2.0)),
+        ([float(i) for i in range(1, 101)], (50.5, 95.05, 99.01)),
+    ],
+)
+def test_report_percentiles(latencies, percentiles):
+    assert make_report(latencies).get_percentiles() == pytest.approx(percentiles)
+
+
+def test_report_throughput_is_per_minute():
+    assert make_report([1.0] * 10).throughput == 20.0
+    assert make_report([], elapsed=0.0).throughput == 0.0
+
+
+def test_report_format():
+    report = make_report(
+        [1.0, 3.0],
+        submissions=4,
+        container_starts=2,
+        verdicts=Counter({"accepted": 2}),
+        mismatches=1,
+    )
+
+    lines = report.format().splitlines()
+
+    assert lines[0] == "submissions\t2/4"
+    assert "container starts\t2 (0.50/submission)" in lines
+    assert "unexpected verdicts\t1" in lines
+    assert lines[-1] == "verdict accepted\t2"
@@ -0,0 +1,74 @@
+import io
+import os
+import time
+
+import pytest
+
+from core.blob_storage import BlobNotFoundError, get_blob_digest
+from core.blob_storage.cache import BlobCache
+from core.blob_storage.local import LocalBlobStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalBlobStorage(tmp_path / "blobs")
+
+
+def test_put_is_content_addressed(storage):
+    blob = storage.put(b"hello")
+
+    assert blob.digest == get_blob_digest(b"hello")
+    assert blob.size == 5
+    assert storage.read(blob.digest) == b"hello"
+    assert storage.put(b"hello") == blob
+
+
+def test_put_stream_matches_put(storage):
+    blob = storage.put_stream(io.BytesIO(b"x" * 3_000_000))
+
+    assert blob == storage.put(b"x" * 3_000_000)
+    assert storage.read(blob.digest) == b"x" * 3_000_000
+
+
+def test_missing_blob_raises(storage):
+    with pytest.raises(BlobNotFoundError):
+        storage.open(get_blob_digest(b"missing"))
+
+
+def test_cache_reads_through_to_storage(storage, tmp_path):
+    cache = BlobCache(storage, tmp_path / "cache", max_size=1024)
+    blob = storage.put(b"payload")
+
+    assert cache.read(blob.digest) == b"payload"
+    assert cache.read(blob.digest, 3) == b"pay"
+    assert (tmp_path / "cache" / blob.digest).is_file()
+
+
+def test_cache_rejects_corrupted_blob(storage, tmp_path):
+    cache = BlobCache(storage, tmp_path / "cache", max_size=1024)
+    blob = storage.put(b"payload")
+    storage.get_path(blob.digest).write_bytes(b"tampered")
+
+    with pytest.raises(ValueError):
+        cache.get_path(blob.digest)
+    assert not (tmp_path / "cache" / blob.digest).exists()
+
+
+def test_cache_evicts_least_recently_used_blobs(storage, tmp_path):
+    cache = BlobCache(storage, tmp_path / "cache", max_size=10)
+    old = storage.put(b"a" * 6)
+    new = storage.put(b"b" * 6)
+    cache.get_path(old.digest)
+    past = time.time() - 60
+    os.utime(tmp_path / "cache" / old.digest, (past, past))
+
+    cache.get_path(new.digest)
+
+    assert sorted(os.listdir(tmp_path / "cache")) == [new.digest]
+
+
+def test_read_can_be_limited(storage):
+    blob = storage.put(b"0123456789")
+
+    assert storage.read(blob.digest, 4) == b"0123"
+    assert storage.read(blob.digest) == b"0123456789"
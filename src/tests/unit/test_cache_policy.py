@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from starlette.requests import Request
+
+from core.cache import (
+    CachePolicy,
+    cache_policy,
+    collect_response_tags,
+    get_cache_policy,
+)
+from features.tasks.services import base as task_service
+from middlewares.cache import AutoCacheMiddleware
+from shared.enums import CacheScopeEnum
+
+
+def make_request(path: str = "/api/tasks/base/", query: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [(b"accept-language", b"en")],
+        }
+    )
+
+
+@pytest.fixture
+def middleware(monkeypatch):
+    middleware = AutoCacheMiddleware(None)
+    monkeypatch.setattr(middleware, "get_user_id", lambda request: "7")
+    monkeypatch.setattr(middleware, "is_space_member", AsyncMock(return_value=True))
+    return middleware
+
+
+def test_cache_policy_is_attached_to_endpoint():
+    @cache_policy(ttl=30, scope=CacheScopeEnum.SPACE, vary=("Accept-Language",))
+    async def endpoint(): ...
+
+    default = CachePolicy()
+
+    policy = get_cache_policy(endpoint, default)
+    assert policy == CachePolicy(30, CacheScopeEnum.SPACE, ("accept-language",))
+    assert get_cache_policy(None, default) is default
+    assert not CachePolicy(ttl=0).is_cacheable
+
+
+@pytest.mark.parametrize(
+    "policy, identity",
+    [
+        (CachePolicy(scope=CacheScopeEnum.PUBLIC), "public"),
+        (CachePolicy(scope=CacheScopeEnum.USER), "user:7"),
+        (CachePolicy(scope=CacheScopeEnum.SPACE), "space:3"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_cache_identity_follows_scope(middleware, policy, identity):
+    request = make_request()
+
+    assert (
+        await middleware.get_cache_identity(request, policy, {"space_id": 3})
+        == identity
+    )
+
+
+@pytest.mark.asyncio
+async def test_space_identity_requires_membership(middleware):
+    policy = CachePolicy(scope=CacheScopeEnum.SPACE)
+    middleware.is_space_member.return_value = False
+
+    assert (
+        await middleware.get_cache_identity(make_request(), policy, {"space_id": 3})
+        is None
+    )
+    middleware.is_space_member.assert_awaited_once_with(7, 3)
+    assert await middleware.get_cache_identity(make_request(), policy, {}) is None
+
+
+@pytest.mark.asyncio
+async def test_anonymous_requests_are_only_cached_publicly(middleware, monkeypatch):
+    monkeypatch.setattr(middleware, "get_user_id", lambda request: None)
+
+    assert (
+        await middleware.get_cache_identity(make_request(), CachePolicy(), {}) is None
+    )
+
+
+def test_cache_key_separates_users_queries_and_vary_headers(middleware):
+    policy = CachePolicy(vary=("accept-language",))
+    key = middleware.make_cache_key(make_request(query="a=1&b=2"), policy, "user:7")
+
+    assert key == middleware.make_cache_key(
+        make_request(query="b=2&a=1"), policy, "user:7"
+    )
+    assert key != middleware.make_cache_key(
+        make_request(query="a=1&b=2"), policy, "user:8"
+    )
+    assert key != middleware.make_cache_key(
+        make_request(query="a=1&b=2"), CachePolicy(), "user:7"
+    )
+
+
+def test_vary_header_includes_credentials_for_private_scopes(middleware):
+    assert middleware.get_vary_header(CachePolicy()) == "authorization, cookie"
+    assert middleware.get_vary_header(CachePolicy(scope=CacheScopeEnum.PUBLIC)) is None
+
+
+@pytest.mark.asyncio
+async def test_user_tasks_are_tagged_with_spaces_and_tasks(monkeypatch):
+    def patch(module, name, value):
+        monkeypatch.setattr(module, name, AsyncMock(return_value=value))
+
+    patch(
+        task_service.account_crud,
+        "get_accounts_by_user_id",
+        [SimpleNamespace(id=1, space_id=3)],
+    )
+    patch(task_service.module_crud, "get_modules_by_space_ids", [SimpleNamespace(id=5)])
+    patch(
+        task_service.base_task_crud,
+        "get_tasks_by_module_ids",
+        [SimpleNamespace(id=8), SimpleNamespace(id=9)],
+    )
+    patch(
+        task_service.progress_crud,
+        "get_account_task_progresses_by_account_ids_and_task_ids",
+        [],
+    )
+    monkeypatch.setattr(
+        task_service.mapper,
+        "build_base_task_read_with_progress_list",
+        lambda tasks, progresses: tasks,
+    )
+    tags = collect_response_tags()
+
+    await task_service.get_user_tasks(None, 7, None)
+
+    assert tags == {"space:3", "task:8", "task:9"}
@@ -0,0 +1,420 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from core.cache import (
+    CachePolicy,
+    collect_response_tags,
+    get_path_tags,
+    get_version_key,
+    invalidate_tags,
+    tag_response,
+    tags,
+)
+from core.redis import redis_connection
+from features.accounts.schemas import AccountRole
+from features.accounts.services import account as account_service
+from features.solutions.services import solution_feedback as feedback_service
+from features.tasks.services import test as test_service
+from middlewares.cache import AutoCacheMiddleware
+from shared.enums import CacheScopeEnum
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    async def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(redis_connection, "redis", redis)
+    return redis
+
+
+@pytest.fixture
+def client(redis):
+    calls = []
+
+    async def list_tasks(request):
+        calls.append(request.url.path)
+        tag_response("task:1")
+        return JSONResponse({"calls": len(calls)})
+
+    async def get_task(request):
+        calls.append(request.url.path)
+        return JSONResponse({"calls": len(calls)})
+
+    async def login(request):
+        return JSONResponse({"token": "new"})
+
+    app = Starlette(
+        routes=[
+            Route("/api/tasks/", list_tasks),
+            Route(
+                "/api/tasks/{task_id:int}/", get_task, methods=["GET", "PUT", "DELETE"]
+            ),
+            Route("/api/auth/login", login, methods=["POST"]),
+        ]
+    )
+    app.add_middleware(
+        AutoCacheMiddleware,
+        default_policy=CachePolicy(scope=CacheScopeEnum.PUBLIC),
+    )
+    return TestClient(app)
+
+
+def test_repeated_get_is_served_from_cache(client):
+    assert client.get("/api/tasks/1/").json() == {"calls": 1}
+    assert client.get("/api/tasks/1/").json() == {"calls": 1}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_bumps_versions_and_publishes(redis):
+    await invalidate_tags("task:1", "space:2")
+    await invalidate_tags("task:1")
+
+    assert redis.values[get_version_key("task:1")] == "2"
+    assert redis.values[get_version_key("space:2")] == "1"
+    assert redis.published[0][0] == tags.INVALIDATION_CHANNEL
+
+
+def test_bumped_tag_makes_entry_a_miss(client):
+    client.get("/api/tasks/1/")
+    client.get("/api/tasks/2/")
+
+    asyncio.run(invalidate_tags("task:1"))
+
+    assert client.get("/api/tasks/1/").json() == {"calls": 3}
+    assert client.get("/api/tasks/2/").json() == {"calls": 2}
+
+
+def test_auth_requests_keep_cached_entries(client, redis):
+    client.get("/api/tasks/")
+
+    client.post("/api/auth/login")
+
+    assert get_version_key("collection:tasks") not in redis.values
+    assert client.get("/api/tasks/").json() == {"calls": 1}
+
+
+def test_update_keeps_collection_entries(client):
+    client.get("/api/tasks/")
+    client.get("/api/tasks/2/")
+
+    client.put("/api/tasks/2/")
+
+    assert client.get("/api/tasks/").json() == {"calls": 1}
+    assert client.get("/api/tasks/2/").json() == {"calls": 4}
+
+
+def test_delete_invalidates_collection_entries(client):
+    client.get("/api/tasks/")
+
+    client.delete("/api/tasks/2/")
+
+    assert client.get("/api/tasks/").json() == {"calls": 3}
+
+
+def test_response_tags_invalidate_entry(client):
+    client.get("/api/tasks/")
+
+    asyncio.run(invalidate_tags("task:2"))
+    assert client.get("/api/tasks/").json() == {"calls": 1}
+    asyncio.run(invalidate_tags("task:1"))
+    assert client.get("/api/tasks/").json() == {"calls": 2}
+
+
+@pytest.mark.parametrize(
+    "method, path, path_params, expected",
+    [
+        ("PUT", "/api/tasks/base/5/", {"task_id": 5}, ["task:5"]),
+        (
+            "DELETE",
+            "/api/tasks/base/5/",
+            {"task_id": 5},
+            ["task:5", "collection:tasks"],
+        ),
+        ("DELETE", "/api/groups/3/", {"group_id": 3}, ["space:3", "collection:groups"]),
+        ("DELETE", "/api/spaces/3/leave/", {"space_id": 3}, ["space:3"]),
+        (
+            "DELETE",
+            "/api/tasks/base/solutions/7/",
+            {"solution_id": 7},
+            ["solution:7"],
+        ),
+        ("POST", "/api/modules/", {}, ["collection:modules"]),
+        ("POST", "/api/tasks/code/4/solutions", {"task_id": 4}, ["task:4"]),
+    ],
+)
+def test_write_tags(method, path, path_params, expected):
+    middleware = AutoCacheMiddleware(None)
+
+    assert middleware.make_write_tags(method, path, path_params) == expected
+
+
+def test_path_tags_map_params_to_entities():
+    assert get_path_tags({"group_id": 1, "task_id": 2, "page": 3}) == [
+        "space:1",
+        "task:2",
+    ]
+
+
+def test_tag_response_needs_collection():
+    tag_response("task:1")
+    collected = collect_response_tags()
+    tag_response("task:2", "space:3")
+
+    assert collected == {"task:2", "space:3"}
+
+
+USER_ID = 7
+
+
+def patch_async(monkeypatch, module, **values):
+    for name, value in values.items():
+        monkeypatch.setattr(module, name, AsyncMock(return_value=value))
+
+
+@pytest.fixture
+def services(monkeypatch):
+    task = SimpleNamespace(id=1, module_id=2, reference_code=None)
+    module = SimpleNamespace(id=2, space_id=3)
+    account = SimpleNamespace(id=4, role=AccountRole.MEMBER)
+    solution = SimpleNamespace(id=5, task_id=task.id)
+    entities = dict(
+        get_task_or_404=task,
+        get_module_or_404=module,
+        get_space_or_404=None,
+        get_account_or_404=account,
+    )
+
+    patch_async(
+        monkeypatch,
+        test_service,
+        **entities,
+        get_test_or_404=SimpleNamespace(id=6, task_id=task.id),
+        get_test_payloads={},
+    )
+    monkeypatch.setattr(test_service, "test_crud", AsyncMock())
+    monkeypatch.setattr(test_service, "mapper", MagicMock())
+    monkeypatch.setattr(test_service, "read_test_archive", lambda *args: [])
+
+    patch_async(
+        monkeypatch,
+        feedback_service,
+        **entities,
+        get_solution_or_404=solution,
+        get_solution_feedback_or_404=SimpleNamespace(solution_id=solution.id),
+    )
+    feedback_crud = AsyncMock()
+    feedback_crud.create_solution_feedback.return_value = MagicMock()
+    feedback_crud.update_solution_feedback.return_value = MagicMock()
+    monkeypatch.setattr(feedback_service, "solution_feedback_crud", feedback_crud)
+
+    patch_async(
+        monkeypatch,
+        account_service,
+        get_space_or_404=None,
+        get_account_or_404=account,
+        get_group_invite_by_code_or_404=SimpleNamespace(
+            id=8, space_id=module.space_id, is_active=True, needs_approval=False
+        ),
+        is_account_exists=False,
+        is_space_join_requests_exists=False,
+    )
+    monkeypatch.setattr(account_service, "account_crud", AsyncMock())
+    monkeypatch.setattr(account_service, "group_invite_crud", AsyncMock())
+    monkeypatch.setattr(account_service, "space_mapper", MagicMock())
+
+    for service in (test_service, feedback_service):
+        monkeypatch.setattr(service, "check_user_is_admin_or_owner", lambda role: None)
+    monkeypatch.setattr(
+        account_service, "check_space_invite_active", lambda is_active: None
+    )
+
+
+@pytest.fixture
+def service_client(redis, services):
+    calls = []
+
+    async def read(request):
+        calls.append(request.url.path)
+        return JSONResponse({"calls": len(calls)})
+
+    def write(call):
+        async def endpoint(request):
+            await call(request.path_params)
+            return JSONResponse({})
+
+        return endpoint
+
+    params = SimpleNamespace(model_dump=lambda **kwargs: {})
+    test_in = SimpleNamespace(task_id=1, correct_output="1")
+    test_write = write(
+        lambda path: test_service.update_test(None, USER_ID, path["test_id"], params)
+    )
+    test_delete = write(
+        lambda path: test_service.delete_test(None, USER_ID, path["test_id"])
+    )
+    feedback_write = write(
+        lambda path: feedback_service.update_solution_feedback(
+            None, USER_ID, path["solution_feedback_id"], params
+        )
+    )
+    feedback_delete = write(
+        lambda path: feedback_service.delete_solution_feedback(
+            None, USER_ID, path["solution_feedback_id"]
+        )
+    )
+
+    app = Starlette(
+        routes=[
+            Route("/api/tasks/code/{task_id:int}/tests/", read),
+            Route(
+                "/api/tasks/code/tests",
+                write(lambda path: test_service.create_test(None, USER_ID, test_in)),
+                methods=["POST"],
+            ),
+            Route(
+                "/api/tasks/code/{task_id:int}/tests/upload",
+                write(
+                    lambda path: test_service.upload_tests(
+                        None, USER_ID, path["task_id"], None, True, False
+                    )
+                ),
+                methods=["POST"],
+            ),
+            Route("/api/tasks/code/tests/{test_id:int}/", test_write, methods=["PUT"]),
+            Route(
+                "/api/tasks/code/tests/{test_id:int}/",
+                test_delete,
+                methods=["DELETE"],
+            ),
+            Route("/api/tasks/base/solutions/{solution_id:int}/feedbacks", read),
+            Route(
+                "/api/tasks/base/solutions/feedbacks",
+                write(
+                    lambda path: feedback_service.create_solution_feedback(
+                        None, USER_ID, 5, params
+                    )
+                ),
+                methods=["POST"],
+            ),
+            Route(
+                "/api/tasks/base/solutions/feedbacks/{solution_feedback_id:int}/",
+                feedback_write,
+                methods=["PUT"],
+            ),
+            Route(
+                "/api/tasks/base/solutions/feedbacks/{solution_feedback_id:int}/",
+                feedback_delete,
+                methods=["DELETE"],
+            ),
+            Route("/api/groups/", read),
+            Route(
+                "/api/groups/{group_id:int}/invites/{group_invite_code}/",
+                write(
+                    lambda path: account_service.join_to_group(
+                        None, USER_ID, path["group_invite_code"]
+                    )
+                ),
+                methods=["PUT"],
+            ),
+            Route(
+                "/api/spaces/{space_id:int}/leave/",
+                write(
+                    lambda path: account_service.leave_from_space(
+                        None, USER_ID, path["space_id"]
+                    )
+                ),
+                methods=["DELETE"],
+            ),
+        ]
+    )
+    app.add_middleware(
+        AutoCacheMiddleware,
+        default_policy=CachePolicy(scope=CacheScopeEnum.PUBLIC),
+    )
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "read_path, method, write_path",
+    [
+        ("/api/tasks/code/1/tests/", "POST", "/api/tasks/code/tests"),
+        ("/api/tasks/code/1/tests/", "POST", "/api/tasks/code/1/tests/upload"),
+        ("/api/tasks/code/1/tests/", "PUT", "/api/tasks/code/tests/6/"),
+        ("/api/tasks/code/1/tests/", "DELETE", "/api/tasks/code/tests/6/"),
+        (
+            "/api/tasks/base/solutions/5/feedbacks",
+            "POST",
+            "/api/tasks/base/solutions/feedbacks",
+        ),
+        (
+            "/api/tasks/base/solutions/5/feedbacks",
+            "PUT",
+            "/api/tasks/base/solutions/feedbacks/9/",
+        ),
+        (
+            "/api/tasks/base/solutions/5/feedbacks",
+            "DELETE",
+            "/api/tasks/base/solutions/feedbacks/9/",
+        ),
+        ("/api/groups/", "PUT", "/api/groups/3/invites/code/"),
+        ("/api/groups/", "DELETE", "/api/spaces/3/leave/"),
+    ],
+)
+def test_service_write_invalidates_cached_read(
+    service_client, read_path, method, write_path
+):
+    client = service_client
+    assert client.get(read_path).json() == {"calls": 1}
+    assert client.get(read_path).json() == {"calls": 1}
+
+    assert client.request(method, write_path).status_code == 200
+
+    assert client.get(read_path).json() == {"calls": 2}
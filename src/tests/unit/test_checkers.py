@@ -0,0 +1,132 @@
+import pytest
+
+from core.judge import checkers
+from core.judge.checkers import (
+    ExactChecker,
+    FloatChecker,
+    OutputCapture,
+    TokenChecker,
+    UnorderedLinesChecker,
+    create_checker,
+)
+from shared.enums import CheckerModeEnum
+
+
+def check(checker, output: bytes, chunk_size: int | None = None) -> bool:
+    chunk_size = chunk_size or max(len(output), 1)
+    for start in range(0, len(output), chunk_size):
+        checker.feed(output[start : start + chunk_size])
+    return checker.finish()
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 3])
+@pytest.mark.parametrize(
+    "expected, output",
+    [
+        (b"42", b"42"),
+        (b"42\n", b"42"),
+        (b"42\n", b"42\n"),
+        (b"42", b"  42 \n\n"),
+        (b"1 2\n3 4\n", b"1 2\n3 4"),
+    ],
+)
+def test_exact_checker_ignores_surrounding_whitespace(expected, output, chunk_size):
+    assert check(ExactChecker(expected, 64), output, chunk_size)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 3])
+@pytest.mark.parametrize(
+    "expected, output",
+    [
+        (b"42\n", b"43\n"),
+        (b"42\n", b"4"),
+        (b"42\n", b"421"),
+        (b"1 2\n", b"1  2\n"),
+        (b"1\n2\n", b"1\n\n2\n"),
+        (b"42\n", b""),
+    ],
+)
+def test_exact_checker_rejects_other_output(expected, output, chunk_size):
+    assert not check(ExactChecker(expected, 64), output, chunk_size)
+
+
+def test_exact_checker_accepts_empty_output_for_blank_expected():
+    assert check(ExactChecker(b"\n", 64), b"")
+
+
+def test_checker_keeps_preview_and_size():
+    checker = ExactChecker(b"0123456789", 4)
+
+    check(checker, b"0123456789", 3)
+
+    assert checker.get_preview() == "0123"
+    assert checker.size == 10
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2])
+@pytest.mark.parametrize(
+    "expected, output, matches",
+    [
+        (b"1 2 3\n", b"1\n2   3", True),
+        (b"1 2 3\n", b"1 2", False),
+        (b"1 2\n", b"1 2 3", False),
+        (b"12\n", b"1 2", False),
+    ],
+)
+def test_token_checker(expected, output, matches, chunk_size):
+    assert check(TokenChecker(expected, 64), output, chunk_size) is matches
+
+
+@pytest.mark.parametrize(
+    "expected, output, matches",
+    [
+        (b"0.333333 1\n", b"0.3333334 1.0", True),
+        (b"0.5\n", b"0.6", False),
+        (b"nan\n", b"nan", True),
+        (b"1.0\n", b"abc", False),
+    ],
+)
+def test_float_checker(expected, output, matches):
+    assert check(FloatChecker(expected, 64, 1e-6), output, 1) is matches
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 4])
+@pytest.mark.parametrize(
+    "expected, output, matches",
+    [
+        (b"a\nb\nb\n", b"b\na \n\nb", True),
+        (b"a\nb\nb\n", b"a\nb\n", False),
+        (b"a\nb\n", b"a\nb\nb\n", False),
+        (b"a\nb\n", b"a\na\n", False),
+        (b"1 2\n", b"1  2\n", False),
+    ],
+)
+def test_unordered_lines_checker(expected, output, matches, chunk_size):
+    assert check(UnorderedLinesChecker(expected, 64), output, chunk_size) is matches
+
+
+def test_unordered_lines_checker_compares_line_contents(monkeypatch):
+    monkeypatch.setattr(checkers, "hash", lambda line: 0, raising=False)
+
+    assert not check(UnorderedLinesChecker(b"a\n", 64), b"b\n")
+
+
+def test_output_capture_keeps_whole_output():
+    capture = OutputCapture(2)
+
+    assert check(capture, b"program output", 4) is None
+    assert capture.file.read() == b"program output"
+    assert capture.get_preview() == "pr"
+
+
+@pytest.mark.parametrize(
+    "mode, checker_type",
+    [
+        (CheckerModeEnum.TOKENS, TokenChecker),
+        (CheckerModeEnum.FLOAT, FloatChecker),
+        (CheckerModeEnum.UNORDERED_LINES, UnorderedLinesChecker),
+        (CheckerModeEnum.CUSTOM, OutputCapture),
+    ],
+)
+def test_create_checker_dispatches_on_mode(mode, checker_type):
+    assert type(create_checker(mode, b"", 1e-6, 64)) is checker_type
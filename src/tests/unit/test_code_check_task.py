@@ -0,0 +1,179 @@
+import socket
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.celery import code_check_task
+from core.celery.code_check_task import (
+    JUDGE_FAILURE_MESSAGE,
+    analyze_result,
+    judge_next,
+    judge_solution,
+    judge_tests_in_batch,
+    schedule_solution,
+    split_into_chunks,
+)
+from core.judge.container_pool import TIMEOUT_EXIT_CODE
+from core.config import settings
+from core.judge.harness import (
+    OUTPUT_LIMIT_EXIT_CODE,
+    HarnessProtocolError,
+    HarnessRecord,
+)
+from core.judge.scheduler import LIVE_PRIORITY, ScheduledSolution
+from core.judge.verdict import Verdict
+from shared.enums import SolutionStatusEnum
+
+ACCEPTED = Verdict(SolutionStatusEnum.ACCEPTED, 0)
+
+
+def make_tests(count: int) -> list[MagicMock]:
+    return [MagicMock(id=test_id) for test_id in range(1, count + 1)]
+
+
+def test_batch_returns_judge_failure_when_stream_times_out(monkeypatch):
+    def records(submission, tests):
+        yield MagicMock()
+        raise socket.timeout("timed out")
+
+    monkeypatch.setattr(code_check_task, "run_tests_in_container", records)
+    monkeypatch.setattr(code_check_task, "analyze_result", lambda *args: ACCEPTED)
+
+    verdicts = judge_tests_in_batch(MagicMock(), make_tests(3))
+
+    assert verdicts[0] == ACCEPTED
+    assert verdicts[-1].status == SolutionStatusEnum.RUNTIME_ERROR
+    assert verdicts[-1].result["error"] == JUDGE_FAILURE_MESSAGE
+
+
+def test_batch_returns_judge_failure_when_stream_breaks(monkeypatch):
+    def records(submission, tests):
+        raise ConnectionResetError("connection reset")
+        yield
+
+    monkeypatch.setattr(code_check_task, "run_tests_in_container", records)
+
+    verdicts = judge_tests_in_batch(MagicMock(), make_tests(2))
+
+    assert len(verdicts) == 1
+    assert verdicts[0].result["error"] == JUDGE_FAILURE_MESSAGE
+
+
+def test_batch_returns_judge_failure_on_malformed_record(monkeypatch):
+    def records(submission, tests):
+        raise HarnessProtocolError("Malformed harness record")
+        yield
+
+    monkeypatch.setattr(code_check_task, "run_tests_in_container", records)
+
+    verdicts = judge_tests_in_batch(MagicMock(), make_tests(2))
+
+    assert verdicts[0].result["error"] == JUDGE_FAILURE_MESSAGE
+
+
+@pytest.mark.parametrize(
+    "count, parallelism, sizes",
+    [(0, 4, []), (3, 4, [1, 1, 1]), (5, 2, [3, 2]), (4, 1, [4])],
+)
+def test_split_into_chunks(count, parallelism, sizes):
+    chunks = split_into_chunks(make_tests(count), parallelism)
+
+    assert [len(chunk) for chunk in chunks] == sizes
+
+
+@pytest.mark.parametrize("mode", ["batch", "per_test"])
+def test_task_without_tests_is_accepted(monkeypatch, mode):
+    monkeypatch.setattr(settings.judge, "mode", mode)
+    submission = MagicMock(checker_mode=None)
+    submission.runtime.is_compiled = False
+
+    verdict = judge_solution(submission, MagicMock(parallelism=4), [])
+
+    assert verdict.status == SolutionStatusEnum.ACCEPTED
+
+
+def test_batch_stops_at_first_failed_test(monkeypatch):
+    closed = []
+
+    def records(submission, tests):
+        try:
+            for _ in tests:
+                yield MagicMock()
+        finally:
+            closed.append(True)
+
+    failed = Verdict(SolutionStatusEnum.WRONG_ANSWER, {"status": "error"})
+    results = iter([ACCEPTED, failed, ACCEPTED])
+    monkeypatch.setattr(code_check_task, "run_tests_in_container", records)
+    monkeypatch.setattr(code_check_task, "analyze_result", lambda *args: next(results))
+
+    verdicts = judge_tests_in_batch(MagicMock(), make_tests(3))
+
+    assert verdicts == [ACCEPTED, failed]
+    assert closed == [True]
+
+
+def make_record(**fields) -> HarnessRecord:
+    return HarnessRecord(
+        **{
+            "test_id": 1,
+            "exit_code": 0,
+            "time_ms": 20,
+            "cpu_time_ms": 15,
+            "peak_memory_kb": 4096,
+            "oom_killed": False,
+            "stdout": "42",
+            "stderr": "",
+            "output_matches": True,
+            **fields,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "fields, status",
+    [
+        ({}, SolutionStatusEnum.ACCEPTED),
+        ({"exit_code": TIMEOUT_EXIT_CODE}, SolutionStatusEnum.TIME_LIMIT_EXCEEDED),
+        ({"oom_killed": True}, SolutionStatusEnum.MEMORY_LIMIT_EXCEEDED),
+        (
+            {"exit_code": OUTPUT_LIMIT_EXIT_CODE},
+            SolutionStatusEnum.OUTPUT_LIMIT_EXCEEDED,
+        ),
+        ({"exit_code": 1, "stderr": "Traceback"}, SolutionStatusEnum.RUNTIME_ERROR),
+    ],
+)
+def test_analyze_result_reports_status_with_resource_usage(fields, status):
+    verdict = analyze_result(make_record(**fields), MagicMock())
+
+    assert verdict.status == status
+    assert verdict.cpu_time_ms == 15
+    assert verdict.peak_memory_kb == 4096
+
+
+def test_schedule_solution_routes_to_runtime_queue(monkeypatch):
+    scheduler = MagicMock()
+    apply_async = MagicMock()
+    monkeypatch.setattr(code_check_task, "judge_scheduler", scheduler)
+    monkeypatch.setattr(code_check_task.judge_next, "apply_async", apply_async)
+
+    schedule_solution(7, 3, LIVE_PRIORITY, "C++", "job")
+
+    scheduler.enqueue.assert_called_once_with(7, 3, LIVE_PRIORITY, "cpp", "job")
+    apply_async.assert_called_once_with(("C++",), queue="judge.cpp")
+
+
+def test_judge_next_dequeues_from_language_queue(monkeypatch):
+    scheduler = MagicMock()
+    scheduler.dequeue.side_effect = [
+        ScheduledSolution(7, 3, LIVE_PRIORITY, "job", 0.0),
+        None,
+    ]
+    check_code = MagicMock(return_value="verdict")
+    monkeypatch.setattr(code_check_task, "judge_scheduler", scheduler)
+    monkeypatch.setattr(code_check_task, "check_code", check_code)
+
+    assert judge_next("JavaScript") == "verdict"
+    assert judge_next("JavaScript") is None
+    scheduler.dequeue.assert_called_with("javascript")
+    check_code.assert_called_once_with(7, "job")
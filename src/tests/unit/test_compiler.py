@@ -0,0 +1,66 @@
+import os
+import time
+
+import pytest
+
+from core.judge.compiler import (
+    ArtifactCache,
+    CompilationError,
+    check_compilation,
+    get_artifact_key,
+    get_compile_command,
+)
+from core.judge.runtimes import CHECKER_RUNTIME, RUNTIMES
+
+CPP_RUNTIME = next(runtime for runtime in RUNTIMES if runtime.slug == "cpp")
+
+
+def test_artifact_key_depends_on_source_and_image():
+    command = get_compile_command(CPP_RUNTIME)
+    key = get_artifact_key("sha256:image", command, "int main() {}")
+
+    assert key.startswith("image-")
+    assert key == get_artifact_key("sha256:image", command, "int main() {}")
+    assert key != get_artifact_key("sha256:other", command, "int main() {}")
+    assert key != get_artifact_key("sha256:image", command, "int main() {return 1;}")
+
+
+def test_checker_and_solution_artifacts_do_not_collide():
+    source = "int main() {}"
+
+    # Both runtimes use the same image, but the checker is linked statically.
+    assert CHECKER_RUNTIME.image == CPP_RUNTIME.image
+    assert get_artifact_key(
+        "sha256:image", get_compile_command(CHECKER_RUNTIME), source
+    ) != get_artifact_key("sha256:image", get_compile_command(CPP_RUNTIME), source)
+
+
+def test_artifact_cache_round_trips(tmp_path):
+    cache = ArtifactCache(tmp_path, max_entries=10)
+
+    cache.put("key", b"binary")
+
+    assert cache.get("key") == b"binary"
+    assert cache.get("missing") is None
+
+
+def test_artifact_cache_evicts_least_recently_used(tmp_path):
+    cache = ArtifactCache(tmp_path, max_entries=2)
+    cache.put("old", b"1")
+    cache.put("used", b"2")
+    past = time.time() - 60
+    os.utime(tmp_path / "old", (past, past))
+    os.utime(tmp_path / "used", (past - 60, past - 60))
+    cache.get("used")
+
+    cache.put("new", b"3")
+
+    assert sorted(os.listdir(tmp_path)) == ["new", "used"]
+
+
+def test_failed_compilation_raises_with_output():
+    with pytest.raises(CompilationError) as error:
+        check_compilation(None, b"error: expected ';'\n", 1)
+
+    assert error.value.output == "error: expected ';'"
+    assert check_compilation(b"binary", b"", 0) == b"binary"
@@ -0,0 +1,79 @@
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from middlewares.conditional import ConditionalGetMiddleware
+from utils.response_func import is_etag_match, make_etag
+
+ETAG = make_etag(b'{"id":1}')
+
+
+@pytest.fixture
+def client():
+    async def get_task(request):
+        return JSONResponse(
+            {"id": 1}, headers={"ETag": ETAG, "Vary": "cookie", "X-Other": "1"}
+        )
+
+    async def missing(request):
+        return JSONResponse({}, status_code=404, headers={"ETag": ETAG})
+
+    app = Starlette(
+        routes=[
+            Route("/task", get_task, methods=["GET", "POST"]),
+            Route("/missing", missing),
+        ]
+    )
+    app.add_middleware(ConditionalGetMiddleware)
+    return TestClient(app)
+
+
+def test_make_etag_is_quoted_and_stable():
+    assert ETAG == make_etag(b'{"id":1}')
+    assert ETAG != make_etag(b'{"id":2}')
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+
+
+@pytest.mark.parametrize(
+    "if_none_match, matches",
+    [
+        (None, False),
+        ("", False),
+        ("*", True),
+        (ETAG, True),
+        (f"W/{ETAG}", True),
+        (f'"other", {ETAG}', True),
+        ('"other"', False),
+    ],
+)
+def test_is_etag_match(if_none_match, matches):
+    assert is_etag_match(if_none_match, ETAG) is matches
+
+
+def test_matching_etag_returns_not_modified(client):
+    response = client.get("/task", headers={"If-None-Match": ETAG})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == ETAG
+    assert response.headers["vary"] == "cookie"
+    assert "x-other" not in response.headers
+
+
+def test_stale_etag_returns_full_response(client):
+    response = client.get("/task", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json() == {"id": 1}
+
+
+@pytest.mark.parametrize(
+    "method, path, status_code",
+    [("POST", "/task", 200), ("GET", "/missing", 404)],
+)
+def test_only_successful_reads_are_conditional(client, method, path, status_code):
+    response = client.request(method, path, headers={"If-None-Match": ETAG})
+
+    assert response.status_code == status_code
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.judge.container_pool import ContainerPool
+from core.judge.runtimes import runtime_registry
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(runtime_registry, "get_image", lambda runtime: "sha256:image")
+    pool = ContainerPool(size=1, max_runs=2)
+    pool._client = MagicMock()
+    pool._client.containers.run.side_effect = lambda **kwargs: MagicMock(
+        status="running", exec_run=MagicMock(return_value=MagicMock(exit_code=0))
+    )
+    return pool
+
+
+def test_acquire_reuses_released_container(pool):
+    with pool.acquire(MagicMock(), "64m") as first:
+        first.runs += 1
+    with pool.acquire(MagicMock(), "64m") as second:
+        pass
+
+    assert second is first
+    assert pool._client.containers.run.call_count == 1
+
+
+def test_acquire_replaces_container_after_max_runs(pool):
+    with pool.acquire(MagicMock(), "64m") as first:
+        first.runs = pool.max_runs
+    with pool.acquire(MagicMock(), "64m") as second:
+        pass
+
+    assert second is not first
+    first.container.remove.assert_called_once_with(force=True)
+
+
+def test_acquire_discards_container_on_failure(pool):
+    with pytest.raises(RuntimeError):
+        with pool.acquire(MagicMock(), "64m") as first:
+            raise RuntimeError("judge failed")
+    with pool.acquire(MagicMock(), "64m") as second:
+        pass
+
+    assert second is not first
+    first.container.remove.assert_called_once_with(force=True)
+
+
+def test_release_discards_container_that_fails_reset(pool):
+    with pool.acquire(MagicMock(), "64m") as first:
+        first.container.exec_run.return_value = MagicMock(exit_code=1)
+
+    assert first not in pool._idle["sha256:image"]
+    first.container.remove.assert_called_once_with(force=True)
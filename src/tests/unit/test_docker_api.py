@@ -0,0 +1,65 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core.judge.docker_api import AsyncDockerClient, DockerAPIError
+
+
+def make_frame(stream_id: int, data: bytes) -> bytes:
+    return bytes([stream_id, 0, 0, 0]) + len(data).to_bytes(4, "big") + data
+
+
+async def serve_exec(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    request = await reader.readuntil(b"\r\n\r\n")
+    length = int(request.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+    await reader.readexactly(length)
+    writer.write(b"HTTP/1.1 101 UPGRADED\r\nConnection: Upgrade\r\n\r\n")
+    stdin = await reader.read()
+    writer.write(make_frame(1, stdin.upper()) + make_frame(2, b"warning"))
+    await writer.drain()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_frames_demultiplexes_streams():
+    reader = asyncio.StreamReader()
+    reader.feed_data(make_frame(1, b"out") + make_frame(2, b"err") + make_frame(1, b""))
+    reader.feed_eof()
+
+    frames = [frame async for frame in AsyncDockerClient._iter_frames(reader)]
+
+    assert frames == [(1, b"out"), (2, b"err"), (1, b"")]
+
+
+@pytest.mark.asyncio
+async def test_exec_start_streams_stdin_and_output(tmp_path):
+    socket_path = str(tmp_path / "docker.sock")
+    server = await asyncio.start_unix_server(serve_exec, socket_path)
+    client = AsyncDockerClient(socket_path, "1.41")
+    try:
+        async with client.exec_start("exec-id", b"hello") as frames:
+            output = [frame async for frame in frames]
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert output == [(1, b"HELLO"), (2, b"warning")]
+
+
+@pytest.mark.asyncio
+async def test_api_errors_carry_docker_message():
+    client = AsyncDockerClient("/var/run/docker.sock", "1.41")
+    client._http = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(404, json={"message": "No such container"})
+        ),
+        base_url="http://docker/v1.41",
+    )
+
+    with pytest.raises(DockerAPIError) as error:
+        await client.inspect_container("missing")
+    await client.close()
+
+    assert error.value.status_code == 404
+    assert error.value.message == "No such container"
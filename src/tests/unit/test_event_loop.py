@@ -0,0 +1,83 @@
+import asyncio
+import logging
+
+import pytest
+from celery.signals import worker_process_shutdown
+
+from core.celery import event_loop
+from core.celery.event_loop import WorkerEventLoop
+
+
+@pytest.fixture
+def worker_loop():
+    loop = WorkerEventLoop()
+    yield loop
+    loop.stop()
+
+
+def test_run_reuses_one_background_loop(worker_loop):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = worker_loop.run(current_loop())
+
+    assert worker_loop.run(current_loop()) is first
+    assert worker_loop.is_running
+
+
+def test_run_propagates_exceptions(worker_loop):
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        worker_loop.run(fail())
+
+
+def test_stop_runs_cleanups_in_reverse_order(worker_loop, caplog):
+    calls = []
+
+    async def close_redis():
+        calls.append("redis")
+
+    async def close_engine():
+        calls.append("engine")
+        raise ConnectionError("already closed")
+
+    worker_loop.on_stop(close_redis)
+    worker_loop.on_stop(close_engine)
+    worker_loop.start()
+
+    with caplog.at_level(logging.ERROR):
+        worker_loop.stop()
+
+    assert calls == ["engine", "redis"]
+    assert "cleanup" in caplog.text
+    assert not worker_loop.is_running
+
+
+def test_stop_skips_cleanups_when_never_started(worker_loop):
+    calls = []
+
+    async def cleanup():
+        calls.append("cleanup")
+
+    worker_loop.on_stop(cleanup)
+    worker_loop.stop()
+
+    assert calls == []
+
+
+def test_worker_process_shutdown_stops_shared_loop(worker_loop, monkeypatch):
+    calls = []
+
+    async def dispose_engine():
+        calls.append("engine")
+
+    monkeypatch.setattr(event_loop, "worker_loop", worker_loop)
+    worker_loop.on_stop(dispose_engine)
+    worker_loop.start()
+
+    worker_process_shutdown.send(sender=None)
+
+    assert calls == ["engine"]
+    assert not worker_loop.is_running
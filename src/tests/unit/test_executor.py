@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+from core.judge.executor import run_until_first_failure, run_until_first_failure_async
+
+
+def is_failure(result: str) -> bool:
+    return result == "fail"
+
+
+def test_sequential_jobs_stop_at_first_failure():
+    calls = []
+
+    def job(result: str):
+        def run() -> str:
+            calls.append(result)
+            return result
+
+        return run
+
+    results = run_until_first_failure(
+        [job("ok"), job("fail"), job("ok")], is_failure, parallelism=1
+    )
+
+    assert results == ["ok", "fail"]
+    assert calls == ["ok", "fail"]
+
+
+def test_parallel_jobs_return_results_up_to_first_failure_in_order():
+    def job(result: str, delay: float):
+        def run() -> str:
+            time.sleep(delay)
+            return result
+
+        return run
+
+    results = run_until_first_failure(
+        [job("ok", 0.05), job("fail", 0.01), job("ok", 0.02), job("ok", 0.01)],
+        is_failure,
+        parallelism=4,
+    )
+
+    assert results == ["ok", "fail"]
+
+
+def test_parallel_jobs_running_after_failure_finish_before_return():
+    finished = threading.Event()
+
+    def fail() -> str:
+        time.sleep(0.05)
+        return "fail"
+
+    def slow() -> str:
+        time.sleep(0.2)
+        finished.set()
+        return "ok"
+
+    results = run_until_first_failure([fail, slow], is_failure, parallelism=2)
+
+    assert results == ["fail"]
+    assert finished.is_set()
+
+
+def test_async_jobs_stop_at_first_failure():
+    finished = []
+
+    def job(result: str, delay: float):
+        async def run() -> str:
+            await asyncio.sleep(delay)
+            finished.append(result)
+            return result
+
+        return run
+
+    results = asyncio.run(
+        run_until_first_failure_async(
+            [job("ok", 0.02), job("fail", 0.01), job("slow", 1)],
+            is_failure,
+            parallelism=3,
+        )
+    )
+
+    assert results == ["ok", "fail"]
+    assert "slow" not in finished
@@ -0,0 +1,87 @@
+import pytest
+
+from core.judge.checkers import OutputChecker
+from core.judge.harness import STDOUT_STREAM, HarnessProtocolError, HarnessRecordParser
+
+
+def make_record(test_id: int, stdout: bytes, stderr: bytes = b"", **fields) -> bytes:
+    header = [
+        test_id,
+        fields.get("exit_code", 0),
+        fields.get("time_ms", 12),
+        fields.get("cpu_time_ms", 10),
+        fields.get("peak_memory_kb", 2048),
+        fields.get("oom_killed", 0),
+        len(stdout),
+        len(stderr),
+    ]
+    return b"@@test " + " ".join(map(str, header)).encode() + b"\n" + stdout + stderr
+
+
+def test_parser_reads_consecutive_records():
+    parser = HarnessRecordParser(preview_size=64)
+    data = make_record(1, b"42\n") + make_record(2, b"", b"boom", exit_code=1)
+
+    records = parser.feed(STDOUT_STREAM, data)
+
+    assert [record.test_id for record in records] == [1, 2]
+    assert records[0].stdout == "42\n"
+    assert records[0].cpu_time_ms == 10
+    assert records[0].peak_memory_kb == 2048
+    assert records[1].exit_code == 1
+    assert records[1].stderr == "boom"
+
+
+def test_parser_handles_records_split_across_frames():
+    parser = HarnessRecordParser(preview_size=64)
+    data = make_record(7, b"hello world", b"warning", oom_killed=1)
+
+    records = []
+    for position in range(len(data)):
+        records += parser.feed(STDOUT_STREAM, data[position : position + 1])
+
+    assert len(records) == 1
+    assert records[0].stdout == "hello world"
+    assert records[0].stderr == "warning"
+    assert records[0].oom_killed is True
+    assert records[0].output_size == len(b"hello world")
+
+
+def test_parser_truncates_previews_but_counts_full_output():
+    parser = HarnessRecordParser(preview_size=4)
+
+    [record] = parser.feed(STDOUT_STREAM, make_record(1, b"0123456789", b"abcdefg"))
+
+    assert record.stdout == "0123"
+    assert record.stderr == "abcd"
+    assert record.output_size == 10
+
+
+def test_parser_passes_stdout_to_the_test_checker():
+    checkers = {}
+
+    def create_checker(test_id: int) -> OutputChecker:
+        checkers[test_id] = OutputChecker(64)
+        return checkers[test_id]
+
+    parser = HarnessRecordParser(create_checker, preview_size=64)
+    parser.feed(STDOUT_STREAM, make_record(3, b"abc"))
+
+    assert checkers[3].size == 3
+
+
+def test_parser_ignores_other_streams():
+    parser = HarnessRecordParser(preview_size=64)
+
+    assert parser.feed(2, make_record(1, b"x")) == []
+
+
+@pytest.mark.parametrize(
+    "header",
+    [b"garbage 1 2 3 4 5 6 7 8\n", b"@@test 1 0 5\n", b"@@test 1 0 5 5 64 0 x 0\n"],
+)
+def test_parser_rejects_malformed_header(header):
+    parser = HarnessRecordParser(preview_size=64)
+
+    with pytest.raises(HarnessProtocolError):
+        parser.feed(STDOUT_STREAM, header)
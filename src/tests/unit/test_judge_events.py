@@ -0,0 +1,89 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from core.judge import events
+from core.judge.events import SolutionEventPublisher, get_solution_channel
+from core.judge.verdict import Verdict
+from features.solutions.services.base import _iter_judge_events
+from shared.enums import SolutionStatusEnum
+from utils.response_func import format_server_sent_event
+
+
+class FakePubSub:
+    def __init__(self, messages: list[dict | None]):
+        self.messages = messages
+        self.unsubscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float):
+        return self.messages.pop(0)
+
+
+def make_message(event: str, data: dict) -> dict:
+    return {"data": json.dumps({"event": event, "data": data})}
+
+
+def test_publisher_sends_test_events_to_solution_channel(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(events, "sync_redis_client", client)
+
+    SolutionEventPublisher(7).test_judged(
+        3, Verdict(SolutionStatusEnum.ACCEPTED, 0, 12, 2048)
+    )
+
+    channel, payload = client.publish.call_args.args
+    assert channel == get_solution_channel(7)
+    assert json.loads(payload) == {
+        "event": "test",
+        "data": {
+            "test_id": 3,
+            "status": SolutionStatusEnum.ACCEPTED.value,
+            "cpu_time_ms": 12,
+            "peak_memory_kb": 2048,
+        },
+    }
+
+
+def test_publisher_ignores_redis_errors(monkeypatch):
+    client = MagicMock()
+    client.publish.side_effect = RedisError("down")
+    monkeypatch.setattr(events, "sync_redis_client", client)
+
+    SolutionEventPublisher(7).started(10)
+
+
+@pytest.mark.asyncio
+async def test_stream_forwards_events_until_verdict():
+    pubsub = FakePubSub(
+        [
+            make_message("started", {"tests": 2}),
+            None,
+            make_message("verdict", {"id": 7}),
+            make_message("test", {"test_id": 1}),
+        ]
+    )
+
+    chunks = [chunk async for chunk in _iter_judge_events(pubsub)]
+
+    assert chunks == [
+        format_server_sent_event("started", '{"tests": 2}'),
+        ": keepalive\n\n",
+        format_server_sent_event("verdict", '{"id": 7}'),
+    ]
+    pubsub.unsubscribe.assert_awaited_once()
+    pubsub.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_for_judged_solution_sends_verdict_at_once():
+    pubsub = FakePubSub([])
+    solution = MagicMock()
+    solution.model_dump_json.return_value = '{"id": 7}'
+
+    chunks = [chunk async for chunk in _iter_judge_events(pubsub, solution)]
+
+    assert chunks == [format_server_sent_event("verdict", '{"id": 7}')]
+    pubsub.aclose.assert_awaited_once()
@@ -0,0 +1,94 @@
+import pytest
+
+from core.cache import CacheEntry
+from core.cache import tags as cache_tags
+from core.cache.local import LocalCache
+
+
+def make_entry(body: str = "{}", tags: list[str] | None = None) -> CacheEntry:
+    return CacheEntry(body, '"etag"', tags or ["task:1"])
+
+
+@pytest.fixture
+def cache():
+    cache = LocalCache(max_entries=2, max_bytes=10, ttl=60)
+    cache.enabled = True
+    return cache
+
+
+def test_disabled_cache_stores_nothing(cache):
+    cache.enabled = False
+    cache.put("a", make_entry(), 60, cache.generation)
+
+    cache.enabled = True
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    cache.put("a", make_entry(), 60, cache.generation)
+    cache.put("b", make_entry(), 60, cache.generation)
+    cache.get("a")
+
+    cache.put("c", make_entry(), 60, cache.generation)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_cache_is_bounded_by_bytes(cache):
+    cache.put("a", make_entry("123456"), 60, cache.generation)
+    cache.put("b", make_entry("123456"), 60, cache.generation)
+    cache.put("big", make_entry("x" * 11), 60, cache.generation)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("big") is None
+    assert cache.size == 6
+
+
+def test_expired_entry_is_dropped(cache, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("core.cache.local.time.monotonic", lambda: now)
+    cache.put("a", make_entry(), 5, cache.generation)
+    cache.put("b", make_entry(), 600, cache.generation)
+
+    now += 30
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    now += 31
+    assert cache.get("b") is None
+
+
+def test_entry_fetched_before_invalidation_is_not_stored(cache):
+    generation = cache.generation
+    cache.invalidate(["task:1"])
+
+    cache.put("a", make_entry(), 60, generation)
+
+    assert cache.get("a") is None
+
+
+def test_invalidate_drops_only_tagged_entries(cache):
+    cache.put("a", make_entry(tags=["task:1", "space:1"]), 60, cache.generation)
+    cache.put("b", make_entry(tags=["task:2", "space:1"]), 60, cache.generation)
+
+    cache.invalidate(["task:1"])
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert "task:1" not in cache._keys_by_tag
+
+
+@pytest.mark.parametrize(
+    "tags, remaining",
+    [(["task:1"], {"b"}), (None, set()), (["space:9"], {"a", "b"})],
+)
+def test_drop_local_entries(cache, monkeypatch, tags, remaining):
+    monkeypatch.setattr(cache_tags, "local_cache", cache)
+    cache.put("a", make_entry(tags=["task:1", "space:1"]), 60, cache.generation)
+    cache.put("b", make_entry(tags=["task:2", "space:1"]), 60, cache.generation)
+
+    cache_tags.drop_local_entries(tags)
+
+    assert {key for key in "ab" if cache.get(key)} == remaining
@@ -0,0 +1,127 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.blob_storage.local import LocalBlobStorage
+from core.celery import reference_task
+from core.celery.reference_task import generate_expected_outputs, get_reference_failure
+from core.judge.checkers import create_checker
+from core.judge.container_pool import TIMEOUT_EXIT_CODE
+from core.judge.harness import OUTPUT_LIMIT_EXIT_CODE, HarnessRecord
+from core.judge.reference import get_output_source
+from shared.enums import CheckerModeEnum
+
+
+def make_record(exit_code: int = 0, stderr: str = "", **kwargs) -> HarnessRecord:
+    return HarnessRecord(1, exit_code, 10, 10, 1024, False, "", stderr, **kwargs)
+
+
+@pytest.fixture
+def task_env(tmp_path, monkeypatch):
+    storage = LocalBlobStorage(tmp_path)
+    session = MagicMock()
+    session.get.return_value = MagicMock(
+        reference_code="print(42)",
+        reference_language="Python",
+        memory_limit=64,
+        time_limit=1000,
+    )
+    session.scalars.return_value.all.return_value = [
+        MagicMock(id=1, input_hash="in", output_source=None)
+    ]
+    session.execute.return_value = MagicMock(rowcount=1)
+    monkeypatch.setattr(reference_task, "blob_storage", storage)
+    monkeypatch.setattr(reference_task, "SessionLocal", MagicMock())
+    reference_task.SessionLocal.return_value.__enter__.return_value = session
+    monkeypatch.setattr(reference_task, "ReferenceRun", MagicMock())
+    monkeypatch.setattr(reference_task, "invalidate_tags_sync", MagicMock())
+    monkeypatch.setattr(
+        reference_task,
+        "get_runtime_or_404",
+        lambda language: MagicMock(language=language, is_compiled=False),
+    )
+    monkeypatch.setattr(reference_task, "get_execution_backend", lambda task: "pool")
+    monkeypatch.setattr(reference_task, "EXECUTION_POOLS", {"pool": MagicMock()})
+    return storage, session
+
+
+def use_records(monkeypatch, *records: HarnessRecord) -> dict:
+    state = {"closed": False}
+
+    def run_tests_in_batch(*args):
+        try:
+            yield from records
+        finally:
+            state["closed"] = True
+
+    monkeypatch.setattr(reference_task, "run_tests_in_batch", run_tests_in_batch)
+    return state
+
+
+@pytest.mark.parametrize(
+    "mode", [mode for mode in CheckerModeEnum if mode != CheckerModeEnum.CUSTOM]
+)
+def test_reference_output_passes_checker(task_env, monkeypatch, mode):
+    storage, session = task_env
+    output = b"42 \n\n"
+    use_records(monkeypatch, make_record(output_file=io.BytesIO(output)))
+
+    generate_expected_outputs(1)
+
+    statement = session.execute.call_args_list[0].args[0]
+    expected = storage.read(statement.compile().params["output_hash"])
+    checker = create_checker(mode, expected, 1e-6, 64)
+    checker.feed(output)
+    assert expected == b"42"
+    assert checker.finish()
+    reference_task.ReferenceRun.return_value.mark_finished.assert_called_with(1, 0, "")
+
+
+def test_records_are_closed_when_storing_fails(task_env, monkeypatch):
+    _, session = task_env
+    session.execute.side_effect = RuntimeError("database is gone")
+    state = use_records(
+        monkeypatch,
+        make_record(output_file=io.BytesIO(b"1")),
+        make_record(output_file=io.BytesIO(b"2")),
+    )
+
+    with pytest.raises(RuntimeError):
+        generate_expected_outputs(1)
+
+    assert state["closed"]
+
+
+def test_reference_failure_is_reported(task_env, monkeypatch):
+    use_records(monkeypatch, make_record(1, "boom", output_file=io.BytesIO(b"")))
+
+    generate_expected_outputs(1)
+
+    reference_task.ReferenceRun.return_value.mark_finished.assert_called_with(
+        0, 1, "Test 1: boom"
+    )
+
+
+@pytest.mark.parametrize(
+    "record, failure",
+    [
+        (make_record(), None),
+        (make_record(TIMEOUT_EXIT_CODE), "Time limit exceeded"),
+        (make_record(137), "Memory limit exceeded"),
+        (make_record(OUTPUT_LIMIT_EXIT_CODE), "Output limit exceeded"),
+        (make_record(2), "Exited with code 2"),
+        (make_record(0, "warning\n"), "warning"),
+    ],
+)
+def test_get_reference_failure(record, failure):
+    assert get_reference_failure(record) == failure
+
+
+def test_output_source_depends_on_every_part():
+    source = get_output_source("print(1)", "Python", "abc")
+
+    assert source == get_output_source("print(1)", "Python", "abc")
+    assert source != get_output_source("print(2)", "Python", "abc")
+    assert source != get_output_source("print(1)", "C++", "abc")
+    assert source != get_output_source("print(1)", "Python", "abd")
@@ -0,0 +1,77 @@
+import pytest
+
+from core.judge import rejudge
+from core.judge.rejudge import FINISHED_STATUS, RejudgeProgress, get_rejudge_key
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+
+    def hsetnx(self, key, field, value):
+        if field in self.hashes.setdefault(key, {}):
+            return 0
+        self.hashes[key][field] = str(value)
+        return 1
+
+    def hincrby(self, key, field, amount):
+        values = self.hashes.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+        return int(values[field])
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(rejudge, "sync_redis_client", client)
+    return client
+
+
+def test_last_judged_solution_claims_finalization(redis):
+    progress = RejudgeProgress("job")
+    progress.add_enqueued(2)
+
+    assert progress.mark_running() is False
+    assert progress.mark_done() is False
+    assert progress.mark_done() is True
+    assert progress.mark_done() is False
+
+
+def test_enqueuing_finishing_after_judging_claims_finalization(redis):
+    progress = RejudgeProgress("job")
+    progress.add_enqueued(1)
+    progress.mark_done()
+
+    assert progress.mark_running() is True
+
+
+def test_finalization_waits_until_every_batch_is_enqueued(redis):
+    progress = RejudgeProgress("job")
+    progress.add_enqueued(1)
+
+    assert progress.mark_done() is False
+    progress.add_enqueued(1)
+    assert progress.mark_running() is False
+    assert progress.mark_done() is True
+
+
+def test_finished_job_expires(redis):
+    progress = RejudgeProgress("job")
+
+    progress.mark_finished()
+
+    assert redis.hashes[get_rejudge_key("job")]["status"] == FINISHED_STATUS
+    assert get_rejudge_key("job") in redis.ttls
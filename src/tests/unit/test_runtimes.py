@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+import pytest
+from docker.errors import ImageNotFound
+
+from core.judge.runtimes import (
+    CONTEXT_HASH_LABEL,
+    RUNTIMES,
+    Runtime,
+    RuntimeRegistry,
+    get_context_hash,
+)
+from shared.exceptions.existence import LanguageNotFountException
+
+
+@pytest.fixture
+def runtime(tmp_path):
+    (tmp_path / "Dockerfile").write_text("FROM python:3.9-slim\n")
+    return Runtime(
+        language="Python",
+        slug="python",
+        image="runner-python:test",
+        build_path=tmp_path,
+        command=lambda code: ["python", "-c", code],
+    )
+
+
+def make_client(labels: dict | None) -> MagicMock:
+    client = MagicMock()
+    if labels is None:
+        client.images.get.side_effect = ImageNotFound("missing")
+    else:
+        client.images.get.return_value = MagicMock(id="sha256:cached", labels=labels)
+    client.images.build.return_value = (MagicMock(id="sha256:built"), [])
+    return client
+
+
+def test_context_hash_changes_with_build_context(tmp_path):
+    (tmp_path / "Dockerfile").write_text("FROM python:3.9-slim\n")
+    before = get_context_hash(tmp_path)
+    (tmp_path / "requirements.txt").write_text("numpy\n")
+
+    assert get_context_hash(tmp_path) != before
+    assert get_context_hash(tmp_path) == get_context_hash(tmp_path)
+
+
+def test_image_with_matching_context_is_reused(runtime):
+    client = make_client({CONTEXT_HASH_LABEL: get_context_hash(runtime.build_path)})
+
+    assert RuntimeRegistry._ensure_image(client, runtime) == "sha256:cached"
+    client.images.build.assert_not_called()
+
+
+def test_image_with_stale_context_is_rebuilt(runtime):
+    client = make_client({CONTEXT_HASH_LABEL: "stale"})
+
+    assert RuntimeRegistry._ensure_image(client, runtime) == "sha256:built"
+    labels = client.images.build.call_args.kwargs["labels"]
+    assert labels == {CONTEXT_HASH_LABEL: get_context_hash(runtime.build_path)}
+
+
+def test_missing_image_is_built(runtime):
+    client = make_client(None)
+
+    assert RuntimeRegistry._ensure_image(client, runtime) == "sha256:built"
+
+
+def test_rebuild_ignores_cached_image(runtime):
+    client = make_client({CONTEXT_HASH_LABEL: get_context_hash(runtime.build_path)})
+
+    assert RuntimeRegistry._ensure_image(client, runtime, rebuild=True) == (
+        "sha256:built"
+    )
+
+
+def test_unknown_language_is_rejected():
+    with pytest.raises(LanguageNotFountException):
+        RuntimeRegistry().get("Brainfuck")
+
+
+def test_runtimes_have_distinct_queues():
+    queues = [runtime.queue for runtime in RUNTIMES]
+
+    assert len(set(queues)) == len(RUNTIMES)
+    assert RuntimeRegistry().get("C++").queue == "judge.cpp"
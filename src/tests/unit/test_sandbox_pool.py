@@ -0,0 +1,123 @@
+import platform
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from core.judge import sandbox_launcher
+from core.judge.sandbox_pool import (
+    STDERR_STREAM,
+    STDOUT_STREAM,
+    SandboxPool,
+    _iter_frames,
+)
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    pool = SandboxPool(root_dir=tmp_path, uid_base=1000, max_concurrency=2)
+    monkeypatch.setattr(pool, "get_root", lambda runtime: tmp_path / "image")
+    return pool
+
+
+def test_acquire_hands_out_distinct_uids(pool):
+    with pool.acquire(object(), "64m") as first:
+        with pool.acquire(object(), "64m") as second:
+            assert {first.uid, second.uid} == {1000, 1001}
+    assert first.mem_limit == 64 * 1024 * 1024
+
+
+def test_acquire_returns_uid_after_failure(pool):
+    with pytest.raises(RuntimeError):
+        with pool.acquire(object(), "64m"):
+            raise RuntimeError("judge failed")
+
+    assert sorted(pool._uids) == [1000, 1001]
+
+
+def test_acquire_waits_for_free_slot(pool):
+    acquired = threading.Event()
+
+    def acquire_third():
+        with pool.acquire(object(), "64m"):
+            acquired.set()
+
+    with pool.acquire(object(), "64m"), pool.acquire(object(), "64m"):
+        thread = threading.Thread(target=acquire_third)
+        thread.start()
+        assert not acquired.wait(0.1)
+    thread.join(1)
+    assert acquired.is_set()
+
+
+def test_iter_frames_separates_streams():
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys; print('out'); print('err', file=sys.stderr)",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    output = {STDOUT_STREAM: b"", STDERR_STREAM: b""}
+    for stream_id, data in _iter_frames(process, time.monotonic() + 10):
+        output[stream_id] += data
+    process.wait()
+
+    assert output == {STDOUT_STREAM: b"out\n", STDERR_STREAM: b"err\n"}
+
+
+def test_iter_frames_stops_at_deadline():
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(10)"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        with pytest.raises(TimeoutError):
+            list(_iter_frames(process, 0))
+    finally:
+        process.kill()
+        process.wait()
+
+
+@pytest.mark.skipif(
+    platform.machine() not in sandbox_launcher.DENIED_SYSCALLS,
+    reason="no seccomp filter for this architecture",
+)
+def test_seccomp_filter_denies_listed_syscalls():
+    arch, syscalls = sandbox_launcher.DENIED_SYSCALLS[platform.machine()]
+    data = sandbox_launcher.build_seccomp_filter()
+    instructions = [
+        struct.unpack("HBBI", data[offset : offset + 8])
+        for offset in range(0, len(data), 8)
+    ]
+
+    assert len(instructions) == len(syscalls) + 7
+    assert instructions[1][3] == arch
+    assert {instruction[3] for instruction in instructions[5:-2]} == set(
+        syscalls.values()
+    )
+    for index, (_, jump_true, _, _) in enumerate(instructions[5:-2], start=5):
+        target = instructions[index + 1 + jump_true]
+        assert target == (
+            sandbox_launcher.BPF_RET_K,
+            0,
+            0,
+            sandbox_launcher.SECCOMP_RET_ERRNO | 1,
+        )
+
+
+def test_find_executable_searches_sandbox_path(monkeypatch):
+    monkeypatch.setattr(
+        sandbox_launcher.os, "access", lambda path, mode: path == "/usr/bin/python3"
+    )
+
+    assert sandbox_launcher.find_executable("python3") == "/usr/bin/python3"
+    assert sandbox_launcher.find_executable("./main") == "./main"
+    with pytest.raises(FileNotFoundError):
+        sandbox_launcher.find_executable("missing")
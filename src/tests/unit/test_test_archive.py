@@ -0,0 +1,102 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+import utils.test_archive
+from core.blob_storage.local import LocalBlobStorage
+from features.tasks.crud import test as test_crud
+from features.tasks.exceptions import InvalidTestArchive
+from utils.test_archive import read_test_archive
+from utils.test_output import NormalizedOutput
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = LocalBlobStorage(tmp_path)
+    monkeypatch.setattr(utils.test_archive, "blob_storage", storage)
+    return storage
+
+
+def make_zip(files: dict[str, bytes]) -> io.BytesIO:
+    file = io.BytesIO()
+    with zipfile.ZipFile(file, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    file.seek(0)
+    return file
+
+
+def make_tar(files: dict[str, bytes]) -> io.BytesIO:
+    file = io.BytesIO()
+    with tarfile.open(fileobj=file, mode="w:gz") as archive:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    file.seek(0)
+    return file
+
+
+@pytest.mark.parametrize("make_archive", [make_zip, make_tar])
+def test_outputs_are_normalized(storage, make_archive):
+    archive = make_archive(
+        {"tests/1.in": b"1 2\n", "tests/1.out": b"3\n", "tests/2.in": b"5\n"}
+        | {"tests/2.ans": b"a b  \r\n\n", "README": b"ignored"}
+    )
+
+    tests = read_test_archive(archive, max_tests=10, max_size=1024)
+
+    assert [test.number for test in tests] == [1, 2]
+    assert storage.read(tests[0].input_blob.digest) == b"1 2\n"
+    assert storage.read(tests[0].output_blob.digest) == b"3"
+    assert storage.read(tests[1].output_blob.digest) == b"a b"
+
+
+def test_missing_outputs_are_empty_when_not_required(storage):
+    archive = make_zip({"1.in": b"1", "2.in": b"2"})
+
+    tests = read_test_archive(archive, 10, 1024, require_outputs=False)
+
+    assert [storage.read(test.output_blob.digest) for test in tests] == [b"", b""]
+
+
+@pytest.mark.parametrize(
+    "files, max_tests, max_size",
+    [
+        ({"1.in": b"1"}, 10, 1024),
+        ({"a.in": b"1", "a.out": b"1"}, 10, 1024),
+        ({"1.in": b"1", "1.out": b"1", "2.in": b"2", "2.out": b"2"}, 1, 1024),
+        ({"1.in": b"1" * 10, "1.out": b"1"}, 10, 8),
+        ({"README": b"no tests"}, 10, 1024),
+    ],
+)
+def test_invalid_archives_are_rejected(storage, files, max_tests, max_size):
+    with pytest.raises(InvalidTestArchive):
+        read_test_archive(make_zip(files), max_tests, max_size)
+
+
+def test_non_archive_is_rejected(storage):
+    with pytest.raises(InvalidTestArchive):
+        read_test_archive(io.BytesIO(b"plain text"), 10, 1024)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 1024])
+def test_normalized_output_strips_across_reads(size):
+    stream = NormalizedOutput(io.BytesIO(b"a \n\nb  \n\t\n \n"))
+
+    data = b""
+    while chunk := stream.read(size):
+        data += chunk
+
+    assert data == b"a \n\nb"
+
+
+@pytest.mark.asyncio
+async def test_per_test_output_matches_archive_output(storage, monkeypatch):
+    monkeypatch.setattr(test_crud, "blob_storage", storage)
+    archived = read_test_archive(make_zip({"1.in": b"", "1.out": b"42\n"}), 10, 1024)
+
+    assert await test_crud.put_test_output("42\n") == archived[0].output_blob
+    assert (await test_crud.put_test_payload("42\n")).size == 3
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.blob_storage.local import LocalBlobStorage
+from core.config import settings
+from features.tasks.crud import test as test_crud
+from features.tasks import models
+from features.tasks.services import test as test_service
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = LocalBlobStorage(tmp_path)
+    monkeypatch.setattr(test_crud, "blob_storage", storage)
+    return storage
+
+
+def make_test(storage, test_id: int, input_data: bytes, output: bytes, **fields):
+    input_blob, output_blob = storage.put(input_data), storage.put(output)
+    return models.Test(
+        id=test_id,
+        task_id=1,
+        is_public=fields.get("is_public", True),
+        input_hash=input_blob.digest,
+        input_size=input_blob.size,
+        output_hash=output_blob.digest,
+        output_size=output_blob.size,
+    )
+
+
+@pytest.fixture
+def tests(storage, monkeypatch):
+    tests = [
+        make_test(storage, 1, b"1 2", b"3"),
+        make_test(storage, 2, b"x" * 10_000, b"y" * 10_000),
+        make_test(storage, 3, b"secret", b"answer", is_public=False),
+    ]
+    for name in (
+        "get_task_or_404",
+        "get_module_or_404",
+        "get_space_or_404",
+        "get_account_or_404",
+    ):
+        monkeypatch.setattr(
+            test_service,
+            name,
+            AsyncMock(return_value=SimpleNamespace(module_id=1, space_id=1)),
+        )
+    monkeypatch.setattr(
+        test_crud, "get_tests_by_task_id", AsyncMock(return_value=tests)
+    )
+    return tests
+
+
+@pytest.mark.asyncio
+async def test_list_returns_public_tests_with_bounded_previews(tests):
+    reads = await test_service.get_tests_in_task(None, 1, 1)
+
+    assert [read.id for read in reads] == [1, 2]
+    assert reads[0].input_data == "1 2" and reads[0].correct_output == "3"
+    assert len(reads[1].input_data) == settings.judge.output_preview_size
+    assert len(reads[1].correct_output) == settings.judge.output_preview_size
+    assert (reads[1].input_size, reads[1].output_size) == (10_000, 10_000)
+
+
+@pytest.mark.asyncio
+async def test_single_test_returns_full_payload(tests, monkeypatch):
+    monkeypatch.setattr(
+        test_service, "get_test_or_404", AsyncMock(return_value=tests[1])
+    )
+
+    read = await test_service.get_test(None, 1, 2)
+
+    assert read.input_data == "x" * 10_000
+    assert read.output_size == 10_000
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from core.judge.verdict import Verdict
+from core.judge.verdict_cache import VerdictCache, get_verdict_key
+from shared.enums import SolutionStatusEnum
+
+KEY_ARGS = {
+    "code": "print(1)",
+    "runtime_digest": "sha256:abc",
+    "task_id": 1,
+    "tests_version": 3,
+    "time_limit": 1000,
+    "memory_limit": 64,
+    "backend": "docker",
+}
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+def test_verdict_key_is_stable():
+    assert get_verdict_key(**KEY_ARGS) == get_verdict_key(**KEY_ARGS)
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("code", "print(2)"),
+        ("runtime_digest", "sha256:def"),
+        ("task_id", 2),
+        ("tests_version", 4),
+        ("time_limit", 2000),
+        ("memory_limit", 128),
+        ("backend", "sandbox"),
+    ],
+)
+def test_verdict_key_changes_with_every_input(field, value):
+    assert get_verdict_key(**{**KEY_ARGS, field: value}) != get_verdict_key(**KEY_ARGS)
+
+
+def test_cached_verdict_round_trips():
+    cache = VerdictCache(FakeRedis(), ttl=60)
+    verdict = Verdict(SolutionStatusEnum.ACCEPTED, 0, 15, 2048)
+
+    cache.set("key", verdict)
+
+    assert cache.get("key") == verdict
+
+
+def test_time_limit_verdicts_are_not_cached():
+    cache = VerdictCache(FakeRedis(), ttl=60)
+
+    cache.set("key", Verdict(SolutionStatusEnum.TIME_LIMIT_EXCEEDED, {"a": 1}))
+
+    assert cache.get("key") is None
+
+
+def test_redis_errors_are_treated_as_misses():
+    client = MagicMock()
+    client.get.side_effect = RedisError("down")
+    client.set.side_effect = RedisError("down")
+    cache = VerdictCache(client, ttl=60)
+
+    cache.set("key", Verdict(SolutionStatusEnum.ACCEPTED, 0))
+    assert cache.get("key") is None